@@ -24,6 +24,7 @@ Version: 1.0.0
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass
@@ -36,10 +37,22 @@ class ProjectConfig:
     
     Attributes:
         download_dir (str): Default directory for audio file downloads
+        use_polling_watch (bool): Poll the download directory in watch mode
+            instead of using filesystem events (for network filesystems)
+        gmail_timeout_seconds (Optional[float]): Seed timeout of the Gmail
+            download phase (None: the orchestrator's default)
+        download_timeout_seconds (Optional[float]): Seed timeout of the
+            Google Drive download phase (None: the orchestrator's default)
+        process_timeout_seconds (Optional[float]): Seed timeout of the
+            process phase (None: the orchestrator's default)
     """
     
     # Default values
     download_dir: str = r"C:\Users\pmpmt\Scripts_Cursor\pmpmtj_personal_diary\downloads"
+    use_polling_watch: bool = False
+    gmail_timeout_seconds: Optional[float] = None
+    download_timeout_seconds: Optional[float] = None
+    process_timeout_seconds: Optional[float] = None
     
     def __post_init__(self):
         """Load settings from environment variables and .env file."""
@@ -61,6 +74,14 @@ class ProjectConfig:
             # python-dotenv not installed, continue with defaults/env vars
             pass
         
+        polling_watch = os.getenv("USE_POLLING_WATCH")
+        if polling_watch is not None:
+            self.use_polling_watch = polling_watch.strip().lower() in ("1", "true", "yes", "on")
+        
+        self.gmail_timeout_seconds = _env_seconds("PIPELINE_GMAIL_TIMEOUT", self.gmail_timeout_seconds)
+        self.download_timeout_seconds = _env_seconds("PIPELINE_DOWNLOAD_TIMEOUT", self.download_timeout_seconds)
+        self.process_timeout_seconds = _env_seconds("PIPELINE_PROCESS_TIMEOUT", self.process_timeout_seconds)
+        
         # Validate download directory
         if self.download_dir:
             download_path = Path(self.download_dir)
@@ -77,5 +98,31 @@ class ProjectConfig:
         return Path(self.download_dir).expanduser().resolve()
 
 
+def _env_seconds(name: str, default: Optional[float]) -> Optional[float]:
+    """
+    Read a positive number of seconds from an environment variable.
+    
+    Args:
+        name (str): Environment variable name
+        default (Optional[float]): Value if the variable is unset or empty
+        
+    Returns:
+        Optional[float]: Seconds from the environment, or default
+        
+    Raises:
+        ValueError: If the variable is set but not a positive number
+    """
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number of seconds, got: {value}")
+    if seconds <= 0:
+        raise ValueError(f"{name} must be positive, got: {value}")
+    return seconds
+
+
 # Global project configuration instance
 PROJ_CONFIG = ProjectConfig()
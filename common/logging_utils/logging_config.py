@@ -27,20 +27,23 @@ The module provides these main functions:
 - set_console_level(): Dynamically adjust console log levels
 - determine_log_dir(): Resolve log directory path
 - create_rotating_file_handler(): Create size-based rotating file handler
+- enable_queue_logging(): Move a logger's handler I/O to a background thread
 
 Author: [Your Name]
 Date: [Current Date]
 Version: 2.0.0
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 # Import centralized path utilities
-from ..utils.file_sys_utils import get_script_directory, get_project_root
+from ..utils.file_sys_utils import get_script_directory, get_project_root, ensure_directory, forget_directory
 
 
 # ============================================================================
@@ -220,15 +223,27 @@ def create_rotating_file_handler(
     Returns:
         logging.handlers.RotatingFileHandler: Configured rotating file handler
     """
-    # Ensure log directory exists
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    # Ensure log directory exists (cached, so loggers sharing a directory
+    # only pay for the mkdir once)
+    ensure_directory(log_path.parent)
     
-    handler = logging.handlers.RotatingFileHandler(
-        log_path,
-        maxBytes=max_bytes,
-        backupCount=backup_count,
-        encoding='utf-8'
-    )
+    try:
+        handler = logging.handlers.RotatingFileHandler(
+            log_path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+    except FileNotFoundError:
+        # Directory removed since it was cached: create it again
+        forget_directory(log_path.parent)
+        ensure_directory(log_path.parent)
+        handler = logging.handlers.RotatingFileHandler(
+            log_path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
     handler.setLevel(getattr(logging, level.upper()))
     return handler
 
@@ -355,6 +370,48 @@ def get_logger(
     return logger
 
 
+def enable_queue_logging(logger: logging.Logger) -> Optional[logging.handlers.QueueListener]:
+    """
+    Serve a logger's handlers from a background thread.
+    
+    The logger's current handlers are moved behind a QueueHandler: logging
+    calls only enqueue the record, and a QueueListener thread does the
+    formatting and console/file I/O. Handler levels are still respected,
+    and the listener is stopped (flushing queued records) at interpreter exit.
+    
+    Args:
+        logger (logging.Logger): Configured logger (e.g. from get_logger())
+        
+    Returns:
+        Optional[logging.handlers.QueueListener]: The started listener, or
+            None if the logger has no handlers or is already queued
+        
+    Example:
+        >>> logger = get_logger('gdrive_downloader')
+        >>> enable_queue_logging(logger)
+        >>> logger.info('Written by the listener thread')
+        
+    Note:
+        set_console_level() keeps working on queued loggers.
+    """
+    handlers = tuple(logger.handlers)
+    if not handlers or any(isinstance(handler, logging.handlers.QueueHandler) for handler in handlers):
+        return None
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.listener = listener
+    
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 def set_console_level(logger: logging.Logger, level: str) -> None:
     """
     Update the console handler's log level for an existing logger.
@@ -383,10 +440,19 @@ def set_console_level(logger: logging.Logger, level: str) -> None:
         - Only affects console handlers, file handlers remain unchanged
         - Level names are case-insensitive
         - If no console handler is found, no error is raised
+        - Handlers moved behind a queue by enable_queue_logging() are included
         - This is typically used with command-line --debug flags
     """
     log_level = getattr(logging, level.upper())
+    handlers = []
     for handler in logger.handlers:
+        listener = getattr(handler, 'listener', None)
+        if isinstance(handler, logging.handlers.QueueHandler) and listener is not None:
+            handlers.extend(listener.handlers)
+        else:
+            handlers.append(handler)
+    
+    for handler in handlers:
         if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
             handler.setLevel(log_level)
             break
@@ -7,9 +7,15 @@ It includes path handling, file system operations, and other common utilities.
 Available Functions:
 - resolve_path(): Resolve relative and absolute paths with base directory support
 - ensure_directory(): Create directories and parent directories as needed
+- forget_directory(): Drop a removed directory from the ensure_directory() cache
 - get_script_directory(): Get script directory for both regular and frozen execution
 - sanitize_filename(): Sanitize filenames for filesystem safety
 
+Available Classes:
+- RetryExecutor: Bounded retry with exponential backoff and full jitter
+- CircuitBreaker: Per-service circuit breaker (closed / open / half-open)
+- PhaseStats: Per-item outcome (success/total/failed) of a subsystem run
+
 Key Features:
 - Cross-platform compatibility (Windows, macOS, Linux)
 - PyInstaller frozen application support
@@ -37,15 +43,27 @@ Version: 1.0.0
 from .file_sys_utils import (
     resolve_path,
     ensure_directory,
+    forget_directory,
     get_script_directory,
     get_project_root,
     sanitize_filename,
 )
+from .phase_stats import PhaseStats
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryExecutor,
+)
 
 __all__ = [
     "resolve_path",
     "ensure_directory",
+    "forget_directory",
     "get_script_directory",
     "get_project_root",
     "sanitize_filename",
+    "PhaseStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryExecutor",
 ]
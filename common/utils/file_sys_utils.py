@@ -25,12 +25,35 @@ Version: 1.0.0
 """
 
 import os
+import re
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional
 
 
-def resolve_path(path_input: Union[str, Path], base_dir: Optional[Path] = None) -> Path:
+# Filename-unsafe characters (< > : " / \ | ? *), replaced by sanitize_filename.
+# A precompiled character class beats str.translate on typical short filenames,
+# especially clean or non-ASCII ones where translate falls off its fast path.
+_UNSAFE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Longest suffix sanitize_filename keeps as an extension when truncating;
+# anything after a dot that is longer is just part of the name
+_MAX_EXTENSION_LENGTH = 16
+
+# Absolute paths already created/verified by ensure_directory in this process.
+# Entries are not re-checked; callers drop them with forget_directory() when a
+# write shows the directory was removed (long-running watch mode)
+_ENSURED_DIRS: set = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
+
+
+def resolve_path(
+    path_input: Union[str, Path],
+    base_dir: Optional[Path] = None,
+    strict: bool = False
+) -> Path:
     """
     Resolve a path, handling both relative and absolute paths.
     
@@ -40,14 +63,19 @@ def resolve_path(path_input: Union[str, Path], base_dir: Optional[Path] = None)
     
     The resolution process:
     1. Uses script directory as base if no base_dir provided
-    2. Converts string inputs to Path objects
-    3. Returns absolute paths as-is (resolved)
-    4. Resolves relative paths against the base directory
+    2. Returns absolute paths normalized
+    3. Joins relative paths onto the base directory and normalizes them
+    4. Canonicalizes the result (follows symlinks) only when strict=True
+    
+    Normalization is purely lexical (os.path.normpath), which avoids the
+    realpath/stat walk of Path.resolve(). Pass strict=True when the caller
+    needs symlinks resolved.
     
     Args:
         path_input (Union[str, Path]): Input path as string or Path object
         base_dir (Optional[Path]): Base directory for relative paths.
                                  Defaults to script directory if None
+        strict (bool): Resolve symlinks via Path.resolve(). Default: False
         
     Returns:
         Path: Resolved Path object (always absolute)
@@ -63,42 +91,59 @@ def resolve_path(path_input: Union[str, Path], base_dir: Optional[Path] = None)
         PosixPath('/absolute/path/file.txt')
     """
     try:
-        if base_dir is None:
-            base_dir = get_script_directory()
-        
-        # Convert to Path object if needed
-        if isinstance(path_input, str):
-            path_input = Path(path_input)
+        path_str = os.fspath(path_input)
         
         # Validate input
-        if not path_input:
+        if not path_str:
             raise ValueError("Path input cannot be empty")
         
-        # Handle absolute paths
-        if path_input.is_absolute():
-            return path_input.resolve()
+        base_str = os.fspath(base_dir) if base_dir is not None else None
+        resolved = Path(_resolve_str(path_str, base_str))
         
-        # Handle relative paths
-        resolved_path = (base_dir / path_input).resolve()
+        if strict:
+            return resolved.resolve()
         
-        return resolved_path
+        return resolved
     except Exception as e:
         raise OSError(f"Failed to resolve path '{path_input}': {e}")
 
 
+def _resolve_str(path: str, base: Optional[str] = None) -> str:
+    """
+    String-only core of resolve_path: make path absolute and normalize it.
+    
+    Args:
+        path (str): Non-empty input path
+        base (Optional[str]): Base directory for relative paths.
+                              Defaults to script directory if None
+        
+    Returns:
+        str: Absolute, lexically normalized path
+    """
+    if os.path.isabs(path):
+        # Handle absolute paths
+        return os.path.normpath(path)
+    
+    # Handle relative paths (abspath also covers a relative base)
+    if base is None:
+        base = os.fspath(get_script_directory())
+    return os.path.abspath(os.path.join(base, path))
+
+
 def ensure_directory(directory_path: Union[str, Path]) -> Path:
     """
     Ensure a directory exists, creating it if necessary.
     
     This function creates a directory and all necessary parent directories
     if they don't exist. It's safe to call multiple times and won't raise
-    an error if the directory already exists.
+    an error if the directory already exists. Directories ensured once are
+    remembered for the rest of the process, so repeat calls do no I/O.
     
     The creation process:
-    1. Converts input to Path object
-    2. Checks if directory already exists
-    3. Creates directory with all parent directories if needed
-    4. Returns the Path object pointing to the directory
+    1. Works on the string form of the path internally
+    2. Creates directory with all parent directories if needed
+       (no-op if it already exists)
+    3. Returns a Path object pointing to the directory
     
     Args:
         directory_path (Union[str, Path]): Path to the directory to ensure
@@ -118,20 +163,96 @@ def ensure_directory(directory_path: Union[str, Path]) -> Path:
         PosixPath('/existing/directory')
     """
     try:
-        directory_path = Path(directory_path)
+        path_str = os.fspath(directory_path)
         
         # Validate input
-        if not str(directory_path).strip():
+        if not path_str.strip():
             raise ValueError("Directory path cannot be empty")
         
-        if not directory_path.exists():
-            directory_path.mkdir(parents=True, exist_ok=True)
+        _ensure_directory_str(path_str)
         
-        return directory_path
+        # Hand Path inputs back as-is rather than re-parsing them
+        if isinstance(directory_path, Path):
+            return directory_path
+        return Path(directory_path)
     except Exception as e:
         raise OSError(f"Failed to ensure directory '{directory_path}': {e}")
 
 
+def _ensure_directory_str(path: str) -> str:
+    """
+    String-only core of ensure_directory.
+    
+    Args:
+        path (str): Directory path to ensure
+        
+    Returns:
+        str: Absolute path of the ensured directory
+    """
+    # Skip the syscall for directories already ensured in this process
+    key = os.path.abspath(path)
+    if key in _ENSURED_DIRS:
+        return key
+    
+    _mkdir_leaf_first(key)
+    
+    with _ENSURED_DIRS_LOCK:
+        _ENSURED_DIRS.add(key)
+    
+    return key
+
+
+def forget_directory(directory_path: Union[str, Path]) -> None:
+    """
+    Drop a directory from the ensure_directory() cache.
+    
+    Call this when creating a file in an ensured directory fails with
+    FileNotFoundError (the directory was removed since it was ensured), so
+    the next ensure_directory() call creates it again.
+    
+    Args:
+        directory_path (Union[str, Path]): Directory passed to ensure_directory()
+        
+    Example:
+        >>> try:
+        ...     handle = open(log_dir / "run.log", "a")
+        ... except FileNotFoundError:
+        ...     forget_directory(log_dir)
+        ...     ensure_directory(log_dir)
+        ...     handle = open(log_dir / "run.log", "a")
+    """
+    with _ENSURED_DIRS_LOCK:
+        _ENSURED_DIRS.discard(os.path.abspath(os.fspath(directory_path)))
+
+
+def _mkdir_leaf_first(path: str) -> None:
+    """
+    Create a directory and any missing parents, trying the leaf first.
+    
+    In the common case where the parent already exists this costs a single
+    mkdir syscall. Missing parents are only created on ENOENT, walking up
+    until an existing ancestor is found. An existing directory is not an error.
+    
+    Args:
+        path (str): Absolute directory path to create
+        
+    Raises:
+        FileExistsError: If path exists but is not a directory
+        OSError: If the directory cannot be created
+    """
+    try:
+        os.mkdir(path)
+    except FileNotFoundError:
+        parent = os.path.dirname(path)
+        if parent == path:
+            raise
+        _mkdir_leaf_first(parent)
+        _mkdir_leaf_first(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+
+
 def get_project_root() -> Path:
     """
     Get the project root directory (piped-dl-transcribe-ingest-audio-txt level).
@@ -164,6 +285,7 @@ def get_project_root() -> Path:
         raise OSError(f"Failed to determine project root directory: {e}")
 
 
+@lru_cache(maxsize=1)
 def get_script_directory() -> Path:
     """
     Get the project root directory for consistent base path resolution.
@@ -172,6 +294,9 @@ def get_script_directory() -> Path:
     use the same base directory for resolving relative paths. This provides
     consistent behavior across different deployment scenarios.
     
+    The directory cannot change during the process lifetime, so the result
+    is computed once and cached.
+    
     Returns:
         Path: Path object pointing to the project root directory
         
@@ -201,7 +326,8 @@ def sanitize_filename(filename: str) -> str:
     1. Replaces unsafe characters (< > : " / \\ | ? *) with underscores
     2. Removes leading/trailing whitespace and dots
     3. Ensures filename is not empty (uses 'unnamed_file' if empty)
-    4. Limits filename length to 255 characters (preserving extension)
+    4. Limits filename length to 255 characters (preserving an extension of
+       up to _MAX_EXTENSION_LENGTH characters)
     
     Args:
         filename (str): Original filename to sanitize
@@ -232,30 +358,28 @@ def sanitize_filename(filename: str) -> str:
         if not isinstance(filename, str):
             raise ValueError(f"Filename must be a string, got {type(filename).__name__}")
         
-        # Define unsafe characters
-        unsafe_chars = r'<>:"/\\|?*'
-        
         # Replace unsafe characters with underscores
-        sanitized = filename
-        for char in unsafe_chars:
-            sanitized = sanitized.replace(char, '_')
+        sanitized = _UNSAFE_RE.sub('_', filename)
         
-        # Remove leading/trailing whitespace and dots
-        sanitized = sanitized.strip(' .')
+        # Remove leading/trailing whitespace and dots (only if either end has one)
+        if sanitized and (sanitized[0] in ' .' or sanitized[-1] in ' .'):
+            sanitized = sanitized.strip(' .')
         
         # Ensure filename is not empty
         if not sanitized:
-            sanitized = 'unnamed_file'
-        
-        # Limit filename length (keep extension)
-        if len(sanitized) > 255:
-            name, ext = os.path.splitext(sanitized)
-            if ext:
-                max_name_length = 255 - len(ext)
-                sanitized = name[:max_name_length] + ext
-            else:
-                sanitized = sanitized[:255]
-        
-        return sanitized
+            return 'unnamed_file'
+        
+        # Common case: already within the length limit
+        if len(sanitized) <= 255:
+            return sanitized
+        
+        # Limit filename length (keep a short extension). No path separators
+        # or leading dots remain at this point, so rfind('.') matches splitext.
+        dot = sanitized.rfind('.')
+        if dot > 0 and len(sanitized) - dot <= _MAX_EXTENSION_LENGTH:
+            ext = sanitized[dot:]
+            return sanitized[:255 - len(ext)] + ext
+        
+        return sanitized[:255]
     except Exception as e:
         raise ValueError(f"Failed to sanitize filename '{filename}': {e}")
@@ -0,0 +1,58 @@
+"""
+Phase Statistics Module
+
+This module provides PhaseStats, the per-item outcome that each pipeline
+subsystem (Google Drive download, Gmail download, transcription) returns to
+its caller. It lets the pipeline orchestrator report real success/total
+counts and see exactly which items failed.
+
+Author: [Your Name]
+Date: [Current Date]
+Version: 1.0.0
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    """
+    Outcome of one subsystem run.
+    
+    Attributes:
+        success (int): Items handled successfully
+        total (int): Items attempted
+        failed (list[str]): Identifiers (file names, paths, message IDs) of failed items
+        error (str | None): Error that stopped the run before or while
+                            handling items (configuration, authentication, ...)
+    
+    Example:
+        >>> stats = PhaseStats()
+        >>> stats.record("001_abc/note.mp3", ok=False)
+        >>> stats.ok
+        False
+    """
+    
+    success: int = 0
+    total: int = 0
+    failed: list[str] = field(default_factory=list)
+    error: str | None = None
+    
+    @property
+    def ok(self) -> bool:
+        """True if the run was not stopped by an error and no item failed."""
+        return self.error is None and not self.failed
+    
+    def record(self, item: str, ok: bool) -> None:
+        """
+        Count one attempted item.
+        
+        Args:
+            item (str): Identifier of the item, kept if it failed
+            ok (bool): True if the item was handled successfully
+        """
+        self.total += 1
+        if ok:
+            self.success += 1
+        else:
+            self.failed.append(item)
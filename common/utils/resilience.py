@@ -0,0 +1,228 @@
+"""
+Resilience Utilities Module
+
+This module provides retry and circuit-breaker helpers for calls into external
+services (Gmail API, Google Drive API) made by the pipeline.
+
+- RetryExecutor retries a call a bounded number of times with exponential
+  backoff and full jitter: before retry n it sleeps a random time between 0
+  and min(cap, base * 2**n), so many clients failing together do not retry
+  in lockstep.
+- CircuitBreaker counts consecutive failures per service. After
+  failure_threshold failures it opens and rejects calls for timeout_duration
+  seconds, then lets trial calls through (half-open) and closes again after
+  success_threshold successes. A sustained outage therefore fails fast
+  instead of being retried over and over.
+
+Author: [Your Name]
+Date: [Current Date]
+Version: 1.0.0
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple, Type
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one external service.
+
+    Attributes:
+        name (str): Service name, used in log and error messages
+        failure_threshold (int): Consecutive failures that open the circuit
+        timeout_duration (float): Seconds the circuit stays open
+        success_threshold (int): Half-open successes needed to close the circuit
+
+    Example:
+        >>> breaker = CircuitBreaker("gmail")
+        >>> if breaker.can_execute():
+        ...     ok = call_gmail()
+        ...     breaker.record_outcome(ok)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        timeout_duration: float = 30.0,
+        success_threshold: int = 2
+    ):
+        """
+        Initialize the breaker, closed.
+
+        Args:
+            name (str): Service name, used in log and error messages
+            failure_threshold (int): Consecutive failures that open the circuit. Default: 5
+            timeout_duration (float): Seconds the circuit stays open. Default: 30.0
+            success_threshold (int): Half-open successes needed to close the circuit. Default: 2
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.timeout_duration = timeout_duration
+        self.success_threshold = success_threshold
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state: CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def can_execute(self) -> bool:
+        """
+        Check whether a call may be made now.
+
+        Returns:
+            bool: False while the circuit is open, True otherwise
+        """
+        return self.state != self.OPEN
+
+    def record_outcome(self, ok: bool) -> None:
+        """
+        Record the outcome of a call and update the state.
+
+        Args:
+            ok (bool): True if the call succeeded
+        """
+        with self._lock:
+            self._update_state()
+            if ok:
+                self._failures = 0
+                if self._state == self.HALF_OPEN:
+                    self._successes += 1
+                    if self._successes >= self.success_threshold:
+                        self._state = self.CLOSED
+                return
+
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._successes = 0
+
+    def _update_state(self) -> None:
+        """Move from OPEN to HALF_OPEN once the timeout has passed (lock held)."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.timeout_duration:
+            self._state = self.HALF_OPEN
+            self._successes = 0
+
+
+class RetryExecutor:
+    """
+    Bounded retry with exponential backoff and full jitter.
+
+    Attributes:
+        max_attempts (int): Total number of attempts, including the first
+        base (float): Backoff base in seconds
+        cap (float): Maximum backoff in seconds
+
+    Example:
+        >>> retry = RetryExecutor(max_attempts=3)
+        >>> messages = retry.execute(fetch_messages, retryable=(HttpError,), breaker=gmail_breaker)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base: float = 0.5,
+        cap: float = 30.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_attempts (int): Total number of attempts, including the first. Default: 5
+            base (float): Backoff base in seconds. Default: 0.5
+            cap (float): Maximum backoff in seconds. Default: 30.0
+            logger (Optional[logging.Logger]): Logger for retry messages
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base = base
+        self.cap = cap
+        self.logger = logger or logging.getLogger(__name__)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter delay before the retry following a failed attempt.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that failed
+
+        Returns:
+            float: Seconds to sleep
+        """
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+    def execute(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        retryable: Tuple[Type[BaseException], ...] = (Exception,),
+        breaker: Optional[CircuitBreaker] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Call func(*args, **kwargs), retrying on retryable exceptions.
+
+        Every attempt is checked against and recorded in the breaker, if one
+        is given. Exceptions that are not retryable are recorded as failures
+        and raised at once.
+
+        Args:
+            func (Callable[..., Any]): Function to call
+            *args (Any): Positional arguments for func
+            retryable (Tuple[Type[BaseException], ...]): Exception types worth retrying
+            breaker (Optional[CircuitBreaker]): Circuit breaker of the called service
+            **kwargs (Any): Keyword arguments for func
+
+        Returns:
+            Any: Return value of func
+
+        Raises:
+            CircuitOpenError: If the breaker is open before an attempt
+            Exception: The last error once attempts are exhausted, or any
+                       non-retryable error
+        """
+        for attempt in range(self.max_attempts):
+            if breaker is not None and not breaker.can_execute():
+                raise CircuitOpenError(f"Circuit breaker for {breaker.name} is open, not calling")
+
+            try:
+                result = func(*args, **kwargs)
+            except retryable as e:
+                if breaker is not None:
+                    breaker.record_outcome(False)
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = self.backoff(attempt)
+                self.logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_attempts} failed ({e}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                continue
+            except Exception:
+                if breaker is not None:
+                    breaker.record_outcome(False)
+                raise
+
+            if breaker is not None:
+                breaker.record_outcome(True)
+            return result
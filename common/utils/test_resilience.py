@@ -0,0 +1,96 @@
+"""
+Unit tests for the circuit breaker.
+
+These tests walk a breaker through its states with a fake clock:
+closed -> open after consecutive failures, open -> half-open after the
+timeout, half-open -> closed after enough successes, and back to open
+on a half-open failure.
+"""
+
+import pytest
+
+from . import resilience
+from .resilience import CircuitBreaker, CircuitOpenError, RetryExecutor
+
+
+class _Clock:
+    """Stands in for the time module; advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(resilience, "time", fake)
+    return fake
+
+
+def _breaker():
+    return CircuitBreaker("test", failure_threshold=3, timeout_duration=30.0, success_threshold=2)
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = _breaker()
+    breaker.record_outcome(False)
+    breaker.record_outcome(False)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_outcome(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.can_execute()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = _breaker()
+    breaker.record_outcome(False)
+    breaker.record_outcome(False)
+    breaker.record_outcome(True)
+    breaker.record_outcome(False)
+    breaker.record_outcome(False)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_after_timeout_then_closes(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_outcome(False)
+
+    clock.now += 29.9
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 0.1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.can_execute()
+
+    breaker.record_outcome(True)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_outcome(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_failure_reopens(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_outcome(False)
+    clock.now += 30.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.record_outcome(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 29.0
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_retry_executor_does_not_call_through_open_breaker(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_outcome(False)
+    calls = []
+
+    with pytest.raises(CircuitOpenError):
+        RetryExecutor(max_attempts=3).execute(lambda: calls.append(1), breaker=breaker)
+    assert calls == []
@@ -27,15 +27,20 @@ from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from google.auth.exceptions import RefreshError
+
+from common.utils.phase_stats import PhaseStats
 from dl_emails_gmail.config.dl_gmail_config import CONFIG
 from .gmail_client import (
     build_gmail_service, 
     list_messages, 
     get_message, 
+    get_messages_batch,
     get_message_headers,
     apply_label_to_message,
     apply_and_remove_labels,
-    download_attachment
+    download_attachment,
+    invalidate_service_cache
 )
 from .gmail_logging import logger, info, debug, error, warning
 from .models import MessageData, AttachmentData
@@ -315,7 +320,7 @@ def create_message_data(message: Dict[str, Any], message_id: str, gmail_service=
     return msg_data
 
 
-def process_gmail_messages() -> List[MessageData]:
+def process_gmail_messages(failed_ids: Optional[List[str]] = None) -> List[MessageData]:
     """
     Process Gmail messages and return structured data.
     
@@ -325,6 +330,10 @@ def process_gmail_messages() -> List[MessageData]:
     3. Applies "Processed" label to successfully processed messages
     4. Returns a list of MessageData objects
     
+    Args:
+        failed_ids (Optional[List[str]]): If given, the IDs of messages that
+                                          could not be processed are appended to it
+    
     Returns:
         List[MessageData]: List of structured message data
         
@@ -357,14 +366,22 @@ def process_gmail_messages() -> List[MessageData]:
         
         info(f"Found {len(messages)} messages")
         
+        # Fetch full message details up front in batched round trips; if that
+        # fails, every message falls back to a single fetch below
+        try:
+            prefetched = get_messages_batch(service, [msg['id'] for msg in messages])
+        except Exception as e:
+            warning(f"Batched message fetch failed, fetching messages one by one: {e}")
+            prefetched = {}
+        
         # Process each message in reverse order (newest last)
         for i, msg in enumerate(reversed(messages), 1):
             message_id = msg['id']
             debug(f"Processing message {i}/{len(messages)}: {message_id}")
             
             try:
-                # Fetch full message details
-                message = get_message(service, message_id)
+                # Use the prefetched message, falling back to a single fetch
+                message = prefetched.get(message_id) or get_message(service, message_id)
                 
                 # Create structured data (with Gmail service for attachment downloads)
                 msg_data = create_message_data(message, message_id, service)
@@ -405,6 +422,8 @@ def process_gmail_messages() -> List[MessageData]:
                 
             except Exception as e:
                 error(f"Failed to process message {message_id}: {e}")
+                if failed_ids is not None:
+                    failed_ids.append(message_id)
                 # Continue processing other messages
                 continue
         
@@ -420,6 +439,52 @@ def process_gmail_messages() -> List[MessageData]:
     return processed_messages
 
 
+def download_messages() -> PhaseStats:
+    """
+    Process Gmail messages and report per-message outcomes.
+    
+    This is the entry point used by the pipeline orchestrator. A message
+    counts as successful once it has been processed and saved to the
+    database; messages that failed either step are listed by ID.
+    
+    If the cached service's credentials can no longer be refreshed (e.g.
+    the token was revoked), the service cache is dropped and the run is
+    repeated once with a freshly built service.
+    
+    Returns:
+        PhaseStats: Messages saved and attempted, with the IDs of failed messages
+        
+    Raises:
+        Exception: Any error that process_gmail_messages() raises
+    """
+    failed_ids: List[str] = []
+    try:
+        messages = process_gmail_messages(failed_ids=failed_ids)
+    except RefreshError as e:
+        warning(f"Gmail credentials could not be refreshed, rebuilding the service: {e}")
+        invalidate_service_cache()
+        failed_ids.clear()
+        messages = process_gmail_messages(failed_ids=failed_ids)
+    return _phase_stats(messages, failed_ids)
+
+
+def _phase_stats(messages: List[MessageData], failed_ids: List[str]) -> PhaseStats:
+    """
+    Build PhaseStats from processed messages and the IDs of failed ones.
+    
+    Args:
+        messages (List[MessageData]): Messages returned by process_gmail_messages()
+        failed_ids (List[str]): IDs of messages that could not be processed
+        
+    Returns:
+        PhaseStats: Per-message outcome of the run
+    """
+    stats = PhaseStats(total=len(failed_ids), failed=list(failed_ids))
+    for msg in messages:
+        stats.record(msg.message_id, msg.saved_to_db)
+    return stats
+
+
 def get_processed_messages_summary(messages: List[MessageData]) -> Dict[str, Any]:
     """
     Generate a summary of processed messages.
@@ -460,20 +525,25 @@ def get_processed_messages_summary(messages: List[MessageData]) -> Dict[str, Any
 
 
 # Main execution function for testing
-def main():
+def main() -> PhaseStats:
     """
     Main function for testing the dl_gmail module.
     
     This function demonstrates how to use the module and prints
     structured data for the first few messages.
+    
+    Returns:
+        PhaseStats: Per-message outcome of the run
     """
     try:
         # Process messages
-        messages = process_gmail_messages()
+        failed_ids: List[str] = []
+        messages = process_gmail_messages(failed_ids=failed_ids)
+        stats = _phase_stats(messages, failed_ids)
         
         if not messages:
             print("No messages were processed.")
-            return
+            return stats
         
         # Print summary
         summary = get_processed_messages_summary(messages)
@@ -517,6 +587,8 @@ def main():
         if len(messages) > 3:
             print(f"\n... and {len(messages) - 3} more messages")
         
+        return stats
+        
     except Exception as e:
         error(f"Error in main execution: {e}")
         raise
@@ -22,17 +22,21 @@ Usage:
 
 import json
 import os
+import random
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import os
 import base64
-import re
 from pathlib import Path
 from datetime import datetime
 
@@ -48,8 +52,63 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Socket timeout (seconds) for the shared HTTP transport used by the service
+HTTP_TIMEOUT = 30
 
+# HTTP statuses worth retrying (rate limiting and transient server errors)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound (seconds) for a single backoff sleep
+MAX_BACKOFF_SECONDS = 32
+
+# Maximum sub-requests per Gmail batch call (Google recommends <= 50)
+GMAIL_BATCH_SIZE = 50
+
+# Translation table for sanitize_filename: characters invalid in filenames
+# Windows: < > : " | ? * \
+# Unix: / (and null bytes)
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"|?*\\/\x00'})
+
+# Gmail system labels: their name doubles as their ID and they cannot be created
+_SYSTEM_LABELS = frozenset({
+    'INBOX', 'SPAM', 'TRASH', 'UNREAD', 'STARRED',
+    'IMPORTANT', 'SENT', 'DRAFT', 'CHAT'
+})
+
+
+@lru_cache(maxsize=1)
 def build_gmail_service() -> Any:
+    """
+    Return the process-wide authenticated Gmail API service.
+    
+    The service is built once and memoized, so repeated calls do not re-read
+    the token file or rebuild the API client. Call invalidate_service_cache()
+    if the cached credentials stop working (e.g. token revoked) to force a
+    fresh build on the next call.
+    
+    Returns:
+        googleapiclient.discovery.Resource: Authenticated Gmail API service
+        
+    Example:
+        >>> service = build_gmail_service()
+        >>> service is build_gmail_service()
+        True
+    """
+    return _build_gmail_service_uncached()
+
+
+def invalidate_service_cache() -> None:
+    """
+    Drop the memoized Gmail API service.
+    
+    The next call to build_gmail_service() will reload credentials from disk
+    (refreshing or re-running the OAuth2 flow if needed) and rebuild the service.
+    """
+    logger.debug("Invalidating cached Gmail API service")
+    build_gmail_service.cache_clear()
+
+
+def _build_gmail_service_uncached() -> Any:
     """
     Build and return an authenticated Gmail API service.
     
@@ -123,21 +182,96 @@ def build_gmail_service() -> Any:
                 raise Exception(f"OAuth2 authentication failed: {e}")
         
         # Save the credentials for the next run
-        logger.debug(f"Saving credentials to: {token_path}")
-        token_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_path, 'w') as token:
-            token.write(creds.to_json())
-        logger.debug("Credentials saved successfully")
+        _save_token(token_path, creds.to_json())
     
     # Build the Gmail service
     try:
-        service = build('gmail', 'v1', credentials=creds)
+        # A single authorized httplib2.Http keeps the HTTPS connection to
+        # gmail.googleapis.com open across calls instead of re-handshaking.
+        # The service holds a reference to it, so it lives as long as the service.
+        # httplib2.Http is not thread-safe: threads must build their own service.
+        authed_http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        
+        # static_discovery uses the discovery document bundled with the
+        # client library instead of fetching it over the network
+        service = build(
+            'gmail', 'v1',
+            http=authed_http,
+            cache_discovery=False,
+            static_discovery=True
+        )
         logger.info("Gmail API service built successfully")
         return service
     except Exception as e:
         raise Exception(f"Failed to build Gmail service: {e}")
 
 
+def _save_token(token_path: Path, token_json: str) -> None:
+    """
+    Persist OAuth2 credentials JSON, skipping the write if nothing changed.
+    
+    The file is written to a temporary sibling and moved into place with
+    os.replace, so a crash mid-write never leaves a truncated token file.
+    
+    Args:
+        token_path (Path): Destination token file
+        token_json (str): Serialized credentials (Credentials.to_json())
+    """
+    try:
+        if token_path.read_text() == token_json:
+            logger.debug("Token unchanged, not rewriting token file")
+            return
+    except FileNotFoundError:
+        pass
+    
+    logger.debug(f"Saving credentials to: {token_path}")
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = token_path.with_suffix('.tmp')
+    tmp_path.write_text(token_json)
+    os.replace(tmp_path, token_path)
+    logger.debug("Credentials saved successfully")
+
+
+def _execute_with_retry(request: Any, max_attempts: int = 5) -> Any:
+    """
+    Execute a Gmail API request, retrying on rate limits and transient errors.
+    
+    Retries HttpError responses whose status is in RETRYABLE_STATUSES using
+    capped exponential backoff with jitter. A Retry-After header sent by the
+    server takes precedence over the computed delay. Any other error, or the
+    last failed attempt, is re-raised to the caller.
+    
+    Args:
+        request: Unexecuted googleapiclient HttpRequest
+        max_attempts (int): Maximum number of attempts (default: 5)
+        
+    Returns:
+        Any: The decoded API response
+        
+    Raises:
+        HttpError: If the request fails with a non-retryable status or all
+                   attempts are exhausted
+    """
+    for attempt in range(max_attempts):
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = e.resp.status
+            if status not in RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                raise
+            
+            delay = min(2 ** attempt + random.random(), MAX_BACKOFF_SECONDS)
+            retry_after = e.resp.get('retry-after')
+            if retry_after and retry_after.isdigit():
+                delay = min(int(retry_after), MAX_BACKOFF_SECONDS)
+            
+            logger.warning(
+                f"Gmail API returned {status}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_attempts})"
+            )
+            time.sleep(delay)
+
+
 def list_messages(service: Any, query: str, max_results: int = 1) -> List[Dict[str, Any]]:
     """
     List messages matching the given query.
@@ -163,11 +297,11 @@ def list_messages(service: Any, query: str, max_results: int = 1) -> List[Dict[s
     
     try:
         # Call the Gmail API
-        results = service.users().messages().list(
+        results = _execute_with_retry(service.users().messages().list(
             userId='me',
             q=query,
             maxResults=max_results
-        ).execute()
+        ))
         
         messages = results.get('messages', [])
         logger.info(f"Found {len(messages)} messages")
@@ -210,11 +344,11 @@ def get_message(service: Any, message_id: str, format: str = "full") -> Dict[str
     
     try:
         # Call the Gmail API
-        message = service.users().messages().get(
+        message = _execute_with_retry(service.users().messages().get(
             userId='me',
             id=message_id,
             format=format
-        ).execute()
+        ))
         
         logger.debug(f"Message retrieved successfully: {message_id}")
         return message
@@ -227,6 +361,101 @@ def get_message(service: Any, message_id: str, format: str = "full") -> Dict[str
         raise
 
 
+def get_messages_batch(service: Any, message_ids: List[str], format: str = "full") -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieve many messages using Gmail batch requests.
+    
+    Messages are fetched in batches of GMAIL_BATCH_SIZE, so N messages cost
+    ceil(N / GMAIL_BATCH_SIZE) HTTP round trips instead of N. Messages whose
+    sub-request fails are logged and left out of the result; callers can
+    fall back to get_message() for them.
+    
+    Args:
+        service: Authenticated Gmail API service
+        message_ids (List[str]): IDs of the messages to retrieve
+        format (str): Message format - 'full', 'metadata', 'minimal', 'raw' (default: 'full')
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Message data keyed by message ID
+        
+    Raises:
+        HttpError: If a whole batch request fails after retries
+        
+    Example:
+        >>> messages = get_messages_batch(service, ["msg123", "msg456"])
+        >>> print(f"Retrieved {len(messages)} messages")
+    """
+    logger.info(f"Retrieving {len(message_ids)} messages in batches (format: {format})")
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    
+    def _on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+        if exception is not None:
+            logger.warning(f"Batch retrieval failed for message {request_id}: {exception}")
+            return
+        results[request_id] = response
+    
+    for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_response)
+        for message_id in message_ids[start:start + GMAIL_BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(userId='me', id=message_id, format=format),
+                request_id=message_id
+            )
+        _execute_with_retry(batch)
+    
+    logger.debug(f"Batch retrieval returned {len(results)}/{len(message_ids)} messages")
+    return results
+
+
+def get_message_metadata(
+    service: Any,
+    message_id: str,
+    headers: tuple = ('From', 'Subject', 'Date', 'Message-ID')
+) -> Dict[str, Any]:
+    """
+    Get a message's headers and metadata without its body or attachments.
+    
+    Uses format='metadata' with a metadataHeaders filter, so the response only
+    carries the requested headers plus id, threadId, labelIds, snippet,
+    internalDate and sizeEstimate. Prefer this over get_message() when the
+    body is not needed.
+    
+    Args:
+        service: Authenticated Gmail API service
+        message_id (str): The ID of the message to retrieve
+        headers (tuple): Header names to include in the response
+                         (default: From, Subject, Date, Message-ID)
+        
+    Returns:
+        Dict[str, Any]: Message metadata; headers are under payload.headers
+        
+    Raises:
+        HttpError: If the Gmail API request fails
+        Exception: If there's an unexpected error
+        
+    Example:
+        >>> message = get_message_metadata(service, "message_id_123")
+        >>> print(get_message_headers(message).get('subject'))
+    """
+    logger.debug(f"Retrieving metadata for message {message_id}")
+    
+    try:
+        return _execute_with_retry(service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='metadata',
+            metadataHeaders=list(headers)
+        ))
+        
+    except HttpError as error:
+        logger.error(f"Gmail API error retrieving metadata for message {message_id}: {error}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error retrieving metadata for message {message_id}: {e}")
+        raise
+
+
 def get_message_headers(message: Dict[str, Any]) -> Dict[str, str]:
     """
     Extract headers from a Gmail message in a convenient dictionary format.
@@ -278,11 +507,11 @@ def apply_label_to_message(service: Any, message_id: str, label_name: str) -> bo
             return False
         
         # Apply the label to the message
-        service.users().messages().modify(
+        _execute_with_retry(service.users().messages().modify(
             userId='me',
             id=message_id,
             body={'addLabelIds': [label_id]}
-        ).execute()
+        ))
         
         logger.debug(f"Successfully applied label '{label_name}' to message {message_id}")
         return True
@@ -320,11 +549,11 @@ def remove_label_from_message(service: Any, message_id: str, label_name: str) ->
             return False
         
         # Remove the label from the message
-        service.users().messages().modify(
+        _execute_with_retry(service.users().messages().modify(
             userId='me',
             id=message_id,
             body={'removeLabelIds': [label_id]}
-        ).execute()
+        ))
         
         logger.debug(f"Successfully removed label '{label_name}' from message {message_id}")
         return True
@@ -388,11 +617,11 @@ def apply_and_remove_labels(service: Any, message_id: str, add_labels: List[str]
             return True
         
         # Apply the changes
-        service.users().messages().modify(
+        _execute_with_retry(service.users().messages().modify(
             userId='me',
             id=message_id,
             body=modify_body
-        ).execute()
+        ))
         
         logger.debug(f"Successfully updated labels for message {message_id}: add={add_labels}, remove={remove_labels}")
         return True
@@ -421,8 +650,11 @@ def get_label_id(service: Any, label_name: str) -> Optional[str]:
         >>> if label_id:
         ...     print(f"INBOX label ID: {label_id}")
     """
+    if label_name in _SYSTEM_LABELS:
+        return label_name
+    
     try:
-        labels_result = service.users().labels().list(userId='me').execute()
+        labels_result = _execute_with_retry(service.users().labels().list(userId='me'))
         labels = labels_result.get('labels', [])
         
         for label in labels:
@@ -455,9 +687,13 @@ def get_or_create_label(service: Any, label_name: str) -> Optional[str]:
         >>> if label_id:
         ...     print(f"Label ID: {label_id}")
     """
+    # System labels always exist and use their name as ID
+    if label_name in _SYSTEM_LABELS:
+        return label_name
+    
     try:
         # First, try to find existing label
-        labels_result = service.users().labels().list(userId='me').execute()
+        labels_result = _execute_with_retry(service.users().labels().list(userId='me'))
         labels = labels_result.get('labels', [])
         
         for label in labels:
@@ -472,10 +708,10 @@ def get_or_create_label(service: Any, label_name: str) -> Optional[str]:
             'messageListVisibility': 'show'
         }
         
-        created_label = service.users().labels().create(
+        created_label = _execute_with_retry(service.users().labels().create(
             userId='me',
             body=label_object
-        ).execute()
+        ))
         
         logger.info(f"Created new label '{label_name}' with ID: {created_label['id']}")
         return created_label['id']
@@ -502,11 +738,8 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unnamed_attachment"
     
-    # Remove or replace invalid characters
-    # Windows: < > : " | ? * \
-    # Unix: / (and null bytes)
-    invalid_chars = r'[<>:"|?*\\\/\x00]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    # Replace invalid characters in a single pass (see _FILENAME_TRANS)
+    sanitized = filename.translate(_FILENAME_TRANS)
     
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip('. ')
@@ -568,6 +801,28 @@ def create_unique_filepath(download_dir: Path, filename: str) -> Path:
             return download_dir / new_filename
 
 
+@lru_cache(maxsize=1)
+def _download_dir_for_date(date_str: str) -> Path:
+    """Create (once) and return the attachment subdirectory for date_str."""
+    download_dir = Path(CONFIG.gmail.attachment_download_dir) / date_str
+    download_dir.mkdir(parents=True, exist_ok=True)
+    return download_dir
+
+
+def _current_download_dir() -> Path:
+    """
+    Return today's attachment download directory (YYYY-MM-DD subdirectory).
+    
+    The directory is created on first use for each day; later calls on the
+    same day hit the cache and skip the mkdir. The cache key changes at
+    midnight, so the next day's directory is created automatically.
+    
+    Returns:
+        Path: Existing directory for today's attachments
+    """
+    return _download_dir_for_date(datetime.now().strftime("%Y-%m-%d"))
+
+
 def download_attachment(service, message_id: str, attachment_id: str, filename: str) -> Optional[str]:
     """
     Download an attachment from Gmail and save it to disk.
@@ -591,11 +846,11 @@ def download_attachment(service, message_id: str, attachment_id: str, filename:
             return None
         
         # Get attachment data from Gmail API
-        attachment = service.users().messages().attachments().get(
+        attachment = _execute_with_retry(service.users().messages().attachments().get(
             userId='me',
             messageId=message_id,
             id=attachment_id
-        ).execute()
+        ))
         
         # Decode attachment data
         file_data = base64.urlsafe_b64decode(attachment['data'])
@@ -606,10 +861,8 @@ def download_attachment(service, message_id: str, attachment_id: str, filename:
             logger.warning(f"Attachment {filename} too large ({file_size} bytes), skipping")
             return None
         
-        # Create date-based subdirectory
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        download_dir = Path(CONFIG.gmail.attachment_download_dir) / date_str
-        download_dir.mkdir(parents=True, exist_ok=True)
+        # Date-based subdirectory (created once per day)
+        download_dir = _current_download_dir()
         
         # Sanitize filename and create unique path
         safe_filename = sanitize_filename(filename)
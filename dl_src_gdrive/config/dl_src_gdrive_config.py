@@ -34,19 +34,141 @@ Version: 1.0.0
 
 import os
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 import sys
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(project_root))
+try:
+    from common.config.proj_config import PROJ_CONFIG
+except ImportError:
+    # Imported standalone (e.g. `from config.dl_src_gdrive_config import CONFIG`
+    # from inside dl_src_gdrive/): make the project root importable, searched last
+    project_root = str(Path(__file__).resolve().parent.parent.parent)
+    if project_root not in sys.path:
+        sys.path.append(project_root)
+    from common.config.proj_config import PROJ_CONFIG
 
-from common.config.proj_config import PROJ_CONFIG
 
+# Immutable defaults shared by every GdriveConfig instance.
+# Extensions/MIME types are frozensets for O(1) membership tests.
+_DEFAULT_SEARCH_FOLDERS: Tuple[str, ...] = ("root",)
+_DEFAULT_SCOPES: Tuple[str, ...] = ('https://www.googleapis.com/auth/drive',)
+_DEFAULT_AUDIO_EXTENSIONS: FrozenSet[str] = frozenset({
+    '.mp3',   # MPEG Audio Layer III
+    '.m4a',   # MPEG-4 Audio
+    '.wav',   # Waveform Audio
+    '.ogg',   # Ogg Vorbis
+    '.flac',  # Free Lossless Audio Codec
+    '.aac',   # Advanced Audio Coding
+    '.wma',   # Windows Media Audio
+})
+_DEFAULT_TEXT_EXTENSIONS: FrozenSet[str] = frozenset({
+    '.txt',   # Plain text files
+    '.docx',  # Microsoft Word documents
+    '.pdf',   # Portable Document Format
+})
+# Google Docs MIME types for text processing
+_DEFAULT_GOOGLE_DOCS_MIME_TYPES: FrozenSet[str] = frozenset({
+    'application/vnd.google-apps.document',  # Google Docs
+    'application/vnd.google-apps.spreadsheet',  # Google Sheets
+    'application/vnd.google-apps.presentation',  # Google Slides
+})
+_DEFAULT_OTHER_EXTENSIONS: FrozenSet[str] = frozenset()
 
+# Environment variable values interpreted as boolean True (case-insensitive)
+_TRUTHY: FrozenSet[str] = frozenset({'true', '1', 'yes', 'on'})
 
-@dataclass
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value ('true', '1', 'yes', 'on' are True)."""
+    return value.lower() in _TRUTHY
+
+
+def _parse_str(value: str) -> Optional[str]:
+    """Return a non-empty environment value, or None to keep the default."""
+    return value or None
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """Parse a positive integer environment value, or None to keep the default."""
+    try:
+        parsed = int(value)
+    except ValueError:
+        return None
+    return parsed if parsed > 0 else None
+
+
+def _parse_float(value: str) -> Optional[float]:
+    """Parse a non-negative number environment value, or None to keep the default."""
+    try:
+        parsed = float(value)
+    except ValueError:
+        return None
+    return parsed if parsed >= 0 else None
+
+
+def _parse_list(value: str, sep: str = ',') -> Optional[List[str]]:
+    """
+    Parse a separated list environment value.
+    
+    Items are stripped of surrounding whitespace, empty items are dropped and
+    the rest are interned, so equal values share one object and string
+    comparisons in set/dict lookups can short-circuit on identity.
+    
+    Args:
+        value (str): Raw environment value
+        sep (str): Item separator. Default: ','
+        
+    Returns:
+        Optional[List[str]]: Parsed items, or None if there are no items
+    """
+    items = [sys.intern(item) for item in (raw.strip() for raw in value.split(sep)) if item]
+    return items or None
+
+
+def _parse_tuple(value: str) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated environment value into a tuple (order kept)."""
+    items = _parse_list(value)
+    return tuple(items) if items else None
+
+
+def _parse_frozenset(value: str) -> Optional[FrozenSet[str]]:
+    """Parse a comma-separated environment value into a frozenset."""
+    items = _parse_list(value)
+    return frozenset(items) if items else None
+
+
+def _parse_extensions(value: str) -> Optional[FrozenSet[str]]:
+    """Parse a comma-separated list of file extensions into a lower-cased frozenset."""
+    items = _parse_list(value.lower())
+    return frozenset(items) if items else None
+
+
+# Environment overrides applied by GdriveConfig.__post_init__, in order:
+# (variable name, attributes to set, parser). A parser returning None leaves
+# the current value in place. DELETE_FROM_SRC is the legacy all-types switch
+# and comes after the per-type flags so it wins, as before.
+_ENV_SPEC = (
+    ('DELETE_AUDIO_FROM_SRC', ('delete_audio_from_src',), _parse_bool),
+    ('DELETE_TEXT_FROM_SRC', ('delete_text_from_src',), _parse_bool),
+    ('DELETE_OTHER_FROM_SRC', ('delete_other_from_src',), _parse_bool),
+    ('DELETE_FROM_SRC',
+     ('delete_audio_from_src', 'delete_text_from_src', 'delete_other_from_src'),
+     _parse_bool),
+    ('SEARCH_FOLDERS', ('search_folders',), _parse_tuple),
+    ('CLIENT_SECRET_FILE', ('client_secret_file',), _parse_str),
+    ('TOKEN_FILE', ('token_file',), _parse_str),
+    ('ALLOWED_AUDIO_EXTENSIONS', ('allowed_audio_extensions',), _parse_extensions),
+    ('ALLOWED_TEXT_EXTENSIONS', ('allowed_text_extensions',), _parse_extensions),
+    ('ALLOWED_OTHER_EXTENSIONS', ('allowed_other_extensions',), _parse_extensions),
+    ('MAX_CONCURRENT_DOWNLOADS', ('max_concurrent_downloads',), _parse_int),
+    ('SERVER_SIDE_FILTER', ('server_side_filter',), _parse_bool),
+    ('RANGE_DOWNLOAD_SPLITS', ('range_download_splits',), _parse_int),
+    ('GDRIVE_QPS', ('qps',), _parse_float),
+)
+
+
+@dataclass(slots=True)
 class GdriveConfig:
     """
     Google Drive API and file processing configuration.
@@ -67,18 +189,32 @@ class GdriveConfig:
                                     successful download. Default: False
         delete_other_from_src (bool): Whether to delete other files from Google Drive after
                                      successful download. Default: False
-        search_folders (List[str]): List of Google Drive folder IDs to search.
-                                   Use "root" for root directory. Default: ["root"]
+        search_folders (Tuple[str, ...]): Google Drive folder IDs to search.
+                                         Use "root" for root directory. Default: ("root",)
         client_secret_file (str): Filename of the OAuth2 client secret JSON file.
                                  Default: "client_secret.json"
         token_file (str): Path to store OAuth2 token file. Default: "config/token.json"
-        scopes (List[str]): Google Drive API scopes. Default: ['https://www.googleapis.com/auth/drive']
-        allowed_audio_extensions (List[str]): Audio file extensions to download.
-                                             Default: ['.mp3', '.m4a', '.wav', '.ogg', '.flac', '.aac', '.wma']
-        allowed_text_extensions (List[str]): Text file extensions to download.
-                                            Default: ['.txt', '.docx', '.pdf']
-        allowed_other_extensions (List[str]): Other file extensions to download.
-                                             Default: [] (empty list)
+        scopes (Tuple[str, ...]): Google Drive API scopes. Default: ('https://www.googleapis.com/auth/drive',)
+        allowed_audio_extensions (FrozenSet[str]): Audio file extensions to download.
+                                                  Default: {'.mp3', '.m4a', '.wav', '.ogg', '.flac', '.aac', '.wma'}
+        allowed_text_extensions (FrozenSet[str]): Text file extensions to download.
+                                                 Default: {'.txt', '.docx', '.pdf'}
+        google_docs_mime_types (FrozenSet[str]): Google Docs MIME types treated as text.
+        allowed_other_extensions (FrozenSet[str]): Other file extensions to download.
+                                                  Default: empty set
+        max_concurrent_downloads (int): Upper bound on files downloaded in parallel;
+                                       the actual level adapts to throughput and
+                                       rate limits. Default: 20
+        server_side_filter (bool): Narrow per-type listings with MIME type/name
+                                  clauses in the Drive query. Drive matches
+                                  'name contains' on name prefixes, not
+                                  substrings, so a file with a generic MIME
+                                  type can be missed; opt in only if the
+                                  folders hold typed uploads. Default: False
+        range_download_splits (int): Parallel byte ranges used to download a
+                                    large file (1 disables). Default: 4
+        qps (float): Maximum Drive API requests per second across all download
+                    workers (0 disables the limit). Default: 10.0
     """
 
     # Delete settings for different file types
@@ -87,89 +223,44 @@ class GdriveConfig:
     delete_other_from_src: bool = False
     
     # Search and API settings
-    search_folders: List[str] = field(default_factory=lambda: ["root"])
+    search_folders: Tuple[str, ...] = _DEFAULT_SEARCH_FOLDERS
     client_secret_file: str = "common/config/google_account/client_secret.json"
     token_file: str = "common/config/google_account/token.json"
-    scopes: List[str] = field(default_factory=lambda: ['https://www.googleapis.com/auth/drive'])
+    scopes: Tuple[str, ...] = _DEFAULT_SCOPES
     
     # File extension settings
-    allowed_audio_extensions: List[str] = field(default_factory=lambda: [
-        '.mp3',   # MPEG Audio Layer III
-        '.m4a',   # MPEG-4 Audio
-        '.wav',   # Waveform Audio
-        '.ogg',   # Ogg Vorbis
-        '.flac',  # Free Lossless Audio Codec
-        '.aac',   # Advanced Audio Coding
-        '.wma',   # Windows Media Audio
-    ])
-    allowed_text_extensions: List[str] = field(default_factory=lambda: [
-        '.txt',   # Plain text files
-        '.docx',  # Microsoft Word documents
-        '.pdf',   # Portable Document Format
-    ])
-    # Google Docs MIME types for text processing
-    google_docs_mime_types: List[str] = field(default_factory=lambda: [
-        'application/vnd.google-apps.document',  # Google Docs
-        'application/vnd.google-apps.spreadsheet',  # Google Sheets
-        'application/vnd.google-apps.presentation',  # Google Slides
-    ])
-    allowed_other_extensions: List[str] = field(default_factory=lambda: [])
+    allowed_audio_extensions: FrozenSet[str] = _DEFAULT_AUDIO_EXTENSIONS
+    allowed_text_extensions: FrozenSet[str] = _DEFAULT_TEXT_EXTENSIONS
+    google_docs_mime_types: FrozenSet[str] = _DEFAULT_GOOGLE_DOCS_MIME_TYPES
+    allowed_other_extensions: FrozenSet[str] = _DEFAULT_OTHER_EXTENSIONS
+    
+    # Download concurrency
+    max_concurrent_downloads: int = 20
+    
+    # Push file-type filtering into the Drive search query (can skip files, opt-in)
+    server_side_filter: bool = False
+    
+    # Parallel byte-range downloads for large files
+    range_download_splits: int = 4
+    
+    # Shared request rate limit, below Google's per-user quota
+    qps: float = 10.0
 
     def __post_init__(self):
         """Load configuration from environment variables after initialization."""
-        # Load delete settings from environment
-        env_delete_audio = os.getenv('DELETE_AUDIO_FROM_SRC')
-        if env_delete_audio is not None:
-            self.delete_audio_from_src = env_delete_audio.lower() in ('true', '1', 'yes', 'on')
-        
-        env_delete_text = os.getenv('DELETE_TEXT_FROM_SRC')
-        if env_delete_text is not None:
-            self.delete_text_from_src = env_delete_text.lower() in ('true', '1', 'yes', 'on')
-        
-        env_delete_other = os.getenv('DELETE_OTHER_FROM_SRC')
-        if env_delete_other is not None:
-            self.delete_other_from_src = env_delete_other.lower() in ('true', '1', 'yes', 'on')
-        
-        # Backward compatibility: if old DELETE_FROM_SRC is set, apply to all types
-        env_delete_legacy = os.getenv('DELETE_FROM_SRC')
-        if env_delete_legacy is not None:
-            delete_all = env_delete_legacy.lower() in ('true', '1', 'yes', 'on')
-            self.delete_audio_from_src = delete_all
-            self.delete_text_from_src = delete_all
-            self.delete_other_from_src = delete_all
-        
-        # Load search_folders from environment (comma-separated)
-        env_folders = os.getenv('SEARCH_FOLDERS')
-        if env_folders:
-            self.search_folders = [folder.strip() for folder in env_folders.split(',') if folder.strip()]
-        
-        # Load client_secret_file from environment
-        env_client_secret = os.getenv('CLIENT_SECRET_FILE')
-        if env_client_secret:
-            self.client_secret_file = env_client_secret
-        
-        # Load token_file from environment
-        env_token = os.getenv('TOKEN_FILE')
-        if env_token:
-            self.token_file = env_token
-        
-        # Load allowed_audio_extensions from environment (comma-separated)
-        env_audio_extensions = os.getenv('ALLOWED_AUDIO_EXTENSIONS')
-        if env_audio_extensions:
-            self.allowed_audio_extensions = [ext.strip() for ext in env_audio_extensions.split(',') if ext.strip()]
-        
-        # Load allowed_text_extensions from environment (comma-separated)
-        env_text_extensions = os.getenv('ALLOWED_TEXT_EXTENSIONS')
-        if env_text_extensions:
-            self.allowed_text_extensions = [ext.strip() for ext in env_text_extensions.split(',') if ext.strip()]
-        
-        # Load allowed_other_extensions from environment (comma-separated)
-        env_other_extensions = os.getenv('ALLOWED_OTHER_EXTENSIONS')
-        if env_other_extensions:
-            self.allowed_other_extensions = [ext.strip() for ext in env_other_extensions.split(',') if ext.strip()]
+        env = os.environ
+        for name, attrs, parse in _ENV_SPEC:
+            # Unset variables (the common case) cost a single membership test
+            if name not in env:
+                continue
+            value = parse(env[name])
+            if value is None:
+                continue
+            for attr in attrs:
+                setattr(self, attr, value)
     
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """
     Main application configuration combining all configuration sections.
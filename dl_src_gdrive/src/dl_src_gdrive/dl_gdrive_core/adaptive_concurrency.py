@@ -0,0 +1,208 @@
+"""
+Adaptive Concurrency Module
+
+This module provides an AIMD (additive increase, multiplicative decrease)
+concurrency limiter for the Google Drive downloader. Download workers hold a
+slot from the limiter while transferring a chunk; the limiter watches the
+aggregate throughput and adjusts how many slots are available.
+
+The control loop:
+- Every window, fold the aggregate bytes/second into a moving average kept
+  for the current limit
+- If the current limit is not clearly faster (THROUGHPUT_GAIN_MIN) than one
+  slot fewer, give that slot back
+- Otherwise, if one slot more has not been measured (or measured faster),
+  allow one more concurrent transfer (up to the maximum)
+- Every PROBE_INTERVAL_WINDOWS windows at the same limit, forget the
+  measurement of one slot more so it is tried again
+- On a rate-limit response from Drive, halve the number of concurrent
+  transfers and forget all measurements
+
+Throughput noise alone therefore settles on a limit instead of ratcheting
+it up to the maximum.
+
+The learned limit can be saved to and loaded from a small JSON file so the
+next run starts close to the optimum.
+
+Author: [Your Name]
+Date: [Current Date]
+Version: 1.0.0
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from common.logging_utils.logging_config import get_logger
+
+
+# Default starting limit and throughput sampling window
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_WINDOW_SECONDS = 2.0
+
+# Relative throughput gain an extra concurrent transfer must bring to be kept
+THROUGHPUT_GAIN_MIN = 0.05
+
+# Weight of the newest window in the per-limit throughput average
+THROUGHPUT_EWMA_ALPHA = 0.3
+
+# Windows spent at one limit before the next higher limit is probed again
+PROBE_INTERVAL_WINDOWS = 10
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe AIMD limiter for concurrent chunk transfers.
+
+    Attributes:
+        maximum (int): Upper bound for the concurrency limit
+        window_seconds (float): Length of a throughput sampling window
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=20)
+        >>> with limiter.slot():
+        ...     status, done = downloader.next_chunk()
+        >>> limiter.record_bytes(chunk_size)
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_LIMIT,
+        maximum: int = 20,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial (int): Starting concurrency limit (clamped to 1..maximum)
+            maximum (int): Upper bound for the concurrency limit
+            window_seconds (float): Throughput sampling window in seconds
+        """
+        self.logger = get_logger('gdrive_downloader')
+        self.maximum = max(1, maximum)
+        self.window_seconds = window_seconds
+
+        self._cond = threading.Condition()
+        self._limit = min(max(1, initial), self.maximum)
+        self._in_flight = 0
+
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._rates: Dict[int, float] = {}
+        self._windows_at_limit = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of transfers allowed to run concurrently."""
+        return self._limit
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Hold one transfer slot for the duration of the with-block.
+
+        Blocks until the number of in-flight transfers is below the current limit.
+        """
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def record_bytes(self, nbytes: int) -> None:
+        """
+        Account transferred bytes and adjust the limit once per window.
+
+        Args:
+            nbytes (int): Number of bytes transferred since the last call
+        """
+        with self._cond:
+            self._window_bytes += nbytes
+            now = time.monotonic()
+            elapsed = now - self._window_start
+            if elapsed < self.window_seconds:
+                return
+
+            rate = self._window_bytes / elapsed
+            self._window_start = now
+            self._window_bytes = 0
+            
+            limit = self._limit
+            previous = self._rates.get(limit)
+            current = rate if previous is None else previous + THROUGHPUT_EWMA_ALPHA * (rate - previous)
+            self._rates[limit] = current
+            self._windows_at_limit += 1
+            if self._windows_at_limit % PROBE_INTERVAL_WINDOWS == 0:
+                self._rates.pop(limit + 1, None)
+            
+            lower = self._rates.get(limit - 1)
+            higher = self._rates.get(limit + 1)
+            if lower is not None and current < lower * (1 + THROUGHPUT_GAIN_MIN):
+                self._set_limit(limit - 1)
+                self.logger.debug(
+                    f"Throughput {current / 1_000_000:.2f} MB/s not above {limit - 1} transfers, "
+                    f"concurrency limit lowered to {self._limit}"
+                )
+            elif limit < self.maximum and (higher is None or higher > current * (1 + THROUGHPUT_GAIN_MIN)):
+                self._set_limit(limit + 1)
+                self._cond.notify()
+                self.logger.debug(
+                    f"Throughput {current / 1_000_000:.2f} MB/s at {limit} transfers, "
+                    f"concurrency limit raised to {self._limit}"
+                )
+    
+    def _set_limit(self, limit: int) -> None:
+        """Change the limit and restart the per-limit window count (lock held)."""
+        self._limit = limit
+        self._windows_at_limit = 0
+
+    def on_rate_limited(self) -> None:
+        """Halve the concurrency limit after a rate-limit response (minimum 1)."""
+        with self._cond:
+            self._set_limit(max(1, self._limit // 2))
+            self._rates.clear()
+            self.logger.debug(f"Rate limited by Google Drive, concurrency limit lowered to {self._limit}")
+
+    def save(self, state_path: Path) -> None:
+        """
+        Persist the current limit so the next run can start from it.
+
+        Failures are logged and otherwise ignored; the state is only a hint.
+
+        Args:
+            state_path (Path): JSON file to write
+        """
+        tmp_path = state_path.with_name(state_path.name + '.tmp')
+        try:
+            tmp_path.write_text(json.dumps({'concurrency_limit': self._limit}))
+            os.replace(tmp_path, state_path)
+        except OSError as e:
+            self.logger.debug(f"Could not save concurrency state to {state_path}: {e}")
+
+    @staticmethod
+    def load_initial(state_path: Path, default: int = DEFAULT_INITIAL_LIMIT) -> int:
+        """
+        Read a limit saved by save(), falling back to a default.
+
+        Args:
+            state_path (Path): JSON file written by save()
+            default (int): Limit to use if the file is missing or invalid
+
+        Returns:
+            int: Starting concurrency limit
+        """
+        try:
+            value: Optional[int] = json.loads(state_path.read_text()).get('concurrency_limit')
+        except (OSError, ValueError, AttributeError):
+            return default
+        return value if isinstance(value, int) and value > 0 else default
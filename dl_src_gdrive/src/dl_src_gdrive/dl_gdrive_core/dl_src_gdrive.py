@@ -19,29 +19,339 @@ The GoogleDriveDownloader class provides these main methods:
 - list_files_in_folders(): Discover files in configured folders
 - filter_audio_files(): Filter files by audio extensions
 - download_file(): Download individual files with progress tracking
-- download_all_audio_files(): Batch download all audio files
+- download_all_audio_files(): Batch download all audio files (in parallel)
 - delete_file_from_gdrive(): Remove files from Google Drive
+- delete_files_from_gdrive(): Remove many files using batched requests
 - cleanup_credentials(): Remove stored credentials for security
+- close(): Stop download workers and release HTTP connections
 
 Author: [Your Name]
 Date: [Current Date]
 Version: 1.0.0
 """
 
+import json
+import logging
+import mimetypes
+import os
+import queue
+import random
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Any, BinaryIO, Callable, FrozenSet, List, Dict, Optional, Sequence, Tuple
 
-from google.auth.transport.requests import Request
+import httplib2
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
-import io
 
 from dl_src_gdrive.config.dl_src_gdrive_config import CONFIG
 from common.logging_utils.logging_config import get_logger
-from common.utils.file_sys_utils import resolve_path, ensure_directory, sanitize_filename, get_script_directory, get_project_root
+from common.utils.file_sys_utils import resolve_path, ensure_directory, forget_directory, sanitize_filename, get_script_directory, get_project_root
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
+from .rate_limiter import TokenBucket
+
+
+# Drive error reasons (HTTP 403) that signal rate limiting rather than a permission problem
+RATE_LIMIT_REASONS = frozenset({'userRateLimitExceeded', 'rateLimitExceeded'})
+
+# HTTP statuses retried with backoff (403 only when it carries a rate-limit reason)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Retries of a single Drive request after a retryable error
+MAX_RETRIES = 5
+
+# Upper bound for a single backoff sleep, in seconds
+MAX_BACKOFF_SECONDS = 32
+
+# Transport-level retries of media GETs on the pooled session: dropped or
+# reset connections only; HTTP error statuses are retried by _with_retry
+MEDIA_CONNECTION_RETRIES = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    status=0,
+    backoff_factor=0.5,
+    allowed_methods=frozenset({'GET'})
+)
+
+# Files known to be at most this size are fetched with one get_media request
+# instead of a streamed GET; also used as the file write buffer size
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Errors of a media stream cut off before or during the body; such downloads
+# are retried and resume from the bytes already written
+STREAM_ERRORS: Tuple[type, ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+    ProtocolError,
+    ReadTimeoutError,
+)
+
+# Socket timeout (seconds) for Drive API HTTP connections
+HTTP_TIMEOUT = 60
+
+# User-Agent of the media session. Google only gzips responses when the
+# User-Agent contains "gzip" (googleapiclient already does this for API calls)
+MEDIA_USER_AGENT = "voice-diary-gdrive/1.0 (gzip)"
+
+# Access tokens expiring within this window are refreshed in the background.
+# Must stay above google-auth's own expiry threshold (under 4 minutes), or
+# AuthorizedHttp refreshes inline in every worker before this margin is hit
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Files at least this large (per Drive metadata) are downloaded as parallel
+# byte ranges (see GdriveConfig.range_download_splits)
+RANGE_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+
+# Copy buffer size when streaming a media response straight into a file
+STREAM_COPY_SIZE = 1024 * 1024
+
+# Drive v3 files endpoint, used directly for byte-range media requests
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
+# Separator lines framing the banner and summary log sections
+BANNER = "=" * 40
+BANNER_WIDE = "=" * 60
+
+# Maximum page size accepted by the Drive files().list endpoint
+LIST_PAGE_SIZE = 1000
+
+# File types handled by the downloader, in processing order
+FILE_TYPES: Tuple[str, ...] = ('audio', 'text', 'other')
+
+# Maximum number of sub-requests in one Drive batch (batch/drive/v3) call
+DRIVE_BATCH_SIZE = 100
+
+# Metadata fields requested for every listed file: id/name to download,
+# size to pick the download path, createdTime for chronological order,
+# md5Checksum to notice content changed since the last download
+LIST_BASE_FIELDS: Tuple[str, ...] = ('id', 'name', 'size', 'createdTime', 'md5Checksum')
+
+# Manifest (in the download directory) of Drive files already downloaded,
+# one "<id> <md5Checksum>" line per file (just "<id>" when Drive reports no
+# checksum, e.g. Google Docs), so recording a download is a single append
+MANIFEST_FILE = '.downloaded'
+
+# File (next to the token file) remembering the learned download concurrency
+CONCURRENCY_STATE_FILE = 'gdrive_concurrency.json'
+
+
+class _RangeNotSupported(Exception):
+    """Raised when a byte-range media request is not answered with 206 Partial Content."""
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, comparable with Credentials.expiry."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _kind_query_clause(kind: str) -> str:
+    """
+    Build a Drive query clause matching the files of one download type.
+    
+    The clause ORs together MIME type tests (an 'audio/' prefix for audio,
+    the configured Google Docs types for text, and the MIME types guessed
+    from the allowed extensions) with "name contains" tests for the
+    extensions themselves, as a fallback for files uploaded with a generic
+    MIME type. It narrows the listing on the server; the extension filters
+    still run on the result to keep their exact semantics. Drive matches
+    "name contains" on name prefixes only, so the fallback can miss a file
+    uploaded with a generic MIME type, which is why
+    CONFIG.gdrive.server_side_filter is off by default.
+    
+    Args:
+        kind (str): File type: 'audio', 'text', or 'other'
+        
+    Returns:
+        str: Query clause, or an empty string if no file can match
+        
+    Raises:
+        ValueError: If kind is not a known file type
+    """
+    mime_prefixes: Tuple[str, ...] = ()
+    mime_types = set()
+    if kind == 'audio':
+        extensions = CONFIG.gdrive.allowed_audio_extensions
+        mime_prefixes = ('audio/',)
+    elif kind == 'text':
+        extensions = CONFIG.gdrive.allowed_text_extensions
+        mime_types.update(CONFIG.gdrive.google_docs_mime_types)
+    elif kind == 'other':
+        extensions = CONFIG.gdrive.allowed_other_extensions
+    else:
+        raise ValueError(f"Unknown file type: {kind!r}")
+    
+    for ext in extensions:
+        guessed, _ = mimetypes.guess_type(f"file{ext}")
+        if guessed:
+            mime_types.add(guessed)
+    
+    clauses = [f"mimeType contains '{prefix}'" for prefix in mime_prefixes]
+    clauses.extend(f"mimeType = '{_escape_query(mime)}'" for mime in sorted(mime_types))
+    clauses.extend(f"name contains '{_escape_query(ext)}'" for ext in sorted(extensions))
+    return " or ".join(clauses)
+
+
+def _list_fields(kinds: Optional[Sequence[str]], with_parents: bool) -> str:
+    """
+    Build the files().list fields projection for a listing.
+    
+    Only fields the downloader reads are requested: mimeType only when text
+    files (Google Docs export dispatch) may be listed, parents only when
+    per-folder counts are needed. No spaces, to keep the request line short.
+    
+    Args:
+        kinds (Optional[Sequence[str]]): File types being listed, or None for all
+        with_parents (bool): Include the parents field
+        
+    Returns:
+        str: Value for the fields parameter
+    """
+    fields = list(LIST_BASE_FIELDS)
+    if kinds is None or 'text' in kinds:
+        fields.append('mimeType')
+    if with_parents:
+        fields.append('parents')
+    return f"nextPageToken,files({','.join(fields)})"
+
+
+@lru_cache(maxsize=8)
+def _extension_set(extensions: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    Lower-case a configured extension set once, for case-insensitive matching.
+    
+    Cached per set, so repeated listings reuse the same frozenset (returned
+    unchanged when it is already lower case, as the defaults and env
+    overrides are).
+    
+    Args:
+        extensions (FrozenSet[str]): Configured extensions, including the dot
+        
+    Returns:
+        FrozenSet[str]: Lower-cased extensions
+    """
+    lowered = frozenset(ext.lower() for ext in extensions)
+    return extensions if lowered == extensions else lowered
+
+
+def _escape_query(value: str) -> str:
+    """Escape a string for use inside a single-quoted Drive query literal."""
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
+def _create_exclusive(file_path: Path) -> Optional[BinaryIO]:
+    """
+    Create and open a new file for binary writing, failing if it already exists.
+    
+    Existence check and creation are a single O_CREAT | O_EXCL open, so no
+    separate stat is needed and concurrent workers cannot both create the file.
+    
+    Args:
+        file_path (Path): File to create
+        
+    Returns:
+        Optional[BinaryIO]: Buffered binary file object, or None if the file exists
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(file_path, flags, 0o644)
+    except FileExistsError:
+        return None
+    return os.fdopen(fd, 'wb', buffering=DOWNLOAD_CHUNK_SIZE)
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    """Return the HTTP status of a googleapiclient or requests HTTP error (None if unknown)."""
+    if isinstance(error, HttpError):
+        return error.resp.status
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code
+    return None
+
+
+def _raise_for_media_status(response: requests.Response) -> None:
+    """
+    Raise requests.HTTPError for an error status of a streamed media response.
+    
+    The (small) error body is read before raising, so _is_rate_limit_error()
+    can still inspect it after the enclosing with-block has closed the stream.
+    
+    Args:
+        response (requests.Response): Response opened with stream=True
+        
+    Raises:
+        requests.HTTPError: If the response has a 4xx or 5xx status
+    """
+    if response.status_code >= 400:
+        response.content  # Cached on the response; the raw stream is closed later
+        response.raise_for_status()
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether a Drive HTTP error is a rate-limit response.
+    
+    Args:
+        error (Exception): HttpError from googleapiclient or requests.HTTPError
+        
+    Returns:
+        bool: True for HTTP 429, or HTTP 403 with a rate-limit reason
+    """
+    status = _error_status(error)
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    if isinstance(error, HttpError):
+        content = error.content
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', 'replace')
+    else:
+        content = error.response.text
+    return any(reason in content for reason in RATE_LIMIT_REASONS)
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Check whether a Drive HTTP error is transient (5xx or rate limit) and worth retrying."""
+    return _error_status(error) in RETRYABLE_STATUSES or _is_rate_limit_error(error)
+
+
+def _backoff_delay(error: Exception, attempt: int, base: float = 1.0) -> float:
+    """
+    Compute the sleep before retrying a failed Drive request.
+    
+    Capped exponential backoff with jitter; a Retry-After header sent by the
+    server takes precedence over the computed delay.
+    
+    Args:
+        error (Exception): The retryable HTTP error
+        attempt (int): Zero-based attempt number that failed
+        base (float): Delay of the first retry in seconds. Default: 1.0
+        
+    Returns:
+        float: Delay in seconds (at most MAX_BACKOFF_SECONDS)
+    """
+    if isinstance(error, HttpError):
+        retry_after = error.resp.get('retry-after')
+    else:
+        retry_after = error.response.headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), MAX_BACKOFF_SECONDS)
+    return min(base * 2 ** attempt + random.random() * 0.5, MAX_BACKOFF_SECONDS)
 
 
 class GoogleDriveDownloader:
@@ -76,7 +386,19 @@ class GoogleDriveDownloader:
         ...     print(f"Downloaded {successful}/{total} files")
     """
     
-    def __init__(self):
+    # Credentials shared by all downloader instances in this process, so
+    # re-authenticating does not re-read the token file
+    _shared_credentials: Optional[Credentials] = None
+    # Token JSON last read from or written to the token file
+    _last_token_json: Optional[str] = None
+    _credentials_lock = threading.Lock()
+    _refresh_thread: Optional[threading.Thread] = None
+    
+    # Token refresh transport; one requests.Session keeps the OAuth
+    # connection alive across refreshes
+    _refresh_request = Request(session=requests.Session())
+    
+    def __init__(self, on_file_downloaded: Optional[Callable[[Path, str], None]] = None):
         """
         Initialize the Google Drive downloader with configuration and paths.
         
@@ -89,10 +411,40 @@ class GoogleDriveDownloader:
         The downloader will be ready for authentication after initialization.
         All paths are resolved relative to the script directory to ensure
         cross-platform compatibility.
+        
+        Args:
+            on_file_downloaded (Optional[Callable[[Path, str], None]]): Called
+                with the local path and file type ('audio', 'text' or 'other')
+                of every file downloaded or exported in this run, from the
+                download worker thread, so callers can start processing files
+                before the whole batch has finished
         """
         self.logger = get_logger('gdrive_downloader')
         self.service = None
         self.credentials = None
+        self.on_file_downloaded = on_file_downloaded
+        
+        # Drive names of files whose download or export failed in this instance
+        self.failed_files: List[str] = []
+        
+        # Per-thread Drive service (googleapiclient's http object is not thread-safe)
+        self._local = threading.local()
+        
+        # Download workers, kept alive across batches so each thread's Drive
+        # service and HTTPS connection stay warm (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Requests session for byte-range media downloads (created on first use)
+        self._media_session: Optional[AuthorizedSession] = None
+        self._media_session_lock = threading.Lock()
+        
+        # (file_id, file_name) pairs deleted from Google Drive in batch requests
+        # by a background worker while a batch download runs (started on
+        # first use). Outside a batch, deletes happen right after each download.
+        self._delete_queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._delete_thread: Optional[threading.Thread] = None
+        self._delete_thread_lock = threading.Lock()
+        self._queue_deletes = False
         
         # Get script directory for path resolution
         self.script_dir = get_script_directory()
@@ -128,6 +480,23 @@ class GoogleDriveDownloader:
             # Ensure download directory exists
             ensure_directory(self.download_dir)
             
+            # Files already downloaded by earlier runs (ID -> md5Checksum, '' if
+            # unknown) and checksums of the files being downloaded in this run
+            self._manifest_path = self.download_dir / MANIFEST_FILE
+            self._manifest_lock = threading.Lock()
+            self._done_ids = self._load_manifest()
+            self._listed_md5: Dict[str, str] = {}
+            
+            # Adaptive download concurrency, resuming from the limit learned last run
+            self._concurrency_state_path = self.token_path.parent / CONCURRENCY_STATE_FILE
+            self._limiter = AdaptiveConcurrencyLimiter(
+                initial=AdaptiveConcurrencyLimiter.load_initial(self._concurrency_state_path),
+                maximum=CONFIG.gdrive.max_concurrent_downloads
+            )
+            
+            # Request rate cap shared by every worker (one token per Drive HTTP call)
+            self._rate_limiter = TokenBucket(rate=CONFIG.gdrive.qps)
+            
         except Exception as e:
             self.logger.error(f"Failed to initialize GoogleDriveDownloader: {e}")
             raise
@@ -168,19 +537,27 @@ class GoogleDriveDownloader:
                 self.logger.error(f"Client secret file not found: {self.client_secret_path}")
                 return False
             
+            # Reuse credentials already loaded in this process
+            cls = GoogleDriveDownloader
+            if cls._shared_credentials is not None:
+                self.logger.debug("Using cached credentials...")
+                self.credentials = cls._shared_credentials
+            
             # Load existing credentials if available
-            if self.token_path.exists():
+            elif self.token_path.exists():
                 self.logger.debug("Loading existing credentials...")
-                self.credentials = Credentials.from_authorized_user_file(
-                    str(self.token_path), 
+                token_json = self.token_path.read_text()
+                self.credentials = Credentials.from_authorized_user_info(
+                    json.loads(token_json),
                     CONFIG.gdrive.scopes
                 )
+                cls._last_token_json = token_json
             
             # If there are no (valid) credentials available, let the user log in
             if not self.credentials or not self.credentials.valid:
                 if self.credentials and self.credentials.expired and self.credentials.refresh_token:
                     self.logger.debug("Refreshing expired credentials...")
-                    self.credentials.refresh(Request())
+                    self.credentials.refresh(cls._refresh_request)
                 else:
                     self.logger.info("Starting OAuth2 flow...")
                     flow = InstalledAppFlow.from_client_secrets_file(
@@ -190,12 +567,13 @@ class GoogleDriveDownloader:
                     self.credentials = flow.run_local_server(port=0)
                 
                 # Save the credentials for the next run
-                self.logger.debug(f"Saving credentials to: {self.token_path}")
-                with open(self.token_path, 'w') as token_file:
-                    token_file.write(self.credentials.to_json())
+                self._save_credentials()
+            
+            cls._shared_credentials = self.credentials
             
             # Build the service
-            self.service = build('drive', 'v3', credentials=self.credentials)
+            self.service = self._build_service()
+            self._local.service = self.service
             self.logger.info("Google Drive authentication successful")
             return True
             
@@ -203,29 +581,383 @@ class GoogleDriveDownloader:
             self.logger.error(f"Authentication failed: {str(e)}")
             return False
     
-    def list_files_in_folders(self) -> List[Dict]:
+    def _save_credentials(self) -> None:
+        """
+        Write the current credentials to the token file atomically, if changed.
+        
+        The JSON is compared with what was last read or written; unchanged
+        credentials cause no file I/O. Otherwise it is written to a temporary
+        file that then replaces the token file, so a crash mid-write never
+        leaves a truncated token behind.
+        """
+        token_json = self.credentials.to_json()
+        if token_json == GoogleDriveDownloader._last_token_json:
+            self.logger.debug("Credentials unchanged, not rewriting token file")
+            return
+        
+        self.logger.debug(f"Saving credentials to: {self.token_path}")
+        tmp_path = self.token_path.with_name(self.token_path.name + '.tmp')
+        tmp_path.write_text(token_json)
+        os.replace(tmp_path, self.token_path)
+        GoogleDriveDownloader._last_token_json = token_json
+    
+    def _refresh_credentials(self) -> None:
+        """
+        Refresh the shared credentials and persist the new token.
+        
+        Serialized by the class-level credentials lock; a refresh that finds
+        the token already fresh (refreshed by another thread) does nothing.
+        """
+        with GoogleDriveDownloader._credentials_lock:
+            expiry = self.credentials.expiry
+            if expiry is not None and expiry - _utcnow() >= TOKEN_REFRESH_MARGIN:
+                return
+            self.logger.debug("Refreshing Google Drive access token...")
+            self.credentials.refresh(GoogleDriveDownloader._refresh_request)
+            self._save_credentials()
+    
+    def _background_refresh(self) -> None:
+        """Thread target: refresh credentials, logging instead of raising on failure."""
+        try:
+            self._refresh_credentials()
+        except Exception as e:
+            self.logger.warning(f"Background token refresh failed: {e}")
+    
+    def _ensure_fresh_token(self) -> None:
+        """
+        Keep the access token valid without stalling downloads.
+        
+        Called by download workers before each file. A token close to expiry
+        (within TOKEN_REFRESH_MARGIN) is refreshed on a background daemon
+        thread while the current token is still used; an already expired
+        token is refreshed inline.
+        """
+        credentials = self.credentials
+        if credentials is None or credentials.expiry is None or not credentials.refresh_token:
+            return
+        
+        remaining = credentials.expiry - _utcnow()
+        if remaining <= timedelta(0):
+            self._refresh_credentials()
+            return
+        
+        if remaining < TOKEN_REFRESH_MARGIN:
+            cls = GoogleDriveDownloader
+            with cls._credentials_lock:
+                if cls._refresh_thread is None or not cls._refresh_thread.is_alive():
+                    cls._refresh_thread = threading.Thread(
+                        target=self._background_refresh,
+                        name="gdrive_token_refresh",
+                        daemon=True
+                    )
+                    cls._refresh_thread.start()
+    
+    def _get_service(self) -> Any:
+        """
+        Get the Google Drive API service for the calling thread.
+        
+        googleapiclient service objects share a non-thread-safe httplib2
+        transport, so each download worker builds and keeps its own service
+        (and HTTPS connection) from the shared credentials. The authenticating thread reuses the
+        service built by authenticate().
+        
+        Returns:
+            Any: Google Drive API service instance for this thread
+        """
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self._build_service()
+            self._local.service = service
+        return service
+    
+    def _build_service(self) -> Any:
+        """
+        Build a Google Drive API service with its own persistent HTTP transport.
+        
+        The service wraps a dedicated httplib2.Http in AuthorizedHttp, so all
+        calls made through it (list, small media fetches, deletes) reuse the same
+        keep-alive HTTPS connection instead of re-handshaking. Each thread
+        gets its own service and therefore its own connection.
+        
+        Returns:
+            Any: Google Drive API service instance
+        """
+        authed_http = AuthorizedHttp(
+            self.credentials,
+            http=httplib2.Http(timeout=HTTP_TIMEOUT)
+        )
+        return build('drive', 'v3', http=authed_http, cache_discovery=False)
+    
+    def _with_retry(
+        self,
+        fn: Callable[[], Any],
+        *,
+        max_retries: int = MAX_RETRIES,
+        base: float = 1.0,
+        retry_on: Tuple[type, ...] = ()
+    ) -> Any:
+        """
+        Call a Drive request function, retrying transient failures.
+        
+        Each attempt first takes a token from the shared request rate limiter
+        (CONFIG.gdrive.qps). HTTP 429, HTTP 5xx and HTTP 403 with a rate-limit
+        reason are retried after a capped, jittered exponential backoff
+        (honouring Retry-After).
+        Every such retry also halves the adaptive download concurrency.
+        Exceptions of the retry_on types are retried with the same backoff.
+        Other errors, and the last failed attempt, propagate to the caller.
+        
+        Args:
+            fn (Callable[[], Any]): Performs one attempt of the request
+            max_retries (int): Maximum number of retries. Default: MAX_RETRIES
+            base (float): Delay of the first retry in seconds. Default: 1.0
+            retry_on (Tuple[type, ...]): Additional exception types to retry
+                                        (e.g. STREAM_ERRORS). Default: none
+            
+        Returns:
+            Any: Whatever fn returns
+            
+        Raises:
+            HttpError, requests.HTTPError: If the request fails permanently
+        """
+        for attempt in range(max_retries + 1):
+            self._rate_limiter.acquire()
+            try:
+                return fn()
+            except (HttpError, requests.HTTPError) as e:
+                if not _is_retryable_error(e) or attempt == max_retries:
+                    raise
+                self._limiter.on_rate_limited()
+                delay = _backoff_delay(e, attempt, base)
+                self.logger.warning(
+                    f"Google Drive returned HTTP {_error_status(e)}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(delay)
+            except retry_on as e:
+                if attempt == max_retries:
+                    raise
+                delay = min(base * 2 ** attempt + random.random() * 0.5, MAX_BACKOFF_SECONDS)
+                self.logger.warning(
+                    f"Connection to Google Drive failed ({e}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(delay)
+    
+    def _get_media_session(self) -> AuthorizedSession:
+        """
+        Get the shared requests session used for streamed and byte-range media downloads.
+        
+        The session's connection pool is sized for every range of every
+        concurrent download, so workers reuse keep-alive connections (one
+        TLS handshake per pooled connection, not per file). Connection
+        failures are retried by the adapter (MEDIA_CONNECTION_RETRIES).
+        Requests accept gzip (MEDIA_USER_AGENT), which shrinks text exports.
+        
+        Returns:
+            AuthorizedSession: Session authorized with the current credentials
+        """
+        with self._media_session_lock:
+            if self._media_session is None:
+                pool_size = max(1, CONFIG.gdrive.max_concurrent_downloads) * max(1, CONFIG.gdrive.range_download_splits)
+                session = AuthorizedSession(self.credentials)
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=pool_size,
+                    max_retries=MEDIA_CONNECTION_RETRIES
+                )
+                session.mount("https://", adapter)
+                session.headers['User-Agent'] = MEDIA_USER_AGENT
+                session.headers['Accept-Encoding'] = 'gzip'
+                self._media_session = session
+            return self._media_session
+    
+    def _stream_media(self, file_id: str, file_handle: BinaryIO, export_mime_type: Optional[str] = None) -> int:
+        """
+        Download a file's content as one streamed response copied into a file.
+        
+        The response body is copied from the socket into the file with
+        shutil.copyfileobj in STREAM_COPY_SIZE blocks, without the per-chunk
+        requests, resumable-progress bookkeeping and intermediate buffers of
+        MediaIoBaseDownload.
+        
+        If the transfer fails part-way, the retry asks only for the missing
+        bytes (Range plus If-Range with the first response's ETag). When the
+        server answers with the full content instead (no range support, as
+        for exports, or the file changed), the file is written from the start.
+        
+        Args:
+            file_id (str): Google Drive file ID
+            file_handle (BinaryIO): Open binary file to write to
+            export_mime_type (Optional[str]): Export a Google Docs file to this
+                                             MIME type instead of downloading
+                                             its content. Default: None
+            
+        Returns:
+            int: Number of bytes written
+            
+        Raises:
+            requests.HTTPError: If the server answers with an error status
+                               (after retries for transient errors)
+        """
+        if export_mime_type is None:
+            url = f"{DRIVE_FILES_URL}/{file_id}?alt=media"
+        else:
+            url = f"{DRIVE_FILES_URL}/{file_id}/export?mimeType={export_mime_type}"
+        session = self._get_media_session()
+        start = file_handle.tell()
+        etag: Optional[str] = None
+        
+        def _attempt() -> None:
+            nonlocal etag
+            received = file_handle.tell() - start
+            headers = {}
+            if received:
+                # Resume; byte offsets must refer to the stored file, so no content coding
+                headers = {'Range': f"bytes={received}-", 'Accept-Encoding': 'identity'}
+                if etag:
+                    headers['If-Range'] = etag
+            
+            with self._limiter.slot():
+                with session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+                    _raise_for_media_status(response)
+                    response.raw.decode_content = True
+                    etag = etag or response.headers.get('ETag')
+                    if received and response.status_code != 206:
+                        # Full content sent: start over
+                        file_handle.seek(start)
+                        file_handle.truncate()
+                    shutil.copyfileobj(response.raw, file_handle, STREAM_COPY_SIZE)
+        
+        self._with_retry(_attempt, retry_on=STREAM_ERRORS)
+        written = file_handle.tell() - start
+        self._limiter.record_bytes(written)
+        return written
+    
+    def _download_ranges(self, file_id: str, file_path: Path, file_handle: BinaryIO, file_size: int) -> int:
+        """
+        Download a large file as parallel byte ranges written in place.
+        
+        The file is preallocated to its final size, then split into
+        CONFIG.gdrive.range_download_splits contiguous ranges that are fetched
+        concurrently with HTTP Range requests on alt=media. Each range worker
+        writes through its own file handle at its own offset.
+        
+        Args:
+            file_id (str): Google Drive file ID
+            file_path (Path): Destination file path
+            file_handle (BinaryIO): Open handle of the (new, empty) destination file
+            file_size (int): File size in bytes from the Drive metadata
+            
+        Returns:
+            int: Number of bytes received
+            
+        Raises:
+            _RangeNotSupported: If the server does not honour Range requests
+            Exception: If any range fails to download completely
+        """
+        url = f"{DRIVE_FILES_URL}/{file_id}?alt=media"
+        splits = max(1, CONFIG.gdrive.range_download_splits)
+        part_size = -(-file_size // splits)
+        ranges = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+        
+        # Preallocate so every range can be written at its offset
+        file_handle.truncate(file_size)
+        file_handle.flush()
+        
+        self.logger.debug(f"Downloading {file_path.name} as {len(ranges)} parallel ranges")
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="gdrive_range") as executor:
+            received = executor.map(lambda byte_range: self._download_range(url, file_path, *byte_range), ranges)
+            return sum(received)
+    
+    def _download_range(self, url: str, file_path: Path, start: int, end: int) -> int:
+        """
+        Fetch one byte range of a media URL and copy it into the file at its offset.
+        
+        A retry after an interrupted transfer requests only the rest of the range.
+        
+        Args:
+            url (str): alt=media URL of the file
+            file_path (Path): Preallocated destination file
+            start (int): First byte of the range
+            end (int): Last byte of the range (inclusive)
+            
+        Returns:
+            int: Number of bytes written
+            
+        Raises:
+            _RangeNotSupported: If the response is not 206 Partial Content
+            IOError: If fewer bytes than requested were received
+        """
+        session = self._get_media_session()
+        
+        with open(file_path, 'r+b') as file_handle:
+            file_handle.seek(start)
+            
+            def _attempt() -> None:
+                # A retry resumes after the bytes an earlier attempt wrote
+                offset = file_handle.tell()
+                if offset > end:
+                    return
+                with self._limiter.slot():
+                    # Byte offsets must refer to the stored file, so no content coding here
+                    headers = {'Range': f"bytes={offset}-{end}", 'Accept-Encoding': 'identity'}
+                    with session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+                        if response.status_code in (200, 416):
+                            raise _RangeNotSupported(f"HTTP {response.status_code} for range {offset}-{end}")
+                        _raise_for_media_status(response)
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(response.raw, file_handle, STREAM_COPY_SIZE)
+            
+            self._with_retry(_attempt, retry_on=STREAM_ERRORS)
+            written = file_handle.tell() - start
+        self._limiter.record_bytes(written)
+        
+        if written != end - start + 1:
+            raise IOError(f"Incomplete range {start}-{end}: received {written} bytes")
+        return written
+    
+    def list_files_in_folders(self, kinds: Optional[Sequence[str]] = None) -> List[Dict]:
         """
         List all files in the configured Google Drive folders.
         
         This method searches through all configured folders (root directory or
-        specific folder IDs) and retrieves file metadata including ID, name,
-        MIME type, size, and timestamps.
+        specific folder IDs) and retrieves the file metadata the downloader
+        uses (ID, name, size, creation time, and MIME type where needed).
         
         The search process:
-        1. Iterates through each configured folder ID
-        2. Queries Google Drive API for files in each folder
-        3. Retrieves file metadata (id, name, mimeType, size, createdTime, modifiedTime)
-        4. Logs detailed information about found files
-        5. Handles API errors gracefully and continues with other folders
+        1. Builds one query covering every configured folder ID
+           ("'a' in parents or 'b' in parents ...")
+        2. Follows nextPageToken until every page has been read
+        3. Retrieves only the metadata fields needed for the requested kinds
+           (see _list_fields), from My Drive only (spaces='drive', corpora='user')
+        4. Logs detailed information about found files, and per-folder counts
+        5. Handles API errors gracefully (returns no files)
+        
+        Files are returned in chronological order (by createdTime) across all
+        folders, sorted locally after the listing completes. When kinds are
+        given and CONFIG.gdrive.server_side_filter is enabled (it is off by
+        default, see _kind_query_clause), the query also restricts results
+        to likely files of those types, so non-matching files are never sent
+        over the wire.
+        
+        Args:
+            kinds (Optional[Sequence[str]]): Narrow the listing to these file
+                                            types ('audio', 'text', 'other').
+                                            Default: None (all files)
         
         Returns:
             List[Dict]: List of file metadata dictionaries, each containing:
                 - id: Google Drive file ID
                 - name: File name
-                - mimeType: MIME type of the file
                 - size: File size in bytes (if available)
                 - createdTime: File creation timestamp
-                - modifiedTime: File modification timestamp
+                - mimeType: MIME type of the file (only when kinds is None
+                  or includes 'text')
+                - parents: IDs of the file's parent folders (only when more
+                  than one folder is configured)
+                - _safe: Sanitized file name (precomputed for download_file)
+                - _ext: Lower-cased file extension (precomputed for the filters)
                 
         Note:
             Requires authentication before calling. Returns empty list if not authenticated.
@@ -234,44 +966,132 @@ class GoogleDriveDownloader:
             self.logger.error("Not authenticated. Call authenticate() first.")
             return []
         
-        all_files = []
+        # Configured folders, duplicates listed once
+        folder_ids = list(dict.fromkeys(CONFIG.gdrive.search_folders))
+        if not folder_ids:
+            self.logger.warning("No Google Drive folders configured")
+            return []
+        
+        folder_names = ", ".join(
+            "root directory" if folder_id == "root" else f"folder {folder_id}"
+            for folder_id in folder_ids
+        )
+        self.logger.info(f"Listing files in {folder_names}...")
+        
+        # One query for all folders: a single paginated listing instead of one per folder
+        parents_clause = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+        query = f"({parents_clause}) and trashed=false"
+        
+        # Let Drive drop files of other types
+        if kinds is not None and CONFIG.gdrive.server_side_filter:
+            kind_clause = " or ".join(clause for clause in map(_kind_query_clause, kinds) if clause)
+            if not kind_clause:
+                self.logger.info(f"No {'/'.join(kinds)} file types configured, skipping listing")
+                return []
+            query = f"({parents_clause}) and ({kind_clause}) and trashed=false"
+        
+        fields = _list_fields(kinds, with_parents=len(folder_ids) > 1)
+        try:
+            all_files = self._list_query(query, fields)
+        except HttpError as e:
+            self.logger.error(f"Error listing files in {folder_names}: {str(e)}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Unexpected error listing files in {folder_names}: {str(e)}")
+            return []
+        
+        # Each file once, even if pages shifted while the listing was paged
+        # through; the dict keeps first-seen order
+        all_files = list({file['id']: file for file in all_files}.values())
+        
+        # Chronological order (ascending creation time). Sorting here instead
+        # of with orderBy spares Drive a server-side sort; ISO 8601 timestamps
+        # sort correctly as strings, and createdTime is always requested.
+        all_files.sort(key=itemgetter('createdTime'))
+        
+        # Per-folder counts. Drive reports the root folder by its real ID, so
+        # files under an unrecognised parent are counted as root files.
+        if len(folder_ids) > 1:
+            counts = dict.fromkeys(folder_ids, 0)
+            fallback = "root" if "root" in counts else None
+            for file in all_files:
+                parent = next((p for p in file.get('parents', ()) if p in counts), fallback)
+                if parent is not None:
+                    counts[parent] += 1
+            for folder_id, count in counts.items():
+                folder_name = "root directory" if folder_id == "root" else f"folder {folder_id}"
+                self.logger.info(f"Found {count} files in {folder_name}")
         
-        for folder_id in CONFIG.gdrive.search_folders:
-            folder_name = "root directory" if folder_id == "root" else f"folder {folder_id}"
-            self.logger.info(f"Listing files in {folder_name}...")
+        self.logger.info(f"Total files found across all folders: {len(all_files)}")
+        return all_files
+    
+    def _list_page(self, query: str, fields: str, page_token: Optional[str]) -> Dict:
+        """
+        Fetch one page of a Drive files().list query.
+        
+        Args:
+            query (str): Drive search query (q parameter)
+            fields (str): Fields projection (see _list_fields)
+            page_token (Optional[str]): nextPageToken of the previous page, or None
             
-            try:
-                # Query for files in this folder
-                if folder_id == "root":
-                    query = "parents in 'root' and trashed=false"
-                else:
-                    query = f"parents in '{folder_id}' and trashed=false"
-                
-                results = self.service.files().list(
-                    q=query,
-                    pageSize=1000,
-                    orderBy="createdTime",  # Order files by creation time (ascending)
-                    fields="nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime)"
-                ).execute()
-                
-                files = results.get('files', [])
-                self.logger.info(f"Found {len(files)} files in {folder_name}")
-                
-                # Log file details
-                for file in files:
-                    self.logger.debug(f"File: {file['name']} (ID: {file['id']}, Size: {file.get('size', 'Unknown')})")
+        Returns:
+            Dict: Raw list response (files and optional nextPageToken)
+        """
+        request = self._get_service().files().list(
+            q=query,
+            pageSize=LIST_PAGE_SIZE,
+            pageToken=page_token,
+            fields=fields,
+            spaces='drive',
+            corpora='user'
+        )
+        return self._with_retry(request.execute)
+    
+    def _list_query(self, query: str, fields: str) -> List[Dict]:
+        """
+        Run a Drive files().list query across all result pages.
+        
+        Each file dictionary gets '_safe' (sanitized name) and '_ext'
+        (lower-cased extension) entries, so later stages do not recompute them.
+        
+        As soon as a page arrives, the request for the following page is
+        started on a background thread, so its round-trip overlaps the
+        processing of the current page.
+        
+        Args:
+            query (str): Drive search query (q parameter)
+            fields (str): Fields projection (see _list_fields)
+            
+        Returns:
+            List[Dict]: File metadata dictionaries from all pages, in order
+            
+        Raises:
+            HttpError: If any page request fails
+        """
+        files = []
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        splitext = os.path.splitext
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gdrive_list") as prefetcher:
+            response = self._list_page(query, fields, None)
+            while response is not None:
+                # Start fetching the next page before processing this one
+                page_token = response.get('nextPageToken')
+                future = prefetcher.submit(self._list_page, query, fields, page_token) if page_token else None
                 
-                all_files.extend(files)
+                page = response.get('files', [])
+                for file in page:
+                    # Derive the safe name and extension once per file
+                    name = file.get('name', '')
+                    file['_safe'] = sanitize_filename(name)
+                    file['_ext'] = splitext(name)[1].lower()
+                    # Log file details
+                    if debug_enabled:
+                        self.logger.debug(f"File: {name} (ID: {file['id']}, Size: {file.get('size', 'Unknown')})")
+                files.extend(page)
                 
-            except HttpError as e:
-                self.logger.error(f"Error listing files in {folder_name}: {str(e)}")
-                continue
-            except Exception as e:
-                self.logger.error(f"Unexpected error listing files in {folder_name}: {str(e)}")
-                continue
+                response = future.result() if future is not None else None
         
-        self.logger.info(f"Total files found across all folders: {len(all_files)}")
-        return all_files
+        return files
     
     def filter_audio_files(self, files: List[Dict]) -> List[Dict]:
         """
@@ -299,23 +1119,10 @@ class GoogleDriveDownloader:
                        
         Note:
             The allowed extensions are configured in CONFIG.gdrive.allowed_audio_extensions
-            and default to ['.mp3', '.m4a'].
+            (a frozenset of common audio extensions by default).
         """
         self.logger.info(f"Filtering files for audio extensions: {CONFIG.gdrive.allowed_audio_extensions}")
-        
-        audio_files = []
-        for file in files:
-            file_name = file.get('name', '')
-            file_ext = Path(file_name).suffix.lower()
-            
-            if file_ext in CONFIG.gdrive.allowed_audio_extensions:
-                audio_files.append(file)
-                self.logger.debug(f"Audio file found: {file_name}")
-            else:
-                self.logger.debug(f"Skipping non-audio file: {file_name} (extension: {file_ext})")
-        
-        self.logger.info(f"Found {len(audio_files)} audio files to download")
-        return audio_files
+        return self._filter_by_ext(files, CONFIG.gdrive.allowed_audio_extensions, 'audio')
     
     def filter_text_files(self, files: List[Dict]) -> List[Dict]:
         """
@@ -349,29 +1156,12 @@ class GoogleDriveDownloader:
         """
         self.logger.info(f"Filtering files for text extensions: {CONFIG.gdrive.allowed_text_extensions}")
         self.logger.info(f"Filtering files for Google Docs MIME types: {CONFIG.gdrive.google_docs_mime_types}")
-        
-        text_files = []
-        for file in files:
-            file_name = file.get('name', '')
-            file_ext = Path(file_name).suffix.lower()
-            mime_type = file.get('mimeType', '')
-            
-            # Check if it's a regular text file with allowed extension
-            is_text_file = file_ext in CONFIG.gdrive.allowed_text_extensions
-            # Check if it's a Google Docs file
-            is_google_doc = mime_type in CONFIG.gdrive.google_docs_mime_types
-            
-            if is_text_file or is_google_doc:
-                text_files.append(file)
-                if is_google_doc:
-                    self.logger.debug(f"Google Docs file found: {file_name} (MIME: {mime_type})")
-                else:
-                    self.logger.debug(f"Text file found: {file_name}")
-            else:
-                self.logger.debug(f"Skipping non-text file: {file_name} (extension: {file_ext}, MIME: {mime_type})")
-        
-        self.logger.info(f"Found {len(text_files)} text files to download")
-        return text_files
+        return self._filter_by_ext(
+            files,
+            CONFIG.gdrive.allowed_text_extensions,
+            'text',
+            mime_types=CONFIG.gdrive.google_docs_mime_types
+        )
     
     def filter_other_files(self, files: List[Dict]) -> List[Dict]:
         """
@@ -399,25 +1189,96 @@ class GoogleDriveDownloader:
                        
         Note:
             The allowed extensions are configured in CONFIG.gdrive.allowed_other_extensions
-            and default to [] (empty list).
+            and default to an empty set.
         """
         self.logger.info(f"Filtering files for other extensions: {CONFIG.gdrive.allowed_other_extensions}")
+        return self._filter_by_ext(files, CONFIG.gdrive.allowed_other_extensions, 'other')
+    
+    def _filter_by_ext(
+        self,
+        files: List[Dict],
+        extensions: FrozenSet[str],
+        label: str,
+        mime_types: FrozenSet[str] = frozenset()
+    ) -> List[Dict]:
+        """
+        Select files whose extension (or MIME type) is in the given sets.
+        
+        Extensions come from the '_ext' entry precomputed at listing time
+        (falling back to os.path.splitext), so no Path object is built per
+        file, and are matched against a hashed set. Per-file
+        debug messages are only formatted when DEBUG logging is enabled.
+        
+        Args:
+            files (List[Dict]): File metadata dictionaries to filter
+            extensions (FrozenSet[str]): Allowed extensions, including the dot
+            label (str): File type name used in log messages (e.g. 'audio')
+            mime_types (FrozenSet[str]): MIME types accepted regardless of extension
+            
+        Returns:
+            List[Dict]: Matching files, in their original order
+        """
+        # Match case-insensitively even if configured extensions are not lower case
+        ext_set = _extension_set(frozenset(extensions))
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        splitext = os.path.splitext
         
-        other_files = []
+        matched = []
         for file in files:
             file_name = file.get('name', '')
-            file_ext = Path(file_name).suffix.lower()
+            file_ext = file.get('_ext')
+            if file_ext is None:
+                file_ext = splitext(file_name)[1].lower()
             
-            if file_ext in CONFIG.gdrive.allowed_other_extensions:
-                other_files.append(file)
-                self.logger.debug(f"Other file found: {file_name}")
-            else:
-                self.logger.debug(f"Skipping non-other file: {file_name} (extension: {file_ext})")
+            if file_ext in ext_set or (mime_types and file.get('mimeType', '') in mime_types):
+                matched.append(file)
+                if debug_enabled:
+                    self.logger.debug(f"{label.capitalize()} file found: {file_name} (MIME: {file.get('mimeType', '')})")
+            elif debug_enabled:
+                self.logger.debug(f"Skipping non-{label} file: {file_name} (extension: {file_ext})")
+        
+        self.logger.info(f"Found {len(matched)} {label} files to download")
+        return matched
+    
+    def _split_by_type(self, files: List[Dict], kinds: Sequence[str]) -> Dict[str, List[Dict]]:
+        """
+        Sort listed files into per-type lists in a single pass.
+        
+        Applies the same rules as filter_audio_files, filter_text_files and
+        filter_other_files (a file matching several types is put in each),
+        but walks the listing once instead of once per type.
         
-        self.logger.info(f"Found {len(other_files)} other files to download")
-        return other_files
+        Args:
+            files (List[Dict]): File metadata dictionaries from list_files_in_folders()
+            kinds (Sequence[str]): File types to collect ('audio', 'text', 'other')
+            
+        Returns:
+            Dict[str, List[Dict]]: Matching files per requested type, in their original order
+        """
+        gdrive = CONFIG.gdrive
+        ext_sets = {
+            'audio': _extension_set(frozenset(gdrive.allowed_audio_extensions)),
+            'text': _extension_set(frozenset(gdrive.allowed_text_extensions)),
+            'other': _extension_set(frozenset(gdrive.allowed_other_extensions)),
+        }
+        checks = [(kind, ext_sets[kind]) for kind in kinds]
+        google_docs = gdrive.google_docs_mime_types if 'text' in kinds else frozenset()
+        splitext = os.path.splitext
+        
+        groups: Dict[str, List[Dict]] = {kind: [] for kind in kinds}
+        for file in files:
+            file_ext = file.get('_ext')
+            if file_ext is None:
+                file_ext = splitext(file.get('name', ''))[1].lower()
+            for kind, ext_set in checks:
+                if file_ext in ext_set or (kind == 'text' and file.get('mimeType', '') in google_docs):
+                    groups[kind].append(file)
+        
+        for kind in kinds:
+            self.logger.info(f"Found {len(groups[kind])} {kind} files to download")
+        return groups
     
-    def download_file(self, file_id: str, file_name: str, sequence_number: int = None, file_type: str = 'audio') -> bool:
+    def download_file(self, file_id: str, file_name: str, sequence_number: int = None, file_type: str = 'audio', file_size: Optional[int] = None, safe_filename: Optional[str] = None) -> bool:
         """
         Download a single file from Google Drive with progress tracking.
         
@@ -429,8 +1290,12 @@ class GoogleDriveDownloader:
         The download process:
         1. Sanitizes filename for filesystem safety
         2. Creates sequence-numbered subdirectory to maintain chronological order
-        3. Checks if file already exists (skips if found)
-        4. Downloads file with progress tracking
+        3. Creates the file exclusively (skips if it already exists), or a
+           temporary file to replace it with if its content changed in Google Drive
+        4. Downloads file in a single request when file_size shows it fits in
+           one chunk, as parallel byte ranges when file_size is
+           RANGE_DOWNLOAD_THRESHOLD or more, and otherwise as one streamed
+           response copied straight into the file
         5. Verifies download integrity
         6. Optionally deletes file from Google Drive if configured for the file type
         
@@ -439,6 +1304,8 @@ class GoogleDriveDownloader:
             file_name (str): Original name of the file (will be sanitized)
             sequence_number (int, optional): Sequence number for chronological ordering
             file_type (str): Type of file ('audio', 'text', or 'other'). Default: 'audio'
+            file_size (Optional[int]): File size in bytes from the Drive metadata, if known
+            safe_filename (Optional[str]): Already sanitized file name, if known
             
         Returns:
             bool: True if download successful, False otherwise
@@ -447,21 +1314,23 @@ class GoogleDriveDownloader:
             - Requires authentication before calling
             - Files are organized in sequence-numbered subdirectories for chronological ordering
             - Filenames are sanitized to prevent filesystem issues
-            - Existing files are skipped (not re-downloaded)
+            - Existing files are skipped (not re-downloaded) unless their
+              md5Checksum differs from the one recorded in the manifest
             - File deletion from Google Drive is optional and configurable per file type
         """
         if not self.service:
             self.logger.error("Not authenticated. Call authenticate() first.")
             return False
         
-        # Sanitize filename for filesystem safety
-        safe_filename = sanitize_filename(file_name)
+        # Sanitize filename for filesystem safety (unless done at listing time)
+        if safe_filename is None:
+            safe_filename = sanitize_filename(file_name)
         
         # Use sequence number for chronological ordering (files are already ordered by Google Drive API)
         if sequence_number is not None:
             # Create sequence-numbered subdirectory for chronological ordering
             sequence_dir = self.download_dir / f"{sequence_number:03d}_{file_id}"
-            self.logger.info(f"Using sequence number {sequence_number} for chronological ordering: {file_name}")
+            self.logger.info("Using sequence number %d for chronological ordering: %s", sequence_number, file_name)
         else:
             # Fallback to file ID only if no sequence number provided
             sequence_dir = self.download_dir / file_id
@@ -469,33 +1338,65 @@ class GoogleDriveDownloader:
         
         file_path = sequence_dir / safe_filename
         
-        # Check if file already exists
-        if file_path.exists():
-            self.logger.warning(f"File already exists, skipping: {sequence_dir.name}/{safe_filename}")
-            return True
-        
-        self.logger.info(f"Downloading: {file_name} -> {sequence_dir.name}/{safe_filename}")
-        
         try:
             # Ensure sequence directory exists
             ensure_directory(sequence_dir)
             
+            # Create the file; if it already exists (and is unchanged), skip it
+            file_handle, write_path = self._open_destination(file_id, file_path)
+            if file_handle is None:
+                self.logger.warning(f"File already exists, skipping: {sequence_dir.name}/{safe_filename}")
+                self._record_downloaded(file_id)
+                return True
+            
+            self.logger.info("Downloading: %s -> %s/%s", file_name, sequence_dir.name, safe_filename)
+            
             # Download the file
-            request = self.service.files().get_media(fileId=file_id)
+            request = self._get_service().files().get_media(fileId=file_id)
+            started = time.monotonic()
+            bytes_received = None
             
-            with open(file_path, 'wb') as file_handle:
-                downloader = MediaIoBaseDownload(file_handle, request)
-                done = False
-                
-                while done is False:
-                    status, done = downloader.next_chunk()
-                    if status:
-                        progress = int(status.progress() * 100)
-                        self.logger.debug(f"Download progress: {progress}%")
-            
-            # Verify download
-            if file_path.exists() and file_path.stat().st_size > 0:
-                self.logger.info(f"Successfully downloaded: {sequence_dir.name}/{safe_filename}")
+            try:
+                with file_handle:
+                    if (file_size is not None and file_size >= RANGE_DOWNLOAD_THRESHOLD
+                            and CONFIG.gdrive.range_download_splits > 1):
+                        try:
+                            bytes_received = self._download_ranges(file_id, write_path, file_handle, file_size)
+                        except _RangeNotSupported as e:
+                            self.logger.debug(f"Range download not supported ({e}), downloading {file_name} sequentially")
+                            file_handle.seek(0)
+                            file_handle.truncate()
+                    
+                    if bytes_received is None:
+                        if file_size is not None and file_size <= DOWNLOAD_CHUNK_SIZE:
+                            # Small file: one request, no chunk loop
+                            def _fetch() -> bytes:
+                                with self._limiter.slot():
+                                    return request.execute()
+                            
+                            content = self._with_retry(_fetch)
+                            self._limiter.record_bytes(len(content))
+                            file_handle.write(content)
+                            bytes_received = len(content)
+                        else:
+                            bytes_received = self._stream_media(file_id, file_handle)
+            except BaseException:
+                # Never leave a partial file behind: it would be skipped as existing next run
+                write_path.unlink(missing_ok=True)
+                raise
+            
+            elapsed = time.monotonic() - started
+            
+            # Verify download (byte count tracked while downloading, no stat needed)
+            if bytes_received > 0:
+                if write_path != file_path:
+                    os.replace(write_path, file_path)
+                self.logger.info(
+                    "Successfully downloaded: %s/%s (%d bytes in %.2fs)",
+                    sequence_dir.name, safe_filename, bytes_received, elapsed
+                )
+                self._record_downloaded(file_id)
+                self._notify_downloaded(file_path, file_type)
                 
                 # Delete from Google Drive if configured to do so for this file type
                 should_delete = False
@@ -507,28 +1408,23 @@ class GoogleDriveDownloader:
                     should_delete = True
                 
                 if should_delete:
-                    self.logger.debug(f"delete_{file_type}_from_src is enabled, deleting from Google Drive...")
-                    if self.delete_file_from_gdrive(file_id, file_name):
-                        self.logger.info(f"File deleted from Google Drive after successful download: {file_name}")
-                    else:
-                        self.logger.warning(f"Failed to delete file from Google Drive: {file_name}")
-                        # Note: We don't fail the download if deletion fails
+                    self.logger.debug("delete_%s_from_src is enabled, deleting from Google Drive...", file_type)
+                    self._delete_after_download(file_id, file_name)
                 
                 return True
             else:
                 self.logger.error(f"Download failed or file is empty: {sequence_dir.name}/{safe_filename}")
-                if file_path.exists():
-                    file_path.unlink()  # Remove empty file
+                write_path.unlink(missing_ok=True)  # Remove empty file
                 return False
                 
-        except HttpError as e:
+        except (HttpError, requests.HTTPError) as e:
             self.logger.error(f"HTTP error downloading {file_name}: {str(e)}")
             return False
         except Exception as e:
             self.logger.error(f"Error downloading {file_name}: {str(e)}")
             return False
     
-    def export_google_doc(self, file_id: str, file_name: str, sequence_number: int = None, mime_type: str = 'application/vnd.google-apps.document') -> bool:
+    def export_google_doc(self, file_id: str, file_name: str, sequence_number: int = None, mime_type: str = 'application/vnd.google-apps.document', safe_filename: Optional[str] = None) -> bool:
         """
         Export a Google Docs file to text format and save it locally.
         
@@ -539,7 +1435,8 @@ class GoogleDriveDownloader:
         The export process:
         1. Sanitizes filename for filesystem safety
         2. Creates sequence-numbered subdirectory for chronological ordering
-        3. Checks if file already exists (skips if found)
+        3. Creates the file exclusively (skips if it already exists), or a
+           temporary file to replace it with if its content changed in Google Drive
         4. Exports Google Doc to plain text using Google Drive API
         5. Saves exported content to local file
         6. Verifies export integrity
@@ -550,6 +1447,7 @@ class GoogleDriveDownloader:
             file_name (str): Original name of the Google Doc (will be sanitized)
             sequence_number (int, optional): Sequence number for chronological ordering
             mime_type (str): MIME type of the Google Doc. Default: 'application/vnd.google-apps.document'
+            safe_filename (Optional[str]): Already sanitized file name, if known
             
         Returns:
             bool: True if export successful, False otherwise
@@ -564,72 +1462,462 @@ class GoogleDriveDownloader:
             self.logger.error("Not authenticated. Call authenticate() first.")
             return False
         
-        # Sanitize filename and add .txt extension for exported content
-        safe_filename = sanitize_filename(file_name)
+        # Sanitize filename (unless done at listing time) and add .txt extension for exported content
+        if safe_filename is None:
+            safe_filename = sanitize_filename(file_name)
         if not safe_filename.endswith('.txt'):
             safe_filename += '.txt'
         
         # Use sequence number for chronological ordering
         if sequence_number is not None:
             sequence_dir = self.download_dir / f"{sequence_number:03d}_{file_id}"
-            self.logger.info(f"Using sequence number {sequence_number} for chronological ordering: {file_name}")
+            self.logger.info("Using sequence number %d for chronological ordering: %s", sequence_number, file_name)
         else:
             sequence_dir = self.download_dir / file_id
             self.logger.warning(f"No sequence number provided for {file_name}, using file ID only")
         
         file_path = sequence_dir / safe_filename
         
-        # Check if file already exists
-        if file_path.exists():
-            self.logger.warning(f"Exported file already exists, skipping: {sequence_dir.name}/{safe_filename}")
-            return True
-        
-        self.logger.info(f"Exporting Google Doc: {file_name} -> {sequence_dir.name}/{safe_filename}")
-        
         try:
             # Ensure sequence directory exists
             ensure_directory(sequence_dir)
             
+            # Create the file; if it already exists (and is unchanged), skip it
+            file_handle, write_path = self._open_destination(file_id, file_path)
+            if file_handle is None:
+                self.logger.warning(f"Exported file already exists, skipping: {sequence_dir.name}/{safe_filename}")
+                self._record_downloaded(file_id)
+                return True
+            
+            self.logger.info("Exporting Google Doc: %s -> %s/%s", file_name, sequence_dir.name, safe_filename)
+            
             # Export Google Doc to plain text
-            request = self.service.files().export_media(fileId=file_id, mimeType='text/plain')
+            started = time.monotonic()
             
-            with open(file_path, 'wb') as file_handle:
-                downloader = MediaIoBaseDownload(file_handle, request)
-                done = False
-                
-                while done is False:
-                    status, done = downloader.next_chunk()
-                    if status:
-                        progress = int(status.progress() * 100)
-                        self.logger.debug(f"Export progress: {progress}%")
-            
-            # Verify export
-            if file_path.exists() and file_path.stat().st_size > 0:
-                self.logger.info(f"Successfully exported Google Doc: {sequence_dir.name}/{safe_filename}")
+            try:
+                with file_handle:
+                    bytes_received = self._stream_media(file_id, file_handle, export_mime_type='text/plain')
+            except BaseException:
+                # Never leave a partial file behind: it would be skipped as existing next run
+                write_path.unlink(missing_ok=True)
+                raise
+            
+            elapsed = time.monotonic() - started
+            
+            # Verify export (byte count tracked while downloading, no stat needed)
+            if bytes_received > 0:
+                if write_path != file_path:
+                    os.replace(write_path, file_path)
+                self.logger.info(
+                    "Successfully exported Google Doc: %s/%s (%d bytes in %.2fs)",
+                    sequence_dir.name, safe_filename, bytes_received, elapsed
+                )
+                self._record_downloaded(file_id)
+                self._notify_downloaded(file_path, 'text')
                 
                 # Delete from Google Drive if configured to do so for text files
                 if CONFIG.gdrive.delete_text_from_src:
                     self.logger.debug("delete_text_from_src is enabled, deleting from Google Drive...")
-                    if self.delete_file_from_gdrive(file_id, file_name):
-                        self.logger.info(f"Google Doc deleted from Google Drive after successful export: {file_name}")
-                    else:
-                        self.logger.warning(f"Failed to delete Google Doc from Google Drive: {file_name}")
-                        # Note: We don't fail the export if deletion fails
+                    self._delete_after_download(file_id, file_name)
                 
                 return True
             else:
                 self.logger.error(f"Export failed or file is empty: {sequence_dir.name}/{safe_filename}")
-                if file_path.exists():
-                    file_path.unlink()  # Remove empty file
+                write_path.unlink(missing_ok=True)  # Remove empty file
                 return False
                 
-        except HttpError as e:
+        except (HttpError, requests.HTTPError) as e:
             self.logger.error(f"HTTP error exporting Google Doc {file_name}: {str(e)}")
             return False
         except Exception as e:
             self.logger.error(f"Error exporting Google Doc {file_name}: {str(e)}")
             return False
     
+    def _load_manifest(self) -> Dict[str, str]:
+        """
+        Read previously downloaded files from the manifest.
+        
+        Later lines for the same ID (a re-download after a content change)
+        replace earlier ones.
+        
+        Returns:
+            Dict[str, str]: md5Checksum recorded per downloaded Google Drive
+                           file ID ('' if none was recorded); empty if the
+                           manifest does not exist or cannot be read
+        """
+        done = {}
+        try:
+            with open(self._manifest_path, 'r', encoding='utf-8') as manifest:
+                for line in manifest:
+                    file_id, _, md5 = line.strip().partition(' ')
+                    if file_id:
+                        done[file_id] = md5
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Could not read download manifest {self._manifest_path}: {e}")
+        return done
+    
+    def _open_destination(self, file_id: str, file_path: Path) -> Tuple[Optional[BinaryIO], Path]:
+        """
+        Open the file a download or export is written to.
+        
+        New files are created exclusively at file_path. A file whose content
+        changed in Google Drive since it was recorded in the manifest is
+        written to a temporary file beside file_path instead, which the caller
+        moves over the old copy with os.replace() once the transfer succeeds.
+        
+        A destination directory removed since it was ensured (e.g. cleaned
+        up while watch mode runs) is created again.
+        
+        Args:
+            file_id (str): Google Drive file ID
+            file_path (Path): Final destination path
+            
+        Returns:
+            Tuple[Optional[BinaryIO], Path]: Open handle (None if file_path
+                                            exists and is up to date) and
+                                            the path being written
+        """
+        recorded = self._done_ids.get(file_id)
+        md5 = self._listed_md5.get(file_id)
+        replacing = bool(recorded and md5 and recorded != md5)
+        write_path = file_path.with_name(f".{file_path.name}.part") if replacing else file_path
+        if replacing:
+            self.logger.info(f"Content changed in Google Drive, replacing: {file_path.parent.name}/{file_path.name}")
+        
+        def _open() -> Optional[BinaryIO]:
+            if replacing:
+                return open(write_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE)
+            return _create_exclusive(write_path)
+        
+        try:
+            return _open(), write_path
+        except FileNotFoundError:
+            # Directory removed since ensure_directory() cached it: create it again
+            forget_directory(file_path.parent)
+            ensure_directory(file_path.parent)
+            return _open(), write_path
+    
+    def _already_downloaded(self, file: Dict) -> bool:
+        """
+        Check the manifest for a listed file, without any HTTP request.
+        
+        A recorded file counts as downloaded unless both the manifest and
+        the listing have a checksum and they differ (content changed in
+        Google Drive since the download).
+        
+        Args:
+            file (Dict): File metadata dictionary from list_files_in_folders()
+            
+        Returns:
+            bool: True if the file can be skipped
+        """
+        recorded = self._done_ids.get(file['id'])
+        if recorded is None:
+            return False
+        md5 = file.get('md5Checksum')
+        return not recorded or not md5 or recorded == md5
+    
+    def _record_downloaded(self, file_id: str) -> None:
+        """
+        Record a downloaded file in the in-memory index and the manifest file.
+        
+        The checksum comes from the listing of the current batch, if any.
+        
+        Args:
+            file_id (str): Google Drive file ID of the downloaded file
+        """
+        md5 = self._listed_md5.get(file_id, '')
+        with self._manifest_lock:
+            if self._done_ids.get(file_id) == md5:
+                return
+            self._done_ids[file_id] = md5
+            try:
+                with open(self._manifest_path, 'a', encoding='utf-8') as manifest:
+                    manifest.write(f"{file_id} {md5}\n" if md5 else file_id + '\n')
+            except OSError as e:
+                self.logger.warning(f"Could not update download manifest {self._manifest_path}: {e}")
+    
+    def _notify_downloaded(self, file_path: Path, file_type: str) -> None:
+        """
+        Pass a newly downloaded file to the on_file_downloaded callback, if any.
+        
+        Callback errors are logged and otherwise ignored; they never fail the download.
+        
+        Args:
+            file_path (Path): Local path of the downloaded file
+            file_type (str): Type of file ('audio', 'text', or 'other')
+        """
+        if self.on_file_downloaded is None:
+            return
+        try:
+            self.on_file_downloaded(file_path, file_type)
+        except Exception as e:
+            self.logger.warning(f"on_file_downloaded callback failed for {file_path}: {e}")
+    
+    def _delete_after_download(self, file_id: str, file_name: str) -> None:
+        """
+        Delete a successfully downloaded file from Google Drive.
+        
+        Inside a batch download the delete is handed to the background
+        delete worker, so the download thread can move on to the next file;
+        otherwise it happens immediately. A failed delete never fails the
+        download.
+        
+        Args:
+            file_id (str): Google Drive file ID of the file to delete
+            file_name (str): Name of the file (used for logging purposes only)
+        """
+        if self._queue_deletes:
+            self._delete_queue.put((file_id, file_name))
+            return
+        
+        if self.delete_file_from_gdrive(file_id, file_name):
+            self.logger.info(f"File deleted from Google Drive after successful download: {file_name}")
+        else:
+            self.logger.warning(f"Failed to delete file from Google Drive: {file_name}")
+            # Note: We don't fail the download if deletion fails
+    
+    def flush_deletes(self) -> None:
+        """
+        Wait until every queued Drive delete has been sent.
+        
+        Deletes queued during a batch download are sent in batch requests
+        of up to DRIVE_BATCH_SIZE by the background delete worker; this
+        blocks until the worker has processed all of them (and logged the
+        results). Returns immediately if nothing is queued.
+        """
+        if self._delete_thread is not None:
+            self._delete_queue.join()
+    
+    def _start_delete_worker(self) -> None:
+        """Start the background delete worker thread if it is not running."""
+        with self._delete_thread_lock:
+            if self._delete_thread is None:
+                self._delete_thread = threading.Thread(
+                    target=self._delete_worker,
+                    name="gdrive_delete",
+                    daemon=True
+                )
+                self._delete_thread.start()
+    
+    def _delete_worker(self) -> None:
+        """
+        Drain the delete queue, sending up to DRIVE_BATCH_SIZE deletes per batch request.
+        
+        Blocks for the first queued delete, then takes whatever else is
+        already waiting (up to a full batch) without blocking. Runs until a
+        None sentinel is queued by close().
+        """
+        while True:
+            item = self._delete_queue.get()
+            items = []
+            stop = item is None
+            if not stop:
+                items.append(item)
+            while not stop and len(items) < DRIVE_BATCH_SIZE:
+                try:
+                    item = self._delete_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    items.append(item)
+            
+            try:
+                if items:
+                    deleted = self.delete_files_from_gdrive(items)
+                    if deleted < len(items):
+                        # Note: We don't fail the downloads if deletion fails
+                        self.logger.warning(f"Failed to delete {len(items) - deleted} file(s) from Google Drive")
+            except Exception as e:
+                self.logger.error(f"Error deleting files from Google Drive: {str(e)}")
+            finally:
+                for _ in range(len(items) + stop):
+                    self._delete_queue.task_done()
+            
+            if stop:
+                return
+    
+    def _download_one(self, file: Dict, sequence_number: int, total_files: int, file_type: str) -> bool:
+        """
+        Download (or export) a single file as part of a batch.
+        
+        Google Docs files among text files are exported to plain text; every
+        other file is downloaded as-is.
+        
+        Args:
+            file (Dict): File metadata dictionary from list_files_in_folders()
+            sequence_number (int): Chronological position of the file in the batch
+            total_files (int): Number of files in the batch (for logging)
+            file_type (str): Type of file ('audio', 'text', or 'other')
+            
+        Returns:
+            bool: True if the file was downloaded or exported successfully
+        """
+        file_id = file['id']
+        file_name = file['name']
+        mime_type = file.get('mimeType', '')
+        
+        self._ensure_fresh_token()
+        
+        self.logger.info(
+            "Processing %s file %d/%d (chronological order): %s",
+            file_type, sequence_number, total_files, file_name
+        )
+        
+        # Check if it's a Google Docs file that needs to be exported
+        if file_type == 'text' and mime_type in CONFIG.gdrive.google_docs_mime_types:
+            self.logger.info("Exporting Google Doc: %s (MIME: %s)", file_name, mime_type)
+            if self.export_google_doc(file_id, file_name, sequence_number=sequence_number, mime_type=mime_type,
+                                      safe_filename=file.get('_safe')):
+                return True
+            self.logger.error(f"Failed to export Google Doc: {file_name}")
+            return False
+        
+        size = file.get('size')
+        file_size = int(size) if size is not None else None
+        
+        if self.download_file(file_id, file_name, sequence_number=sequence_number, file_type=file_type,
+                              file_size=file_size, safe_filename=file.get('_safe')):
+            return True
+        self.logger.error(f"Failed to download: {file_name}")
+        return False
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the download worker pool, creating it on first use.
+        
+        One pool serves every batch of this downloader, so worker threads,
+        their per-thread Drive services and their keep-alive connections are
+        reused from the audio batch to the text and other batches.
+        
+        Returns:
+            ThreadPoolExecutor: Pool with CONFIG.gdrive.max_concurrent_downloads workers
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, self._limiter.maximum),
+                thread_name_prefix="gdrive_download"
+            )
+        return self._executor
+    
+    def _download_batches(self, batches: Dict[str, List[Dict]]) -> Dict[str, int]:
+        """
+        Download several per-type batches of files concurrently.
+        
+        All batches share the same worker pool and concurrency budget, so
+        audio, text and other downloads run side by side. Within each batch
+        sequence numbers are assigned up front from the list order, so the
+        chronological directory naming is the same as for a serial download
+        even though files complete in any order. Files recorded in the
+        download manifest are skipped (and counted as successful) before
+        anything is submitted, unless their md5Checksum changed. The pool has up to
+        CONFIG.gdrive.max_concurrent_downloads workers; how many of them
+        transfer at once is governed by the adaptive concurrency limiter,
+        whose learned limit is saved for the next run. Deletes requested
+        during the batches are sent in batch requests by a background
+        worker while downloads continue; this method waits for them before
+        returning.
+        
+        Args:
+            batches (Dict[str, List[Dict]]): File metadata dictionaries in
+                                            chronological order, per file type
+            
+        Returns:
+            Dict[str, int]: Number of files downloaded successfully, per file type
+            
+        Note:
+            Names of files that failed are appended to self.failed_files.
+        """
+        successful = dict.fromkeys(batches, 0)
+        
+        self._start_delete_worker()
+        self._queue_deletes = True
+        
+        executor = self._get_executor()
+        futures = {}
+        for file_type, files in batches.items():
+            total_files = len(files)
+            
+            # Number every file first so skipping does not shift sequence numbers
+            pending = [
+                (sequence_number, file)
+                for sequence_number, file in enumerate(files, 1)
+                if not self._already_downloaded(file)
+            ]
+            for _, file in pending:
+                md5 = file.get('md5Checksum')
+                if md5:
+                    self._listed_md5[file['id']] = md5
+            already_downloaded = total_files - len(pending)
+            if already_downloaded:
+                self.logger.info(f"Skipping {already_downloaded} {file_type} files already downloaded")
+            successful[file_type] = already_downloaded
+            
+            if pending:
+                self.logger.debug(
+                    f"Downloading {len(pending)} {file_type} files "
+                    f"(concurrency limit {self._limiter.limit})"
+                )
+            for sequence_number, file in pending:
+                future = executor.submit(self._download_one, file, sequence_number, total_files, file_type)
+                futures[future] = (file_type, file)
+        
+        try:
+            for future in as_completed(futures):
+                file_type, file = futures[future]
+                try:
+                    if future.result():
+                        successful[file_type] += 1
+                        continue
+                except Exception as e:
+                    self.logger.error(f"Error downloading {file.get('name', '')}: {e}")
+                self.failed_files.append(file.get('name', file['id']))
+        finally:
+            self._queue_deletes = False
+            # Let the delete worker finish so its results are logged before returning
+            self.flush_deletes()
+        
+        if futures:
+            self._limiter.save(self._concurrency_state_path)
+        
+        return successful
+    
+    def _download_kinds(self, kinds: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """
+        List, classify and download files of the given types in one pass.
+        
+        The configured folders are listed once for all requested types, the
+        listing is split by type in a single loop, and every type's files
+        are downloaded through one shared batch.
+        
+        Args:
+            kinds (Sequence[str]): File types to download ('audio', 'text', 'other')
+            
+        Returns:
+            Dict[str, Tuple[int, int]]: (successful_downloads, total_files) per requested type
+        """
+        results = {kind: (0, 0) for kind in kinds}
+        
+        # List files of the requested types from configured folders (narrowed server-side)
+        all_files = self.list_files_in_folders(kinds=kinds)
+        if not all_files:
+            self.logger.warning("No files found in configured Google Drive folders")
+            return results
+        
+        groups = self._split_by_type(all_files, kinds)
+        for kind in kinds:
+            if not groups[kind]:
+                self.logger.warning(f"No {kind} files found in configured Google Drive folders")
+        
+        successful = self._download_batches({kind: files for kind, files in groups.items() if files})
+        for kind, files in groups.items():
+            results[kind] = (successful.get(kind, 0), len(files))
+        return results
+    
     def download_all_audio_files(self) -> Tuple[int, int]:
         """
         Download all audio files from configured Google Drive folders.
@@ -639,9 +1927,9 @@ class GoogleDriveDownloader:
         from all configured Google Drive folders.
         
         The process follows these steps:
-        1. Lists all files in configured folders
-        2. Filters files to include only audio files (.mp3, .m4a)
-        3. Downloads each audio file individually
+        1. Lists audio files in configured folders
+        2. Filters files to include only audio files (allowed extensions)
+        3. Downloads the audio files concurrently
         4. Tracks successful and failed downloads
         5. Reports comprehensive results
         
@@ -654,36 +1942,11 @@ class GoogleDriveDownloader:
             - Returns (0, 0) if no files are found in any configured folders
             - Returns (0, 0) if no audio files are found among the files
             - Requires authentication before calling
-            - Each file is downloaded to its own UUID-based subdirectory
+            - Each file is downloaded to its own sequence-numbered subdirectory
         """
         self.logger.info("Starting download of all audio files from configured Google Drive folders...")
         
-        # List all files from configured folders
-        all_files = self.list_files_in_folders()
-        if not all_files:
-            self.logger.warning("No files found in configured Google Drive folders")
-            return 0, 0
-        
-        # Filter for audio files
-        audio_files = self.filter_audio_files(all_files)
-        if not audio_files:
-            self.logger.warning("No audio files found in configured Google Drive folders")
-            return 0, 0
-        
-        # Download each file in chronological order (files are already ordered by Google Drive API)
-        successful_downloads = 0
-        total_files = len(audio_files)
-        
-        for i, file in enumerate(audio_files, 1):
-            file_id = file['id']
-            file_name = file['name']
-            
-            self.logger.info(f"Downloading file {i}/{total_files} (chronological order): {file_name}")
-            
-            if self.download_file(file_id, file_name, sequence_number=i):
-                successful_downloads += 1
-            else:
-                self.logger.error(f"Failed to download: {file_name}")
+        successful_downloads, total_files = self._download_kinds(('audio',))['audio']
         
         self.logger.info(f"Download complete: {successful_downloads}/{total_files} files downloaded successfully")
         return successful_downloads, total_files
@@ -697,9 +1960,9 @@ class GoogleDriveDownloader:
         from all configured Google Drive folders.
         
         The process follows these steps:
-        1. Lists all files in configured folders
-        2. Filters files to include only text files (.txt, .docx, .pdf)
-        3. Downloads each text file individually
+        1. Lists text files in configured folders
+        2. Filters files to include only text files (.txt, .docx, .pdf, Google Docs)
+        3. Downloads the text files concurrently (exporting Google Docs)
         4. Tracks successful and failed downloads
         5. Reports comprehensive results
         
@@ -716,42 +1979,7 @@ class GoogleDriveDownloader:
         """
         self.logger.info("Starting download of all text files from configured Google Drive folders...")
         
-        # List all files from configured folders
-        all_files = self.list_files_in_folders()
-        if not all_files:
-            self.logger.warning("No files found in configured Google Drive folders")
-            return 0, 0
-        
-        # Filter for text files
-        text_files = self.filter_text_files(all_files)
-        if not text_files:
-            self.logger.warning("No text files found in configured Google Drive folders")
-            return 0, 0
-        
-        # Download each file in chronological order (files are already ordered by Google Drive API)
-        successful_downloads = 0
-        total_files = len(text_files)
-        
-        for i, file in enumerate(text_files, 1):
-            file_id = file['id']
-            file_name = file['name']
-            mime_type = file.get('mimeType', '')
-            
-            self.logger.info(f"Processing text file {i}/{total_files} (chronological order): {file_name}")
-            
-            # Check if it's a Google Docs file that needs to be exported
-            if mime_type in CONFIG.gdrive.google_docs_mime_types:
-                self.logger.info(f"Exporting Google Doc: {file_name} (MIME: {mime_type})")
-                if self.export_google_doc(file_id, file_name, sequence_number=i, mime_type=mime_type):
-                    successful_downloads += 1
-                else:
-                    self.logger.error(f"Failed to export Google Doc: {file_name}")
-            else:
-                # Regular text file download
-                if self.download_file(file_id, file_name, sequence_number=i, file_type='text'):
-                    successful_downloads += 1
-                else:
-                    self.logger.error(f"Failed to download: {file_name}")
+        successful_downloads, total_files = self._download_kinds(('text',))['text']
         
         self.logger.info(f"Text file processing complete: {successful_downloads}/{total_files} files processed successfully")
         return successful_downloads, total_files
@@ -765,9 +1993,9 @@ class GoogleDriveDownloader:
         from all configured Google Drive folders.
         
         The process follows these steps:
-        1. Lists all files in configured folders
+        1. Lists other files in configured folders
         2. Filters files to include only other files (configured extensions)
-        3. Downloads each other file individually
+        3. Downloads the other files concurrently
         4. Tracks successful and failed downloads
         5. Reports comprehensive results
         
@@ -784,32 +2012,7 @@ class GoogleDriveDownloader:
         """
         self.logger.info("Starting download of all other files from configured Google Drive folders...")
         
-        # List all files from configured folders
-        all_files = self.list_files_in_folders()
-        if not all_files:
-            self.logger.warning("No files found in configured Google Drive folders")
-            return 0, 0
-        
-        # Filter for other files
-        other_files = self.filter_other_files(all_files)
-        if not other_files:
-            self.logger.warning("No other files found in configured Google Drive folders")
-            return 0, 0
-        
-        # Download each file in chronological order (files are already ordered by Google Drive API)
-        successful_downloads = 0
-        total_files = len(other_files)
-        
-        for i, file in enumerate(other_files, 1):
-            file_id = file['id']
-            file_name = file['name']
-            
-            self.logger.info(f"Downloading other file {i}/{total_files} (chronological order): {file_name}")
-            
-            if self.download_file(file_id, file_name, sequence_number=i, file_type='other'):
-                successful_downloads += 1
-            else:
-                self.logger.error(f"Failed to download: {file_name}")
+        successful_downloads, total_files = self._download_kinds(('other',))['other']
         
         self.logger.info(f"Other file download complete: {successful_downloads}/{total_files} files downloaded successfully")
         return successful_downloads, total_files
@@ -820,13 +2023,13 @@ class GoogleDriveDownloader:
         
         This is the main orchestrator method for downloading files. It allows selective
         downloading of different file types (audio, text, other) based on the provided
-        flags. Each file type is processed independently with its own filtering and
-        download logic.
+        flags. The configured folders are listed once for all selected types, and the
+        files of every selected type are downloaded together under one concurrency budget.
         
         The process:
-        1. Downloads audio files if download_audio is True
-        2. Downloads text files if download_text is True
-        3. Downloads other files if download_other is True
+        1. Lists files of the selected types in one (paginated) listing
+        2. Splits the listing into audio, text and other files in a single pass
+        3. Downloads all selected files through one shared worker pool
         4. Returns comprehensive statistics for all file types
         
         Args:
@@ -841,72 +2044,41 @@ class GoogleDriveDownloader:
                                       
         Note:
             - Requires authentication before calling
-            - Each file type is processed independently
             - Returns empty results for skipped file types
             - All files are organized in sequence-numbered subdirectories
         """
         self.logger.info("Starting comprehensive file download from configured Google Drive folders...")
         self.logger.info(f"Download settings - Audio: {download_audio}, Text: {download_text}, Other: {download_other}")
         
-        results = {}
+        enabled = {'audio': download_audio, 'text': download_text, 'other': download_other}
+        kinds = tuple(kind for kind in FILE_TYPES if enabled[kind])
+        for kind in FILE_TYPES:
+            if not enabled[kind]:
+                self.logger.info(f"Skipping {kind} files (download_{kind}=False)")
         
-        # Download audio files
-        if download_audio:
-            self.logger.info("=" * 40)
-            self.logger.info("DOWNLOADING AUDIO FILES")
-            self.logger.info("=" * 40)
-            try:
-                audio_successful, audio_total = self.download_all_audio_files()
-                results['audio'] = (audio_successful, audio_total)
-            except Exception as e:
-                self.logger.error(f"Error downloading audio files: {e}")
-                results['audio'] = (0, 0)
-        else:
-            self.logger.info("Skipping audio files (download_audio=False)")
-            results['audio'] = (0, 0)
-        
-        # Download text files
-        if download_text:
-            self.logger.info("=" * 40)
-            self.logger.info("DOWNLOADING TEXT FILES")
-            self.logger.info("=" * 40)
-            try:
-                text_successful, text_total = self.download_all_text_files()
-                results['text'] = (text_successful, text_total)
-            except Exception as e:
-                self.logger.error(f"Error downloading text files: {e}")
-                results['text'] = (0, 0)
-        else:
-            self.logger.info("Skipping text files (download_text=False)")
-            results['text'] = (0, 0)
-        
-        # Download other files
-        if download_other:
-            self.logger.info("=" * 40)
-            self.logger.info("DOWNLOADING OTHER FILES")
-            self.logger.info("=" * 40)
+        results = {kind: (0, 0) for kind in FILE_TYPES}
+        
+        if kinds:
+            self.logger.info(BANNER)
+            self.logger.info(f"DOWNLOADING {'/'.join(kinds).upper()} FILES")
+            self.logger.info(BANNER)
             try:
-                other_successful, other_total = self.download_all_other_files()
-                results['other'] = (other_successful, other_total)
+                results.update(self._download_kinds(kinds))
             except Exception as e:
-                self.logger.error(f"Error downloading other files: {e}")
-                results['other'] = (0, 0)
-        else:
-            self.logger.info("Skipping other files (download_other=False)")
-            results['other'] = (0, 0)
+                self.logger.error(f"Error downloading files: {e}")
         
         # Summary
         total_successful = sum(successful for successful, _ in results.values())
         total_files = sum(total for _, total in results.values())
         
-        self.logger.info("=" * 60)
+        self.logger.info(BANNER_WIDE)
         self.logger.info("DOWNLOAD SUMMARY")
-        self.logger.info("=" * 60)
+        self.logger.info(BANNER_WIDE)
         self.logger.info(f"Audio files: {results['audio'][0]}/{results['audio'][1]} downloaded")
         self.logger.info(f"Text files: {results['text'][0]}/{results['text'][1]} downloaded")
         self.logger.info(f"Other files: {results['other'][0]}/{results['other'][1]} downloaded")
         self.logger.info(f"Total: {total_successful}/{total_files} files downloaded successfully")
-        self.logger.info("=" * 60)
+        self.logger.info(BANNER_WIDE)
         
         return results
     
@@ -939,7 +2111,7 @@ class GoogleDriveDownloader:
         
         try:
             # Delete the file
-            self.service.files().delete(fileId=file_id).execute()
+            self._with_retry(self._get_service().files().delete(fileId=file_id).execute)
             self.logger.info(f"Successfully deleted from Google Drive: {file_name}")
             return True
             
@@ -950,6 +2122,95 @@ class GoogleDriveDownloader:
             self.logger.error(f"Error deleting {file_name}: {str(e)}")
             return False
     
+    def delete_files_from_gdrive(self, files: List[Tuple[str, str]]) -> int:
+        """
+        Delete several files from Google Drive using batch requests.
+        
+        Deletes are sent in groups of up to DRIVE_BATCH_SIZE per HTTP call
+        (batch/drive/v3) instead of one round-trip per file. Each sub-request
+        succeeds or fails on its own; sub-requests that fail with a transient
+        error (429, 5xx, rate-limit 403) are re-batched after a backoff.
+        
+        Args:
+            files (List[Tuple[str, str]]): (file_id, file_name) pairs to delete;
+                                          names are used for logging only
+            
+        Returns:
+            int: Number of files deleted successfully
+            
+        Note:
+            - Requires authentication before calling
+            - This is a permanent operation - deleted files cannot be recovered
+        """
+        if not self.service:
+            self.logger.error("Not authenticated. Call authenticate() first.")
+            return 0
+        
+        names = dict(files)
+        deleted = 0
+        retry_ids: List[str] = []
+        
+        def _on_response(request_id: str, response: Any, exception: Exception) -> None:
+            nonlocal deleted
+            file_name = names.get(request_id, request_id)
+            if exception is None:
+                deleted += 1
+                self.logger.info(f"Successfully deleted from Google Drive: {file_name}")
+            elif isinstance(exception, HttpError) and _is_retryable_error(exception) and attempt < MAX_RETRIES:
+                retry_ids.append(request_id)
+            else:
+                self.logger.error(f"HTTP error deleting {file_name}: {str(exception)}")
+        
+        service = self._get_service()
+        file_ids = list(names)
+        for attempt in range(MAX_RETRIES + 1):
+            for start in range(0, len(file_ids), DRIVE_BATCH_SIZE):
+                chunk = file_ids[start:start + DRIVE_BATCH_SIZE]
+                self.logger.info(f"Deleting {len(chunk)} file(s) from Google Drive in one batch request")
+                batch = service.new_batch_http_request(callback=_on_response)
+                for file_id in chunk:
+                    batch.add(service.files().delete(fileId=file_id), request_id=file_id)
+                try:
+                    self._rate_limiter.acquire()
+                    batch.execute()
+                except Exception as e:
+                    self.logger.error(f"Error sending batch delete request: {str(e)}")
+            
+            if not retry_ids:
+                break
+            file_ids, retry_ids = retry_ids, []
+            self._limiter.on_rate_limited()
+            delay = min(2 ** attempt + random.random() * 0.5, MAX_BACKOFF_SECONDS)
+            self.logger.warning(
+                f"{len(file_ids)} delete(s) hit a transient error, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{MAX_RETRIES})"
+            )
+            time.sleep(delay)
+        
+        return deleted
+    
+    def close(self) -> None:
+        """
+        Stop the download and delete workers and close pooled HTTP connections.
+        
+        Safe to call multiple times; the downloader recreates its workers
+        if it is used again afterwards.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        with self._delete_thread_lock:
+            if self._delete_thread is not None:
+                self._delete_queue.put(None)
+                self._delete_thread.join()
+                self._delete_thread = None
+        
+        with self._media_session_lock:
+            if self._media_session is not None:
+                self._media_session.close()
+                self._media_session = None
+    
     def cleanup_credentials(self) -> None:
         """
         Remove stored credentials file for security purposes.
@@ -970,6 +2231,12 @@ class GoogleDriveDownloader:
             - Typically called with --cleanup command-line flag
             - Safe to call multiple times (no error if file doesn't exist)
         """
+        # Queued deletes still need the credentials
+        self.flush_deletes()
+        
+        GoogleDriveDownloader._shared_credentials = None
+        GoogleDriveDownloader._last_token_json = None
+        
         if self.token_path.exists():
             self.logger.debug("Cleaning up credentials file...")
             self.token_path.unlink()
@@ -2,7 +2,9 @@
 Module-specific logging helper for dl_src_gdrive package.
 
 This module provides a ready-to-use logger for the dl_src_gdrive package,
-following the universal logging configuration pattern.
+following the universal logging configuration pattern. The module logger's
+console and file output is written by a background thread (QueueListener),
+so download workers never wait on log I/O.
 
 Usage:
     from .gdrive_logging import logger
@@ -14,13 +16,14 @@ Usage:
     custom_logger = get_logger("gdrive_downloader.custom_module")
 """
 
-from common.logging_utils.logging_config import get_logger as _get_logger
+from common.logging_utils.logging_config import enable_queue_logging, get_logger as _get_logger
 
 # Module logger name
 MODULE_LOGGER_NAME = "gdrive_downloader"
 
-# Create the module logger
+# Create the module logger, with handler I/O moved off the calling threads
 logger = _get_logger(MODULE_LOGGER_NAME)
+enable_queue_logging(logger)
 
 # Export the get_logger function for custom loggers
 def get_logger(logger_name: str = None, **kwargs):
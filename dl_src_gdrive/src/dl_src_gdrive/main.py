@@ -30,18 +30,25 @@ Version: 1.0.0
 import argparse
 import sys
 from pathlib import Path
+from typing import Callable, Optional
 
 from .dl_gdrive_core.dl_src_gdrive import GoogleDriveDownloader
 from common.logging_utils.logging_config import get_logger, set_console_level
+from common.utils.phase_stats import PhaseStats
 from dl_src_gdrive.config.dl_src_gdrive_config import CONFIG
 
 
+# Separator line framing the start and end banners
+BANNER = "=" * 60
+
+
 def main() -> int:
     """
     Main entry point for the Google Drive audio file downloader.
     
-    This function handles command-line argument parsing, logger initialization,
-    Google Drive authentication, file downloading, and result reporting.
+    This function handles command-line argument parsing and logger
+    initialization, then hands over to download_files() for Google Drive
+    authentication, file downloading, and result reporting.
     
     The process follows these steps:
     1. Parse command-line arguments (--debug, --cleanup, --delete-from-gdrive)
@@ -158,14 +165,47 @@ Examples:
         CONFIG.gdrive.delete_other_from_src = True
         logger.info("Delete all files from Google Drive enabled via legacy --delete-from-gdrive argument")
     
-    # Determine which file types to download
-    download_audio = not args.skip_audio
-    download_text = not args.skip_text
-    download_other = not args.skip_other
+    stats = download_files(
+        download_audio=not args.skip_audio,
+        download_text=not args.skip_text,
+        download_other=not args.skip_other,
+        cleanup=args.cleanup
+    )
+    return 0 if stats.ok else 1
+
+
+def download_files(
+    download_audio: bool = True,
+    download_text: bool = True,
+    download_other: bool = True,
+    cleanup: bool = False,
+    on_file_downloaded: Optional[Callable[[Path, str], None]] = None
+) -> PhaseStats:
+    """
+    Authenticate with Google Drive and download all configured files.
+    
+    This is the programmatic entry point behind main(): it takes the
+    options as arguments instead of parsing sys.argv, so other modules
+    (such as the pipeline orchestrator) can call it directly.
+    
+    Args:
+        download_audio (bool): Download audio files. Default: True
+        download_text (bool): Download text files. Default: True
+        download_other (bool): Download other files. Default: True
+        cleanup (bool): Remove stored credentials afterwards. Default: False
+        on_file_downloaded (Optional[Callable[[Path, str], None]]): Called
+            with the local path and file type of each file as soon as it
+            has been downloaded (see GoogleDriveDownloader)
+    
+    Returns:
+        PhaseStats: Files downloaded and attempted, with the names of the
+                    files that failed; error is set if the run stopped early
+    """
+    logger = get_logger('gdrive_downloader')
     
-    logger.info("=" * 60)
+    logger.info(BANNER)
     logger.info("Google Drive File Downloader")
-    logger.info("=" * 60)
+    logger.info(BANNER)
     logger.info(f"Search folders: {CONFIG.gdrive.search_folders}")
     logger.info(f"Download audio files: {download_audio}")
     logger.info(f"Download text files: {download_text}")
@@ -173,24 +213,24 @@ Examples:
     logger.info(f"Delete audio from source: {CONFIG.gdrive.delete_audio_from_src}")
     logger.info(f"Delete text from source: {CONFIG.gdrive.delete_text_from_src}")
     logger.info(f"Delete other from source: {CONFIG.gdrive.delete_other_from_src}")
-    logger.info("=" * 60)
+    logger.info(BANNER)
     
     try:
         # Initialize downloader
         logger.info("Initializing Google Drive downloader...")
         try:
-            downloader = GoogleDriveDownloader()
+            downloader = GoogleDriveDownloader(on_file_downloaded=on_file_downloaded)
         except FileNotFoundError as e:
             logger.error(f"Configuration error: {e}")
             logger.error("Please check that all required files exist and paths are correct.")
-            return 1
+            return PhaseStats(error=f"Configuration error: {e}")
         except ValueError as e:
             logger.error(f"Configuration error: {e}")
             logger.error("Please check your configuration settings.")
-            return 1
+            return PhaseStats(error=f"Configuration error: {e}")
         except Exception as e:
             logger.error(f"Failed to initialize downloader: {e}")
-            return 1
+            return PhaseStats(error=f"Failed to initialize downloader: {e}")
         
         # Authenticate with Google Drive
         logger.info("Step 1: Authenticating with Google Drive...")
@@ -198,11 +238,11 @@ Examples:
             if not downloader.authenticate():
                 logger.error("Authentication failed. Please check your client secret file and internet connection.")
                 logger.error("Make sure the client_secret.json file is valid and you have granted necessary permissions.")
-                return 1
+                return PhaseStats(error="Authentication failed")
         except Exception as e:
             logger.error(f"Authentication error: {e}")
             logger.error("Please check your Google Drive API credentials and network connection.")
-            return 1
+            return PhaseStats(error=f"Authentication error: {e}")
         
         # Download all files based on configuration
         logger.info("Step 2: Downloading files...")
@@ -215,7 +255,9 @@ Examples:
         except Exception as e:
             logger.error(f"Download error: {e}")
             logger.error("Please check your Google Drive permissions and network connection.")
-            return 1
+            return PhaseStats(failed=list(downloader.failed_files), error=f"Download error: {e}")
+        finally:
+            downloader.close()
         
         # Report results
         total_successful = sum(successful for successful, _ in results.values())
@@ -232,7 +274,7 @@ Examples:
                 logger.warning("Some files failed to download. Check the logs for details.")
         
         # Cleanup credentials if requested
-        if args.cleanup:
+        if cleanup:
             logger.info("Step 3: Cleaning up credentials...")
             try:
                 downloader.cleanup_credentials()
@@ -240,19 +282,23 @@ Examples:
             except Exception as e:
                 logger.warning(f"Failed to cleanup credentials: {e}")
         
-        logger.info("=" * 60)
+        logger.info(BANNER)
         logger.info("Download process completed")
-        logger.info("=" * 60)
+        logger.info(BANNER)
         
-        return 0 if total_successful == total_files else 1
+        return PhaseStats(
+            success=total_successful,
+            total=total_files,
+            failed=list(downloader.failed_files)
+        )
         
     except KeyboardInterrupt:
         logger.info("\nDownload interrupted by user")
-        return 1
+        return PhaseStats(error="Download interrupted by user")
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         logger.error("Please check the logs for more details and ensure all dependencies are installed.")
-        return 1
+        return PhaseStats(error=f"Unexpected error: {e}")
 
 
 if __name__ == '__main__':
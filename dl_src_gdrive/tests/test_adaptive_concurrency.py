@@ -0,0 +1,67 @@
+"""
+Unit tests for the adaptive concurrency limiter.
+
+These tests drive the limiter with a fake clock and synthetic throughput:
+noise around a constant throughput must not ratchet the limit up, a
+throughput that saturates must settle near the saturation point, and a
+rate-limit response must halve the limit.
+"""
+
+import random
+
+from dl_src_gdrive.src.dl_src_gdrive.dl_gdrive_core import adaptive_concurrency
+from dl_src_gdrive.src.dl_src_gdrive.dl_gdrive_core.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+class _Clock:
+    """Stands in for the time module; advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _run_windows(monkeypatch, throughput, windows=500, seed=0, initial=4):
+    # One record_bytes() call per window, at the throughput of the current limit
+    clock = _Clock()
+    monkeypatch.setattr(adaptive_concurrency, "time", clock)
+    rng = random.Random(seed)
+    limiter = AdaptiveConcurrencyLimiter(initial=initial, maximum=20, window_seconds=2.0)
+    limits = []
+    for _ in range(windows):
+        clock.now += limiter.window_seconds
+        limiter.record_bytes(int(throughput(limiter.limit, rng) * limiter.window_seconds))
+        limits.append(limiter.limit)
+    return limits
+
+
+def test_noise_around_constant_throughput_does_not_ratchet_limit(monkeypatch):
+    def constant(limit, rng):
+        return 10_000_000 * (1 + rng.uniform(-0.1, 0.1))
+
+    for seed in range(5):
+        limits = _run_windows(monkeypatch, constant, seed=seed)
+        assert max(limits) <= 7
+        assert sum(limits[-100:]) / 100 < 5
+
+
+def test_limit_settles_near_saturation(monkeypatch):
+    def saturating(limit, rng):
+        return min(limit, 6) * 1_000_000 * (1 + rng.uniform(-0.1, 0.1))
+
+    for seed in range(5):
+        limits = _run_windows(monkeypatch, saturating, seed=seed, initial=1)
+        assert max(limits) <= 10
+        assert 5 <= sum(limits[-100:]) / 100 <= 7
+
+
+def test_rate_limit_halves_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=20)
+    limiter.on_rate_limited()
+    assert limiter.limit == 4
+    limiter.on_rate_limited()
+    limiter.on_rate_limited()
+    limiter.on_rate_limited()
+    assert limiter.limit == 1
@@ -0,0 +1,80 @@
+"""
+Unit tests for the token bucket rate limiter.
+
+These tests replace the clock and sleep with a fake, so they check the
+pacing exactly: a full bucket allows a burst of its capacity, further
+requests are spaced 1/rate apart, and waiters queue behind each other.
+"""
+
+import pytest
+
+from dl_src_gdrive.src.dl_src_gdrive.dl_gdrive_core import rate_limiter
+from dl_src_gdrive.src.dl_src_gdrive.dl_gdrive_core.rate_limiter import TokenBucket
+
+
+class _Clock:
+    """Stands in for the time module; sleep() advances the clock if asked to."""
+
+    def __init__(self, advance_on_sleep=True):
+        self.now = 1000.0
+        self.sleeps = []
+        self.advance_on_sleep = advance_on_sleep
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        if self.advance_on_sleep:
+            self.now += seconds
+
+
+def _bucket(monkeypatch, clock, rate, capacity=None):
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return TokenBucket(rate=rate, capacity=capacity)
+
+
+def test_full_bucket_allows_burst_then_paces(monkeypatch):
+    clock = _Clock()
+    bucket = _bucket(monkeypatch, clock, rate=10)
+
+    for _ in range(10):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    for _ in range(20):
+        bucket.acquire()
+    assert clock.sleeps == pytest.approx([0.1] * 20)
+    assert clock.now - 1000.0 == pytest.approx(2.0)
+
+
+def test_bucket_refills_while_idle_up_to_capacity(monkeypatch):
+    clock = _Clock()
+    bucket = _bucket(monkeypatch, clock, rate=2, capacity=4)
+    for _ in range(4):
+        bucket.acquire()
+
+    # Idle long enough to refill more than the capacity
+    clock.now += 60
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == pytest.approx([0.5])
+
+
+def test_waiters_queue_behind_reserved_tokens(monkeypatch):
+    # Concurrent callers: nobody's sleep has advanced the clock yet
+    clock = _Clock(advance_on_sleep=False)
+    bucket = _bucket(monkeypatch, clock, rate=4, capacity=1)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == pytest.approx([0.25, 0.5, 0.75])
+
+
+def test_zero_rate_disables_limiting(monkeypatch):
+    clock = _Clock()
+    bucket = _bucket(monkeypatch, clock, rate=0)
+    for _ in range(100):
+        bucket.acquire()
+    assert clock.sleeps == []
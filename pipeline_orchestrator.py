@@ -8,7 +8,8 @@ retry logic, and status reporting.
 
 Key Features:
 - Unified CLI interface for the entire pipeline
-- Sequential workflow: Download → Process → Ingest
+- Workflow: Gmail + Drive download (concurrent) → Process → Ingest
+- Audio is transcribed as soon as it is downloaded, overlapping the download
 - Comprehensive error handling and retry logic
 - Dry-run mode for testing and validation
 - Watch mode for continuous monitoring
@@ -29,12 +30,21 @@ Version: 1.0.0
 """
 
 import argparse
+import json
+import logging
 import os
+import queue
+import statistics
 import sys
+import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Any, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 
 # Add project root to path for imports
@@ -42,10 +52,75 @@ project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
 
 from common.logging_utils.logging_config import get_logger, set_console_level
-from common.config.proj_config import PROJ_CONFIG
+from common.utils.phase_stats import PhaseStats
+from common.utils.resilience import CircuitBreaker, CircuitOpenError, RetryExecutor
 
 
-class PipelinePhase(Enum):
+# Separator lines framing phase summaries (BANNER) and pipeline banners (BANNER_WIDE)
+BANNER = "=" * 60
+BANNER_WIDE = "=" * 80
+
+# Worker threads for I/O-bound phase work (Gmail download, Drive download,
+# handing streamed audio to the transcription pool); the transcription pool
+# is sized by the transcriber's DEFAULT_TRANSCRIBE_WORKERS
+IO_POOL_WORKERS = 4
+
+
+# Attempts per external phase call (Gmail, Drive) and backoff base in seconds
+PHASE_MAX_ATTEMPTS = 3
+PHASE_RETRY_BASE = 2.0
+
+
+# Completed-phase durations kept per phase (rolling window for adaptive timeouts)
+DURATION_WINDOW = 20
+
+
+# Quiet time after the last file event before watch mode starts processing
+WATCH_SETTLE_SECONDS = 0.5
+
+# Watch-mode snapshot of the download directory (relative path -> [size, mtime_ns])
+FILE_CACHE_NAME = ".pipeline_cache.json"
+
+# Per-file process-phase progress (SQLite), so a crashed run resumes where it stopped
+CHECKPOINT_NAME = ".pipeline_checkpoint.sqlite"
+
+
+@lru_cache(maxsize=1)
+def _proj_config() -> Any:
+    """Load the project configuration on first use (keeps --help free of config loading)."""
+    from common.config.proj_config import PROJ_CONFIG
+    return PROJ_CONFIG
+
+
+@lru_cache(maxsize=1)
+def _get_download_files() -> Callable[..., PhaseStats]:
+    """Import the Google Drive downloader on first use."""
+    from dl_src_gdrive.src.dl_src_gdrive.main import download_files
+    return download_files
+
+
+@lru_cache(maxsize=1)
+def _get_gmail_api() -> tuple[Callable[..., Any], Callable[..., Any], type]:
+    """Import the Gmail downloader on first use: (download_messages, build_gmail_service, HttpError)."""
+    from googleapiclient.errors import HttpError
+    from dl_emails_gmail.src.dl_gmail.dl_gmail import download_messages
+    from dl_emails_gmail.src.dl_gmail.gmail_client import build_gmail_service
+    return download_messages, build_gmail_service, HttpError
+
+
+@lru_cache(maxsize=1)
+def _get_process_api() -> tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+    """Import the transcription processor on first use: (process_files, process_audio_file, get_transcription_ingestion)."""
+    from txt_audio_to_db.src.transcribe_log_db.main import process_files, process_audio_file
+    from txt_audio_to_db.src.transcribe_log_db.utils.db_utils import get_transcription_ingestion
+    return process_files, process_audio_file, get_transcription_ingestion
+
+
+class _PhaseIncomplete(Exception):
+    """A subsystem could not run at all (PhaseStats.error), e.g. authentication failed; retryable at phase level."""
+
+
+class PipelinePhase(str, Enum):
     """Pipeline execution phases."""
     GMAIL_DOWNLOAD = "gmail_download"
     DOWNLOAD = "download"
@@ -53,7 +128,7 @@ class PipelinePhase(Enum):
     INGEST = "ingest"
 
 
-class PipelineStatus(Enum):
+class PipelineStatus(str, Enum):
     """Pipeline execution status."""
     PENDING = "pending"
     RUNNING = "running"
@@ -62,58 +137,250 @@ class PipelineStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+class PipelineEvent(str, Enum):
+    """Events published on the orchestrator's event bus."""
+    TASK_STARTED = "task_started"
+    TASK_COMPLETED = "task_completed"
+    TASK_FAILED = "task_failed"
+
+
+# Upper-case labels for the summaries, computed once
+_PHASE_LABEL = {phase: phase.value.upper() for phase in PipelinePhase}
+_STATUS_LABEL = {status: status.value.upper() for status in PipelineStatus}
+
+# What each phase would do, logged by a dry run
+_DRY_RUN_INTENT = {
+    PipelinePhase.GMAIL_DOWNLOAD: "download emails from Gmail",
+    PipelinePhase.DOWNLOAD: "download files from Google Drive",
+    PipelinePhase.PROCESS: "process files for transcription and text extraction",
+    PipelinePhase.INGEST: "ingest processed data into database",
+}
+
+# Statuses that count as a successful phase in the pipeline summary
+_OK_STATUSES = frozenset({PipelineStatus.COMPLETED, PipelineStatus.SKIPPED})
+
+# Seed timeouts in seconds for phases that call external services, unless
+# PROJ_CONFIG overrides them (PIPELINE_*_TIMEOUT environment variables). Each is
+# raised to PHASE_TIMEOUT_P95_FACTOR x the p95 of recent durations when that
+# is longer, but never lowered below the seed: a phase's run time grows with
+# the number of new files, so a window of quiet runs would otherwise fail the
+# first large batch
+PHASE_TIMEOUT_DEFAULTS = {
+    PipelinePhase.GMAIL_DOWNLOAD: 120.0,
+    PipelinePhase.DOWNLOAD: 600.0,
+    PipelinePhase.PROCESS: 1800.0,
+}
+PHASE_TIMEOUT_P95_FACTOR = 1.5
+
+
+@dataclass(slots=True)
 class PipelineResult:
     """Result of a pipeline phase execution."""
     phase: PipelinePhase
     status: PipelineStatus
     success_count: int = 0
     total_count: int = 0
-    error_message: Optional[str] = None
+    error_message: str | None = None
     execution_time: float = 0.0
-    details: Dict[str, Any] = None
+    details: dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.details is None:
-            self.details = {}
+
+class EventBus:
+    """
+    Synchronous publish/subscribe hub for pipeline events.
+    
+    Subscribers are called in the publishing thread, in subscription order.
+    A failing subscriber is logged and does not affect the publisher or the
+    other subscribers.
+    """
+    
+    def __init__(self, logger: Any):
+        """
+        Initialize an empty bus.
+        
+        Args:
+            logger: Logger for subscriber errors
+        """
+        self.logger = logger
+        self._subs: defaultdict[PipelineEvent, list[Callable[[dict[str, Any]], None]]] = defaultdict(list)
+    
+    def subscribe(self, event: PipelineEvent, callback: Callable[[dict[str, Any]], None]) -> None:
+        """
+        Call callback with the payload of every future event of this type.
+        
+        Args:
+            event: Event type to subscribe to
+            callback: Called with the event payload
+        """
+        self._subs[event].append(callback)
+    
+    def publish(self, event: PipelineEvent, payload: dict[str, Any]) -> None:
+        """
+        Deliver an event to its subscribers.
+        
+        Args:
+            event: Event type
+            payload: Event data ("phase", plus "result" for finished phases)
+        """
+        for callback in self._subs.get(event, ()):
+            try:
+                callback(payload)
+            except Exception as e:
+                self.logger.error(f"Subscriber {callback!r} failed on {event.value}: {e}")
 
 
 class PipelineOrchestrator:
     """
     Orchestrates the entire Google Drive transcription pipeline.
     
-    This class manages the sequential execution of:
-    1. Google Drive file download
+    This class manages the execution of:
+    1. Gmail and Google Drive downloads (independent, run concurrently)
     2. Audio transcription and text extraction
     3. Database ingestion
     
     It provides comprehensive error handling, retry logic, and status reporting.
     """
     
-    def __init__(self, dry_run: bool = False, debug: bool = False):
+    def __init__(self, dry_run: bool = False, debug: bool = False, force: bool = False):
         """
         Initialize the pipeline orchestrator.
         
         Args:
             dry_run: If True, preview operations without execution
             debug: If True, enable debug logging
+            force: If True, ignore the process-phase checkpoint and redo every file
         """
         self.dry_run = dry_run
         self.debug = debug
+        self.force = force
         self.logger = get_logger("pipeline_orchestrator")
         
         if debug:
             set_console_level(self.logger, "DEBUG")
         
-        self.results: List[PipelineResult] = []
-        self.start_time = None
-        self.end_time = None
+        self.results: list[PipelineResult] = []
+        self._ok_count = 0  # results in self.results with a status in _OK_STATUSES
+        # Monotonic clock readings; only their difference is meaningful
+        self.start_time: float | None = None
+        self.end_time: float | None = None
+        
+        # Recent durations of completed phases, newest last (the timeouts
+        # derived from them are the _timeouts property)
+        self._durations: dict[PipelinePhase, deque[float]] = {
+            phase: deque(maxlen=DURATION_WINDOW)
+            for phase in PipelinePhase
+        }
+        # Phases that timed out but whose thread is still running; no run
+        # that would overlap them starts until they finish (_phases_idle)
+        self._timed_out: dict[PipelinePhase, Future[PipelineResult]] = {}
+        # Runs whose result _finish_phase has already published; with the
+        # lock, decides whether a run that ends right at its timeout counts
+        # as finished or timed out (never both)
+        self._reported: set[Future[PipelineResult]] = set()
+        self._phase_lock = threading.Lock()
+        # Per worker thread: the future of the phase run it is executing
+        self._local = threading.local()
         
         # Initialize phase status
         self.phase_status = {
             phase: PipelineStatus.PENDING 
             for phase in PipelinePhase
         }
+        
+        # Separate pools for download and transcription work, so a backlog of
+        # one never holds up the other; kept for the orchestrator's lifetime
+        # so watch mode reuses the same threads every cycle. The transcription
+        # pool is created on first use (see _transcribe_executor)
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_POOL_WORKERS, thread_name_prefix="pipeline-io")
+        self._transcribe_pool: ThreadPoolExecutor | None = None
+    
+        # Watch mode skips the process phase when the download directory
+        # matches the snapshot taken after the last successful process phase
+        self._use_file_cache = False
+        self._file_cache: dict[str, list[int]] | None = None
+        
+        # Bounded retries for calls into external services, and one circuit
+        # breaker per service so a sustained outage fails fast
+        self._retry = RetryExecutor(max_attempts=PHASE_MAX_ATTEMPTS, base=PHASE_RETRY_BASE, logger=self.logger)
+        self._breakers = {
+            "gmail": CircuitBreaker("gmail"),
+            "drive": CircuitBreaker("drive"),
+        }
+        
+        # Phase lifecycle events; every finished phase gets its summary printed
+        self._events = EventBus(self.logger)
+        self._events.subscribe(PipelineEvent.TASK_COMPLETED, self._on_phase_finished)
+        self._events.subscribe(PipelineEvent.TASK_FAILED, self._on_phase_finished)
+    
+    @cached_property
+    def _download_dir(self) -> Path:
+        """
+        Download directory from PROJ_CONFIG, resolved once per orchestrator.
+        
+        Resolved on first use rather than in __init__, so dry runs still
+        never load the project configuration.
+        """
+        return _proj_config().get_download_dir()
+    
+    @cached_property
+    def _timeout_seeds(self) -> dict[PipelinePhase, float]:
+        """
+        Seed timeout per phase: PHASE_TIMEOUT_DEFAULTS unless PROJ_CONFIG overrides it.
+        
+        Resolved on first use, so dry runs never load the project configuration.
+        """
+        config = _proj_config()
+        overrides = {
+            PipelinePhase.GMAIL_DOWNLOAD: config.gmail_timeout_seconds,
+            PipelinePhase.DOWNLOAD: config.download_timeout_seconds,
+            PipelinePhase.PROCESS: config.process_timeout_seconds,
+        }
+        return {
+            phase: overrides.get(phase) or default
+            for phase, default in PHASE_TIMEOUT_DEFAULTS.items()
+        }
+    
+    @cached_property
+    def _timeouts(self) -> dict[PipelinePhase, float]:
+        """Current timeout per phase: the seeds, raised by _record_duration."""
+        return dict(self._timeout_seeds)
+    
+    def close(self) -> bool:
+        """
+        Shut down the worker pools.
+        
+        Waits for running work to finish, unless a phase is still running
+        after timing out: then queued work is cancelled and nothing is
+        waited for, so a hung phase cannot stall the exit.
+        
+        Returns:
+            bool: True if threads of timed-out phases were left running; the
+                  caller should then leave with os._exit(), since normal
+                  interpreter exit joins every pool thread
+        """
+        hung = [_PHASE_LABEL[phase] for phase, future in self._timed_out.items() if not future.done()]
+        if hung:
+            self.logger.warning(f"Not waiting for phases still running after timing out: {', '.join(hung)}")
+        self._io_pool.shutdown(wait=not hung, cancel_futures=bool(hung))
+        if self._transcribe_pool is not None:
+            self._transcribe_pool.shutdown(wait=not hung, cancel_futures=bool(hung))
+        return bool(hung)
+    
+    def _transcribe_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the transcription pool, creating it on first use.
+        
+        Sized by the transcriber's DEFAULT_TRANSCRIBE_WORKERS, which is
+        imported lazily like the rest of the transcriber.
+        """
+        with self._phase_lock:
+            if self._transcribe_pool is None:
+                from txt_audio_to_db.src.transcribe_log_db.main import DEFAULT_TRANSCRIBE_WORKERS
+                self._transcribe_pool = ThreadPoolExecutor(
+                    max_workers=DEFAULT_TRANSCRIBE_WORKERS,
+                    thread_name_prefix="pipeline-transcribe"
+                )
+            return self._transcribe_pool
     
     def run_full_pipeline(self) -> bool:
         """
@@ -122,36 +389,67 @@ class PipelineOrchestrator:
         Returns:
             bool: True if all phases completed successfully, False otherwise
         """
-        self.logger.info("=" * 80)
-        self.logger.info("STARTING FULL PIPELINE EXECUTION")
-        self.logger.info("=" * 80)
-        self.logger.info(f"Dry run mode: {self.dry_run}")
-        self.logger.info(f"Debug mode: {self.debug}")
-        self.logger.info(f"Download directory: {PROJ_CONFIG.get_download_dir()}")
-        self.logger.info("=" * 80)
+        if self.dry_run:
+            return self._dry_run_plan(*PipelinePhase)
         
-        self.start_time = time.time()
+        if not self._phases_idle(*PipelinePhase):
+            return False
+        
+        self.logger.info(
+            f"{BANNER_WIDE}\n"
+            "STARTING FULL PIPELINE EXECUTION\n"
+            f"{BANNER_WIDE}\n"
+            f"Debug mode: {self.debug}\n"
+            f"Download directory: {self._download_dir}\n"
+            f"{BANNER_WIDE}"
+        )
+        
+        self.start_time = time.monotonic()
+        self.results = []
+        self._ok_count = 0
         
         try:
-            # Phase 0: Download emails from Gmail
-            gmail_result = self._run_gmail_download_phase()
-            self.results.append(gmail_result)
+            # Phases 0 and 1: Gmail and Google Drive downloads share no state,
+            # so run them side by side and wait for both before processing.
+            # Audio files coming out of the Drive download are transcribed by
+            # a stream worker while the rest of the download continues.
+            audio_queue: "queue.Queue[Path | None]" = queue.Queue()
+            started = time.monotonic()
+            stream_future = self._io_pool.submit(self._process_stream, audio_queue)
+            gmail_future = self._submit_phase(self._run_gmail_download_phase)
+            download_future = self._submit_phase(self._run_download_phase, audio_queue)
+            gmail_result = self._await_phase(PipelinePhase.GMAIL_DOWNLOAD, gmail_future, started)
+            try:
+                download_result = self._await_phase(PipelinePhase.DOWNLOAD, download_future, started)
+            finally:
+                audio_queue.put(None)
+            streamed = stream_future.result()
+            
+            self._record_result(gmail_result)
+            self._record_result(download_result)
             
             if gmail_result.status == PipelineStatus.FAILED:
                 self.logger.error("Gmail download phase failed, stopping pipeline")
                 return False
             
-            # Phase 1: Download files from Google Drive
-            download_result = self._run_download_phase()
-            self.results.append(download_result)
-            
             if download_result.status == PipelineStatus.FAILED:
                 self.logger.error("Download phase failed, stopping pipeline")
                 return False
             
-            # Phase 2: Process files (transcribe audio, extract text)
-            process_result = self._run_process_phase()
-            self.results.append(process_result)
+            # Phase 2: Process files the stream worker did not handle
+            # (text documents, audio left over from earlier runs)
+            snapshot = self._snapshot_download_dir() if self._use_file_cache else None
+            if snapshot is not None and snapshot == self._load_file_cache():
+                self.logger.info("Phase 2: No changes in download directory, skipping process phase")
+                self.phase_status[PipelinePhase.PROCESS] = PipelineStatus.SKIPPED
+                process_result = PipelineResult(phase=PipelinePhase.PROCESS, status=PipelineStatus.SKIPPED)
+            else:
+                process_result = self._run_phase(PipelinePhase.PROCESS, self._run_process_phase)
+                if snapshot is not None and process_result.status == PipelineStatus.COMPLETED:
+                    # Snapshot again: processing writes transcript files
+                    self._save_file_cache(self._snapshot_download_dir())
+            process_result.details["streamed"] = {"success": streamed[0], "total": streamed[1]}
+            self._record_result(process_result)
             
             if process_result.status == PipelineStatus.FAILED:
                 self.logger.error("Process phase failed, stopping pipeline")
@@ -159,13 +457,13 @@ class PipelineOrchestrator:
             
             # Phase 3: Ingest processed data into database
             ingest_result = self._run_ingest_phase()
-            self.results.append(ingest_result)
+            self._record_result(ingest_result)
             
             if ingest_result.status == PipelineStatus.FAILED:
                 self.logger.error("Ingest phase failed")
                 return False
             
-            self.end_time = time.time()
+            self.end_time = time.monotonic()
             self._print_pipeline_summary()
             
             return True
@@ -179,53 +477,71 @@ class PipelineOrchestrator:
     
     def run_download_only(self) -> bool:
         """Run only the download phase."""
+        if self.dry_run:
+            return self._dry_run_plan(PipelinePhase.DOWNLOAD)
+        
+        if not self._phases_idle(PipelinePhase.DOWNLOAD, PipelinePhase.PROCESS):
+            return False
+        
         self.logger.info("Running download phase only")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
-        result = self._run_download_phase()
-        self.results.append(result)
+        result = self._run_phase(PipelinePhase.DOWNLOAD, self._run_download_phase)
+        self._record_result(result)
         
-        self.end_time = time.time()
-        self._print_phase_summary(result)
+        self.end_time = time.monotonic()
         
         return result.status == PipelineStatus.COMPLETED
     
     def run_process_only(self) -> bool:
         """Run only the process phase."""
+        if self.dry_run:
+            return self._dry_run_plan(PipelinePhase.PROCESS)
+        
+        # A running download may still be writing the files processing would pick up
+        if not self._phases_idle(PipelinePhase.PROCESS, PipelinePhase.DOWNLOAD):
+            return False
+        
         self.logger.info("Running process phase only")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
-        result = self._run_process_phase()
-        self.results.append(result)
+        result = self._run_phase(PipelinePhase.PROCESS, self._run_process_phase)
+        self._record_result(result)
         
-        self.end_time = time.time()
-        self._print_phase_summary(result)
+        self.end_time = time.monotonic()
         
         return result.status == PipelineStatus.COMPLETED
     
     def run_ingest_only(self) -> bool:
         """Run only the ingest phase."""
+        if self.dry_run:
+            return self._dry_run_plan(PipelinePhase.INGEST)
+        
         self.logger.info("Running ingest phase only")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         result = self._run_ingest_phase()
-        self.results.append(result)
+        self._record_result(result)
         
-        self.end_time = time.time()
-        self._print_phase_summary(result)
+        self.end_time = time.monotonic()
         
         return result.status == PipelineStatus.COMPLETED
     
     def run_gmail_only(self) -> bool:
         """Run only the Gmail download phase."""
+        if self.dry_run:
+            return self._dry_run_plan(PipelinePhase.GMAIL_DOWNLOAD)
+        
+        if not self._phases_idle(PipelinePhase.GMAIL_DOWNLOAD):
+            return False
+        
         self.logger.info("Running Gmail download phase only")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
-        result = self._run_gmail_download_phase()
-        self.results.append(result)
+        result = self._run_phase(PipelinePhase.GMAIL_DOWNLOAD, self._run_gmail_download_phase)
+        self._record_result(result)
         
-        self.end_time = time.time()
-        self._print_phase_summary(result)
+        self.end_time = time.monotonic()
         
         return result.status == PipelineStatus.COMPLETED
     
@@ -238,6 +554,12 @@ class PipelineOrchestrator:
         """
         self.logger.info(f"Starting watch mode (checking every {interval} seconds)")
         self.logger.info("Press Ctrl+C to stop")
+        self._use_file_cache = True
+        
+        # Files appearing in the download directory between cycles are
+        # processed right away; Gmail and Drive are still polled every interval
+        new_files: "queue.Queue[str]" = queue.Queue()
+        observer = self._start_file_watcher(new_files)
         
         try:
             while True:
@@ -252,49 +574,285 @@ class PipelineOrchestrator:
                     self.logger.warning("Pipeline completed with errors")
                 
                 self.logger.info(f"Waiting {interval} seconds before next check...")
-                time.sleep(interval)
+                if observer is None:
+                    time.sleep(interval)
+                    continue
+                
+                # Ignore events caused by the pipeline's own downloads and transcripts
+                self._drain_events(new_files)
+                deadline = time.monotonic() + interval
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        path = new_files.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    # Wait for writes to settle so a burst of files triggers one run
+                    self._drain_events(new_files, settle=WATCH_SETTLE_SECONDS)
+                    self.logger.info(f"New file in download directory ({path}), processing...")
+                    self.run_process_only()
+                    self._drain_events(new_files)
                 
         except KeyboardInterrupt:
             self.logger.info("Watch mode stopped by user")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+    
+    def _start_file_watcher(self, new_files: "queue.Queue[str]") -> Any | None:
+        """
+        Watch the download directory for new files, if watchdog is available.
+        
+        Paths of created, modified or moved-in files (hidden files excluded)
+        are put on new_files. Falls back to plain interval polling when
+        watchdog is not installed or PROJ_CONFIG.use_polling_watch is set
+        (network filesystems, where native change events are unreliable).
+        
+        Args:
+            new_files: Queue receiving paths of changed files
+            
+        Returns:
+            Any | None: The started watchdog Observer, or None when polling
+        """
+        if _proj_config().use_polling_watch:
+            self.logger.info("Polling watch configured, checking the download directory every interval")
+            return None
+        
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self.logger.info("watchdog not installed, checking the download directory every interval")
+            return None
+        
+        class _NewFileHandler(FileSystemEventHandler):
+            """Queue paths of new or changed files."""
+            
+            def _queue(self, path: str) -> None:
+                if not os.path.basename(path).startswith('.'):
+                    new_files.put(path)
+            
+            def on_created(self, event):
+                if not event.is_directory:
+                    self._queue(event.src_path)
+            
+            def on_modified(self, event):
+                if not event.is_directory:
+                    self._queue(event.src_path)
+            
+            def on_moved(self, event):
+                if not event.is_directory:
+                    self._queue(event.dest_path)
+        
+        download_dir = self._download_dir
+        try:
+            observer = Observer()
+            observer.schedule(_NewFileHandler(), str(download_dir), recursive=True)
+            observer.start()
+        except OSError as e:
+            self.logger.warning(f"Could not watch {download_dir}, falling back to polling: {e}")
+            return None
+        
+        self.logger.info(f"Watching {download_dir} for new files")
+        return observer
+    
+    @staticmethod
+    def _drain_events(new_files: "queue.Queue[str]", settle: float = 0.0) -> None:
+        """
+        Discard queued file events.
+        
+        Args:
+            new_files: Queue filled by the file watcher
+            settle: Keep draining until no event has arrived for this many seconds
+        """
+        while True:
+            try:
+                new_files.get(timeout=settle) if settle > 0 else new_files.get_nowait()
+            except queue.Empty:
+                return
+    
+    def _snapshot_download_dir(self) -> dict[str, list[int]]:
+        """
+        Record size and modification time of every file in the download directory.
+        
+        Uses os.scandir, whose entries carry the stat data, so each file costs
+        at most one stat call. Hidden files (download manifest, this cache)
+        are left out.
+        
+        Returns:
+            dict[str, list[int]]: [size, mtime_ns] per path relative to the download directory
+        """
+        root = self._download_dir
+        snapshot: dict[str, list[int]] = {}
+        pending = [str(root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            snapshot[os.path.relpath(entry.path, root)] = [st.st_size, st.st_mtime_ns]
+            except OSError as e:
+                self.logger.debug(f"Could not scan {directory}: {e}")
+        return snapshot
+    
+    def _load_file_cache(self) -> dict[str, list[int]]:
+        """
+        Get the snapshot saved after the last successful process phase.
+        
+        Returns:
+            dict[str, list[int]]: Saved snapshot; empty if none was saved or it cannot be read
+        """
+        if self._file_cache is None:
+            cache_path = self._download_dir / FILE_CACHE_NAME
+            try:
+                self._file_cache = json.loads(cache_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                self._file_cache = {}
+        return self._file_cache
+    
+    def _save_file_cache(self, snapshot: dict[str, list[int]]) -> None:
+        """
+        Remember a snapshot in memory and persist it atomically.
+        
+        Failures are logged and otherwise ignored; the cache is only an optimization.
+        
+        Args:
+            snapshot: Snapshot from _snapshot_download_dir()
+        """
+        self._file_cache = snapshot
+        cache_path = self._download_dir / FILE_CACHE_NAME
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            tmp_path.write_text(json.dumps(snapshot), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f"Could not save file cache to {cache_path}: {e}")
+    
+    def _dry_run_plan(self, *phases: PipelinePhase) -> bool:
+        """
+        Log what the given phases would do and record them as skipped.
+        
+        Nothing is imported from the subsystems and no configuration beyond
+        the orchestrator's own is loaded, so a dry run returns immediately.
+        
+        Args:
+            *phases: Phases to plan, in execution order
+            
+        Returns:
+            bool: Always True
+        """
+        self.start_time = time.monotonic()
+        self.results = []
+        self._ok_count = 0
+        
+        for phase in phases:
+            self.logger.info(f"DRY RUN: Would {_DRY_RUN_INTENT[phase]}")
+            self.phase_status[phase] = PipelineStatus.SKIPPED
+            self._record_result(PipelineResult(phase=phase, status=PipelineStatus.SKIPPED))
+        
+        self.end_time = time.monotonic()
+        self._print_pipeline_summary()
+        
+        return True
+    
+    def _process_stream(self, audio_queue: "queue.Queue[Path | None]") -> tuple[int, int]:
+        """
+        Transcribe and ingest audio files as the download phase produces them.
+        
+        Runs until a None sentinel is read from the queue, handing each file
+        to the transcription pool, then waits for those files to finish.
+        Files that fail here are left for the process phase, which picks up
+        everything not yet in the database.
+        
+        Args:
+            audio_queue: Paths of freshly downloaded audio files, then None
+            
+        Returns:
+            tuple[int, int]: (files processed successfully, files received)
+        """
+        success_count = 0
+        total_count = 0
+        
+        try:
+            _, process_audio_file, get_transcription_ingestion = _get_process_api()
+            
+            ingestion_handler = get_transcription_ingestion()
+        except Exception as e:
+            self.logger.warning(f"Streaming transcription unavailable, deferring to process phase: {e}")
+            ingestion_handler = None
+        
+        futures = {}
+        while (audio_path := audio_queue.get()) is not None:
+            if ingestion_handler is None:
+                continue
+            futures[self._transcribe_executor().submit(process_audio_file, ingestion_handler, audio_path)] = audio_path
+        
+        for future in as_completed(futures):
+            total_count += 1
+            try:
+                future.result()
+                success_count += 1
+            except Exception as e:
+                self.logger.error(f"Streaming transcription failed for {futures[future]}: {e}")
+        
+        if total_count:
+            self.logger.info(f"Processed {success_count}/{total_count} audio files while downloading")
+        
+        return success_count, total_count
     
-    def _run_download_phase(self) -> PipelineResult:
-        """Execute the download phase."""
+    def _run_download_phase(self, audio_queue: "queue.Queue[Path | None] | None" = None) -> PipelineResult:
+        """
+        Execute the download phase.
+        
+        Args:
+            audio_queue: If given, the path of every downloaded audio file is
+                put on this queue as soon as the file is complete
+        """
         self.logger.info("Phase 1: Downloading files from Google Drive")
-        self.phase_status[PipelinePhase.DOWNLOAD] = PipelineStatus.RUNNING
+        self._start_phase(PipelinePhase.DOWNLOAD)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            if self.dry_run:
-                self.logger.info("DRY RUN: Would download files from Google Drive")
-                success_count = 0
-                total_count = 0
-                error_message = None
-            else:
-                # Import and run Google Drive downloader
-                from dl_src_gdrive.src.dl_src_gdrive.main import main as download_main
-                
-                # Temporarily modify sys.argv to avoid argument conflicts
-                original_argv = sys.argv
-                sys.argv = ["dl_src_gdrive"]
-                
-                try:
-                    # Capture the return code
-                    return_code = download_main()
-                finally:
-                    # Restore original sys.argv
-                    sys.argv = original_argv
-                
-                if return_code == 0:
-                    success_count = 1  # Simplified for now
-                    total_count = 1
-                    error_message = None
-                else:
-                    success_count = 0
-                    total_count = 1
-                    error_message = "Download phase returned non-zero exit code"
+            # Import and run Google Drive downloader
+            download_files = _get_download_files()
+            
+            on_file_downloaded = None
+            if audio_queue is not None:
+                def on_file_downloaded(file_path: Path, file_type: str) -> None:
+                    if file_type == 'audio':
+                        audio_queue.put(file_path)
+            
+            stats = PhaseStats()
             
-            execution_time = time.time() - start_time
+            def _download_attempt() -> None:
+                nonlocal stats
+                # Only a run that could not talk to Drive at all is retried
+                # and counts against the circuit breaker. Files that failed
+                # individually (permissions, bad exports) are reported in
+                # details["failed"] and picked up again by the next run.
+                stats = download_files(on_file_downloaded=on_file_downloaded)
+                if stats.error is not None:
+                    raise _PhaseIncomplete(stats.error)
+            
+            try:
+                self._retry.execute(
+                    _download_attempt,
+                    retryable=(_PhaseIncomplete,),
+                    breaker=self._breakers["drive"]
+                )
+                error_message = None if stats.ok else f"{len(stats.failed)} of {stats.total} files failed to download"
+            except (_PhaseIncomplete, CircuitOpenError) as e:
+                error_message = str(e)
+            success_count, total_count, failed = stats.success, stats.total, stats.failed
+            
+            execution_time = time.monotonic() - start_time
             
             if error_message:
                 status = PipelineStatus.FAILED
@@ -303,70 +861,64 @@ class PipelineOrchestrator:
                 status = PipelineStatus.COMPLETED
                 self.logger.info(f"Download phase completed: {success_count}/{total_count} files")
             
-            self.phase_status[PipelinePhase.DOWNLOAD] = status
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.DOWNLOAD,
                 status=status,
                 success_count=success_count,
                 total_count=total_count,
                 error_message=error_message,
-                execution_time=execution_time
-            )
+                execution_time=execution_time,
+                details={"failed": failed}
+            ))
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_message = f"Download phase failed with exception: {e}"
             self.logger.error(error_message)
             
-            self.phase_status[PipelinePhase.DOWNLOAD] = PipelineStatus.FAILED
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.DOWNLOAD,
                 status=PipelineStatus.FAILED,
                 success_count=0,
                 total_count=0,
                 error_message=error_message,
                 execution_time=execution_time
-            )
+            ))
     
     def _run_gmail_download_phase(self) -> PipelineResult:
         """Execute the Gmail download phase."""
         self.logger.info("Phase 0: Downloading emails from Gmail")
-        self.phase_status[PipelinePhase.GMAIL_DOWNLOAD] = PipelineStatus.RUNNING
+        self._start_phase(PipelinePhase.GMAIL_DOWNLOAD)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            if self.dry_run:
-                self.logger.info("DRY RUN: Would download emails from Gmail")
-                success_count = 0
-                total_count = 0
-                error_message = None
-            else:
-                # Import and run Gmail downloader
-                from dl_emails_gmail.src.dl_gmail.dl_gmail import process_gmail_messages
-                from dl_emails_gmail.src.dl_gmail.gmail_client import build_gmail_service
+            success_count = 0
+            total_count = 0
+            failed: list[str] = []
+            # Import and run Gmail downloader
+            download_messages, build_gmail_service, HttpError = _get_gmail_api()
+            
+            try:
+                # Try to build the Gmail service first to catch credential errors early
+                service = build_gmail_service()
+                # Processed messages are relabelled out of the search query,
+                # so a retry only sees the messages that are still pending
+                stats = self._retry.execute(
+                    download_messages,
+                    retryable=(HttpError, ConnectionError, TimeoutError),
+                    breaker=self._breakers["gmail"]
+                )
                 
-                try:
-                    # Try to build the Gmail service first to catch credential errors early
-                    service = build_gmail_service()
-                    messages = process_gmail_messages()
+                success_count, total_count, failed = stats.success, stats.total, stats.failed
+                error_message = None if stats.ok else f"{len(failed)} of {total_count} messages failed to download"
                     
-                    success_count = len(messages) if messages else 0
-                    total_count = len(messages) if messages else 1
-                    error_message = None
-                        
-                except FileNotFoundError as e:
-                    success_count = 0
-                    total_count = 1
-                    error_message = f"Gmail download failed: Missing credentials file - {e}"
-                except Exception as e:
-                    success_count = 0
-                    total_count = 1
-                    error_message = f"Gmail download failed: {e}"
-            
-            execution_time = time.time() - start_time
+            except FileNotFoundError as e:
+                error_message = f"Gmail download failed: Missing credentials file - {e}"
+            except Exception as e:
+                error_message = f"Gmail download failed: {e}"
+            
+            execution_time = time.monotonic() - start_time
             
             if error_message:
                 status = PipelineStatus.FAILED
@@ -375,63 +927,51 @@ class PipelineOrchestrator:
                 status = PipelineStatus.COMPLETED
                 self.logger.info(f"Gmail download phase completed: {success_count}/{total_count} messages")
             
-            self.phase_status[PipelinePhase.GMAIL_DOWNLOAD] = status
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.GMAIL_DOWNLOAD,
                 status=status,
                 success_count=success_count,
                 total_count=total_count,
                 error_message=error_message,
-                execution_time=execution_time
-            )
+                execution_time=execution_time,
+                details={"failed": failed}
+            ))
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_message = f"Gmail download phase failed with exception: {e}"
             self.logger.error(error_message)
             
-            self.phase_status[PipelinePhase.GMAIL_DOWNLOAD] = PipelineStatus.FAILED
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.GMAIL_DOWNLOAD,
                 status=PipelineStatus.FAILED,
                 success_count=0,
                 total_count=0,
                 error_message=error_message,
                 execution_time=execution_time
-            )
+            ))
     
     def _run_process_phase(self) -> PipelineResult:
         """Execute the process phase (transcription and text extraction)."""
         self.logger.info("Phase 2: Processing files (transcription and text extraction)")
-        self.phase_status[PipelinePhase.PROCESS] = PipelineStatus.RUNNING
+        self._start_phase(PipelinePhase.PROCESS)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            if self.dry_run:
-                self.logger.info("DRY RUN: Would process files for transcription and text extraction")
-                success_count = 0
-                total_count = 0
-                error_message = None
-            else:
-                # Import and run transcription processor
-                from txt_audio_to_db.src.transcribe_log_db.main import main as process_main
-                
-                # Set up arguments for batch processing
-                original_argv = sys.argv
-                sys.argv = ["transcribe_log_db", "--batch"]
-                
-                try:
-                    process_main()
-                    success_count = 1  # Simplified for now
-                    total_count = 1
-                    error_message = None
-                finally:
-                    sys.argv = original_argv
+            # Import and run transcription processor in batch mode
+            process_files, _, _ = _get_process_api()
+            
+            stats = process_files(
+                batch=True,
+                executor=self._transcribe_executor(),
+                checkpoint_path=self._download_dir / CHECKPOINT_NAME,
+                force=self.force
+            )
+            success_count, total_count, failed = stats.success, stats.total, stats.failed
+            error_message = None if stats.ok else f"{len(failed)} of {total_count} files failed to process"
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             if error_message:
                 status = PipelineStatus.FAILED
@@ -440,55 +980,46 @@ class PipelineOrchestrator:
                 status = PipelineStatus.COMPLETED
                 self.logger.info(f"Process phase completed: {success_count}/{total_count} files")
             
-            self.phase_status[PipelinePhase.PROCESS] = status
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.PROCESS,
                 status=status,
                 success_count=success_count,
                 total_count=total_count,
                 error_message=error_message,
-                execution_time=execution_time
-            )
+                execution_time=execution_time,
+                details={"failed": failed}
+            ))
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_message = f"Process phase failed with exception: {e}"
             self.logger.error(error_message)
             
-            self.phase_status[PipelinePhase.PROCESS] = PipelineStatus.FAILED
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.PROCESS,
                 status=PipelineStatus.FAILED,
                 success_count=0,
                 total_count=0,
                 error_message=error_message,
                 execution_time=execution_time
-            )
+            ))
     
     def _run_ingest_phase(self) -> PipelineResult:
         """Execute the ingest phase (database ingestion)."""
         self.logger.info("Phase 3: Ingesting processed data into database")
-        self.phase_status[PipelinePhase.INGEST] = PipelineStatus.RUNNING
+        self._start_phase(PipelinePhase.INGEST)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            if self.dry_run:
-                self.logger.info("DRY RUN: Would ingest processed data into database")
-                success_count = 0
-                total_count = 0
-                error_message = None
-            else:
-                # The ingestion is handled as part of the process phase
-                # This is more of a validation step
-                self.logger.info("Ingestion completed as part of process phase")
-                success_count = 1
-                total_count = 1
-                error_message = None
+            # The ingestion is handled as part of the process phase
+            # This is more of a validation step
+            self.logger.info("Ingestion completed as part of process phase")
+            success_count = 1
+            total_count = 1
+            error_message = None
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             if error_message:
                 status = PipelineStatus.FAILED
@@ -497,74 +1028,263 @@ class PipelineOrchestrator:
                 status = PipelineStatus.COMPLETED
                 self.logger.info(f"Ingest phase completed: {success_count}/{total_count} records")
             
-            self.phase_status[PipelinePhase.INGEST] = status
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.INGEST,
                 status=status,
                 success_count=success_count,
                 total_count=total_count,
                 error_message=error_message,
                 execution_time=execution_time
-            )
+            ))
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_message = f"Ingest phase failed with exception: {e}"
             self.logger.error(error_message)
             
-            self.phase_status[PipelinePhase.INGEST] = PipelineStatus.FAILED
-            
-            return PipelineResult(
+            return self._finish_phase(PipelineResult(
                 phase=PipelinePhase.INGEST,
                 status=PipelineStatus.FAILED,
                 success_count=0,
                 total_count=0,
                 error_message=error_message,
                 execution_time=execution_time
+            ))
+    
+    def _start_phase(self, phase: PipelinePhase) -> None:
+        """Mark a phase as running and publish TASK_STARTED."""
+        self.phase_status[phase] = PipelineStatus.RUNNING
+        self._events.publish(PipelineEvent.TASK_STARTED, {"phase": phase})
+    
+    def _finish_phase(self, result: PipelineResult) -> PipelineResult:
+        """
+        Store a phase's final status, publish TASK_COMPLETED or TASK_FAILED, and return the result.
+        
+        A run that already timed out (see _await_phase) was reported FAILED;
+        its late result is only logged, so it neither overwrites the status
+        nor publishes a second event.
+        """
+        future = getattr(self._local, "future", None)
+        with self._phase_lock:
+            late = future is not None and self._timed_out.get(result.phase) is future
+            if future is not None and not late:
+                self._reported.add(future)
+        if late:
+            self.logger.warning(
+                f"{_PHASE_LABEL[result.phase]} phase finished after timing out "
+                f"({_STATUS_LABEL[result.status]}, {result.execution_time:.1f}s); result discarded"
             )
+            # Its real duration still teaches the timeout how long the phase can take
+            self._record_duration(result)
+            return result
+        
+        self.phase_status[result.phase] = result.status
+        event = PipelineEvent.TASK_FAILED if result.status == PipelineStatus.FAILED else PipelineEvent.TASK_COMPLETED
+        self._events.publish(event, {"phase": result.phase, "result": result})
+        return result
     
-    def _print_phase_summary(self, result: PipelineResult) -> None:
-        """Print summary for a single phase."""
-        self.logger.info("=" * 60)
-        self.logger.info(f"PHASE SUMMARY: {result.phase.value.upper()}")
-        self.logger.info("=" * 60)
-        self.logger.info(f"Status: {result.status.value.upper()}")
-        self.logger.info(f"Success: {result.success_count}/{result.total_count}")
-        self.logger.info(f"Execution time: {result.execution_time:.2f} seconds")
+    def _on_phase_finished(self, payload: dict[str, Any]) -> None:
+        """Event subscriber: print the summary of a finished phase."""
+        self._print_phase_summary(payload["result"])
+    
+    def _run_phase(self, phase: PipelinePhase, runner: Callable[..., PipelineResult], *args: Any) -> PipelineResult:
+        """
+        Run a phase method on the I/O pool and wait for it within the phase's timeout.
+        
+        Args:
+            phase: Phase that runner executes
+            runner: One of the _run_*_phase methods
+            *args: Arguments for runner
+            
+        Returns:
+            PipelineResult: The phase's result, or a FAILED result on timeout
+        """
+        started = time.monotonic()
+        return self._await_phase(phase, self._submit_phase(runner, *args), started)
+    
+    def _submit_phase(self, runner: Callable[..., PipelineResult], *args: Any) -> "Future[PipelineResult]":
+        """
+        Start a phase method on the I/O pool.
+        
+        The worker thread can see the run's future (self._local.future), so
+        _finish_phase can tell a run that _await_phase already gave up on.
         
+        Args:
+            runner: One of the _run_*_phase methods
+            *args: Arguments for runner
+            
+        Returns:
+            Future[PipelineResult]: Future of the phase's result
+        """
+        future: Future[PipelineResult] = Future()
+        
+        def _run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            self._local.future = future
+            try:
+                future.set_result(runner(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self._local.future = None
+        
+        self._io_pool.submit(_run)
+        return future
+    
+    def _await_phase(self, phase: PipelinePhase, future: "Future[PipelineResult]", started: float) -> PipelineResult:
+        """
+        Wait for a submitted phase until its timeout, counted from when it was submitted.
+        
+        A thread cannot be cancelled, so a phase that times out keeps running
+        in the background; the phase is reported FAILED, and _finish_phase
+        discards the run's eventual result instead of publishing it. Its
+        future is kept in self._timed_out, and runs that would overlap it
+        (e.g. a second process_files transcribing the same files) are
+        skipped until it finishes; see _phases_idle().
+        
+        Args:
+            phase: Phase running in future
+            future: Future of a _run_*_phase call
+            started: time.monotonic() reading taken when the phase was submitted
+            
+        Returns:
+            PipelineResult: The phase's result, or a FAILED result on timeout
+        """
+        timeout = self._timeouts.get(phase)
+        remaining = None if timeout is None else max(0.0, started + timeout - time.monotonic())
+        try:
+            result = future.result(timeout=remaining)
+        except FuturesTimeoutError:
+            with self._phase_lock:
+                # The run may have published its result just now
+                finished = future in self._reported
+                if not finished:
+                    self._timed_out[phase] = future
+            if finished:
+                result = future.result()
+            else:
+                return self._timed_out_result(phase, timeout, started)
+        with self._phase_lock:
+            self._reported.discard(future)
+        return result
+    
+    def _timed_out_result(self, phase: PipelinePhase, timeout: float, started: float) -> PipelineResult:
+        """Report a phase that exceeded its timeout as FAILED."""
+        error_message = f"Timed out after {timeout:.0f} seconds"
+        self.logger.error(f"{_PHASE_LABEL[phase]} phase failed: {error_message}")
+        return self._finish_phase(PipelineResult(
+            phase=phase,
+            status=PipelineStatus.FAILED,
+            error_message=error_message,
+            execution_time=time.monotonic() - started
+        ))
+    
+    def _phases_idle(self, *phases: PipelinePhase) -> bool:
+        """
+        Check that no earlier, timed-out run of the given phases is still going.
+        
+        Timed-out runs that have finished in the meantime are forgotten.
+        
+        Args:
+            *phases: Phases the caller is about to run (or must not overlap)
+            
+        Returns:
+            bool: True if the caller may start; False (after logging) otherwise
+        """
+        for phase, future in list(self._timed_out.items()):
+            if future.done():
+                del self._timed_out[phase]
+        
+        busy = [_PHASE_LABEL[phase] for phase in phases if phase in self._timed_out]
+        if busy:
+            self.logger.warning(
+                f"Still running after timing out: {', '.join(busy)} phase; skipping this run"
+            )
+            return False
+        return True
+    
+    def _record_result(self, result: PipelineResult) -> None:
+        """Append a phase result and keep the successful-phase count, durations and timeouts current."""
+        self.results.append(result)
+        if result.status in _OK_STATUSES:
+            self._ok_count += 1
+        self._record_duration(result)
+    
+    def _record_duration(self, result: PipelineResult) -> None:
+        """
+        Add a completed phase's duration to its window and retune its timeout.
+        
+        Also called from the worker thread of a timed-out run when it
+        finishes late, hence the lock.
+        """
+        # Skipped phases do no work, so their times would skew the window
+        if result.status != PipelineStatus.COMPLETED:
+            return
+        with self._phase_lock:
+            window = self._durations[result.phase]
+            window.append(result.execution_time)
+            if result.phase in PHASE_TIMEOUT_DEFAULTS and len(window) >= 2:
+                p95 = statistics.quantiles(window, n=20)[18]
+                self._timeouts[result.phase] = max(
+                    self._timeout_seeds[result.phase],
+                    p95 * PHASE_TIMEOUT_P95_FACTOR
+                )
+    
+    def _print_phase_summary(self, result: PipelineResult) -> None:
+        """Print summary for a single phase (one log record)."""
+        lines = [
+            BANNER,
+            f"PHASE SUMMARY: {_PHASE_LABEL[result.phase]}",
+            BANNER,
+            f"Status: {_STATUS_LABEL[result.status]}",
+            f"Success: {result.success_count}/{result.total_count}",
+            f"Execution time: {result.execution_time:.2f} seconds",
+        ]
         if result.error_message:
-            self.logger.error(f"Error: {result.error_message}")
+            lines.append(f"Error: {result.error_message}")
+        if failed := result.details.get("failed"):
+            lines.append(f"Failed items: {', '.join(failed)}")
+        lines.append(BANNER)
         
-        self.logger.info("=" * 60)
+        log = self.logger.error if result.error_message else self.logger.info
+        log("\n".join(lines))
     
     def _print_pipeline_summary(self) -> None:
-        """Print summary for the entire pipeline."""
-        total_time = self.end_time - self.start_time if self.end_time and self.start_time else 0
+        """Print summary for the entire pipeline (one log record)."""
+        if self.start_time is not None and self.end_time is not None:
+            total_time = self.end_time - self.start_time
+        else:
+            total_time = 0
         
-        self.logger.info("=" * 80)
-        self.logger.info("PIPELINE EXECUTION SUMMARY")
-        self.logger.info("=" * 80)
-        self.logger.info(f"Total execution time: {total_time:.2f} seconds")
-        self.logger.info("")
+        lines = [
+            BANNER_WIDE,
+            "PIPELINE EXECUTION SUMMARY",
+            BANNER_WIDE,
+            f"Total execution time: {total_time:.2f} seconds",
+            "",
+        ]
         
         for result in self.results:
-            status_icon = "[OK]" if result.status == PipelineStatus.COMPLETED else "[FAIL]"
-            self.logger.info(f"{status_icon} {result.phase.value.upper()}: {result.status.value}")
-            self.logger.info(f"   Success: {result.success_count}/{result.total_count}")
-            self.logger.info(f"   Time: {result.execution_time:.2f}s")
+            status_icon = "[OK]" if result.status in _OK_STATUSES else "[FAIL]"
+            lines.append(
+                f"{status_icon} {_PHASE_LABEL[result.phase]}: {result.status.value}\n"
+                f"   Success: {result.success_count}/{result.total_count}\n"
+                f"   Time: {result.execution_time:.2f}s"
+            )
             if result.error_message:
-                self.logger.info(f"   Error: {result.error_message}")
+                lines.append(f"   Error: {result.error_message}")
         
         # Overall status
-        all_completed = all(r.status == PipelineStatus.COMPLETED for r in self.results)
+        all_completed = self._ok_count == len(self.results)
         overall_status = "COMPLETED" if all_completed else "FAILED"
         status_icon = "[OK]" if all_completed else "[FAIL]"
         
-        self.logger.info("")
-        self.logger.info(f"{status_icon} OVERALL STATUS: {overall_status}")
-        self.logger.info("=" * 80)
-
+        lines.append("")
+        lines.append(f"{status_icon} OVERALL STATUS: {overall_status}")
+        lines.append(BANNER_WIDE)
+        
+        self.logger.info("\n".join(lines))
 
 def main():
     """Main entry point for the pipeline orchestrator."""
@@ -593,6 +1313,9 @@ Examples:
     
     # Debug mode with verbose logging
     python pipeline_orchestrator.py --full-pipeline --debug
+    
+    # Reprocess files the checkpoint of an earlier run marks as done
+    python pipeline_orchestrator.py --process-only --force
         """
     )
     
@@ -640,6 +1363,11 @@ Examples:
         action='store_true',
         help='Enable debug logging'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Ignore the process checkpoint and reprocess files it marks as done'
+    )
     parser.add_argument(
         '--interval',
         type=int,
@@ -650,8 +1378,9 @@ Examples:
     args = parser.parse_args()
     
     # Create orchestrator
-    orchestrator = PipelineOrchestrator(dry_run=args.dry_run, debug=args.debug)
+    orchestrator = PipelineOrchestrator(dry_run=args.dry_run, debug=args.debug, force=args.force)
     
+    exit_code = 1
     try:
         # Execute based on mode
         if args.full_pipeline:
@@ -668,15 +1397,24 @@ Examples:
             orchestrator.run_watch_mode(interval=args.interval)
             success = True  # Watch mode runs until interrupted
         
-        # Exit with appropriate code
-        sys.exit(0 if success else 1)
+        exit_code = 0 if success else 1
         
     except KeyboardInterrupt:
         print("\nPipeline interrupted by user")
-        sys.exit(1)
     except Exception as e:
         print(f"Pipeline failed with unexpected error: {e}")
-        sys.exit(1)
+    finally:
+        abandoned = orchestrator.close()
+    
+    if abandoned:
+        # Threads of timed-out phases are still running; a normal exit would
+        # wait for them, so flush the logs and leave without joining
+        logging.shutdown()
+        sys.stdout.flush()
+        os._exit(exit_code)
+    
+    # Exit with appropriate code
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@ Usage:
     config.MODELS['main'] = 'custom-model'
 """
 
+import threading
+
 
 class TranscriptionConfig:
     """
@@ -113,6 +115,23 @@ class TranscriptionConfig:
         ],
     }
     
+    # Keywords frozen once at class creation: lowercased and de-duplicated,
+    # as tuples in listed order and as frozensets (replacing the lists above)
+    # for O(1) membership tests
+    LANGUAGE_KEYWORDS_TUPLE = {
+        lang: tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        for lang, keywords in LANGUAGE_KEYWORDS.items()
+    }
+    LANGUAGE_KEYWORDS = {lang: frozenset(keywords) for lang, keywords in LANGUAGE_KEYWORDS_TUPLE.items()}
+    
+    # Aho-Corasick automaton over all LANGUAGE_KEYWORDS, built on first use by
+    # _get_language_automaton() (False once pyahocorasick is known to be missing)
+    _automaton = None
+    _automaton_lock = threading.Lock()
+    
+    # Bumped by set_language_keywords(); part of the language detection cache key
+    _keywords_generation = 0
+    
     # ============================================================================
     # FFMPEG CONFIGURATION
     # ============================================================================
@@ -196,15 +215,68 @@ class TranscriptionConfig:
     @classmethod
     def get_language_keywords(cls, language_code):
         """
-        Get keyword list for specific language.
+        Get keyword set for specific language.
         
         Args:
             language_code: ISO-639-1 language code (e.g., 'en', 'pt')
             
         Returns:
-            List of keywords or empty list
+            Frozenset of lowercase keywords, or an empty frozenset
+        """
+        return cls.LANGUAGE_KEYWORDS.get(language_code, frozenset())
+    
+    @classmethod
+    def set_language_keywords(cls, language_code, keywords):
+        """
+        Replace the keywords of one language (or add a language).
+        
+        Use this instead of editing LANGUAGE_KEYWORDS directly: it keeps
+        LANGUAGE_KEYWORDS_TUPLE in step, discards the cached automaton and
+        invalidates cached language detection results.
+        
+        Args:
+            language_code: ISO-639-1 language code (e.g., 'en', 'pt')
+            keywords: Iterable of keywords (any case)
+        """
+        ordered = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        with cls._automaton_lock:
+            # Copy-on-write, so concurrent readers always see a consistent table
+            cls.LANGUAGE_KEYWORDS_TUPLE = {**cls.LANGUAGE_KEYWORDS_TUPLE, language_code: ordered}
+            cls.LANGUAGE_KEYWORDS = {**cls.LANGUAGE_KEYWORDS, language_code: frozenset(ordered)}
+            cls._automaton = None
+            cls._keywords_generation += 1
+    
+    @classmethod
+    def _get_language_automaton(cls):
+        """
+        Get the shared Aho-Corasick automaton for keyword-based language detection.
+        
+        Built once from LANGUAGE_KEYWORDS_TUPLE on first call (thread-safe) and
+        cached on the class. Each keyword maps to (keyword, language codes),
+        since some keywords (e.g. 'no', 'por favor') belong to several languages.
+        One pass of automaton.iter(text) then finds every keyword in the text.
+        
+        Returns:
+            ahocorasick.Automaton, or None if pyahocorasick is not installed
         """
-        return cls.LANGUAGE_KEYWORDS.get(language_code, [])
+        if cls._automaton is None:
+            with cls._automaton_lock:
+                if cls._automaton is None:
+                    try:
+                        import ahocorasick
+                    except ImportError:
+                        cls._automaton = False
+                    else:
+                        languages_by_keyword = {}
+                        for lang_code, keywords in cls.LANGUAGE_KEYWORDS_TUPLE.items():
+                            for keyword in keywords:
+                                languages_by_keyword.setdefault(keyword, []).append(lang_code)
+                        automaton = ahocorasick.Automaton()
+                        for keyword, lang_codes in languages_by_keyword.items():
+                            automaton.add_word(keyword, (keyword, tuple(lang_codes)))
+                        automaton.make_automaton()
+                        cls._automaton = automaton
+        return cls._automaton or None
     
     @classmethod
     def get_supported_languages(cls):
@@ -2,10 +2,12 @@
 Audio Transcription Package Entry Point
 
 This package provides audio transcription functionality with language detection.
+
+The public names are resolved on first access (PEP 562), so importing the
+package, e.g. to run the CLI with --help, does not load the core modules.
 """
 
-from .core import transcribe_audio, validate_audio_file, detect_language_from_text, detect_language_with_probe
-from txt_audio_to_db.config.transcribe_audio_config import TranscriptionConfig
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -16,3 +18,25 @@ __all__ = [
     'TranscriptionConfig'
 ]
 
+# Public name -> module that defines it, imported by __getattr__ on first access
+_LAZY_ATTRS = {
+    'transcribe_audio': '.core',
+    'validate_audio_file': '.core',
+    'detect_language_from_text': '.core',
+    'detect_language_with_probe': '.core',
+    'TranscriptionConfig': 'txt_audio_to_db.config.transcribe_audio_config',
+}
+
+
+def __getattr__(name):
+    """Import a public name on first access and cache it on the package."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -41,7 +41,6 @@ else:
     SCRIPT_DIR = Path(__file__).resolve().parent
 
 from txt_audio_to_db.config.transcribe_audio_config import TranscriptionConfig
-from ..core import transcribe_audio
 import sys
 from pathlib import Path
 
@@ -107,6 +106,24 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def ensure_input_valid(args) -> None:
+    """
+    Check the input file before any environment setup.
+    
+    Runs before the .env file and the core modules are loaded, so usage
+    errors fail fast. Batch (--stdin) paths are validated per file later.
+    """
+    if args.stdin:
+        return
+    from ..core.transcription import validate_audio_file
+    try:
+        validate_audio_file(args.audio_path)
+    except FileNotFoundError as e:
+        die(str(e), TranscriptionConfig.EXIT_CODES['file_error'])
+    except ValueError as e:
+        die(str(e), TranscriptionConfig.EXIT_CODES['file_error'])
+
+
 def ensure_api_key():
     """Ensure OpenAI API key is set."""
     if not os.getenv("OPENAI_API_KEY"):
@@ -301,6 +318,7 @@ def perform_transcription(args, logger) -> Dict:
         return create_dry_run_result(args, logger)
     
     # Use the core transcription functionality
+    from ..core import transcribe_audio
     result = transcribe_audio(
         audio_path=args.audio_path,
         model=args.model,
@@ -374,6 +392,9 @@ def main():
     # Initialize logging
     logger = setup_logging_from_args(args)
     
+    # Validate the input before loading .env or the OpenAI SDK
+    ensure_input_valid(args)
+    
     # Try to load .env file if it exists
     logger.debug("Checking for .env file...")
     env_loaded = TranscriptionConfig.load_env_file()
@@ -5,11 +5,14 @@ This module provides language detection functionality for audio transcription,
 including text-based keyword detection and probe-based detection using ffmpeg.
 """
 
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Optional, Any
 
@@ -19,28 +22,74 @@ from ..transcribe_audio_logging import get_logger
 # Initialize logger for this module
 logger = get_logger('language_detection')
 
+# Detection results kept for repeated texts, keyed by (text digest, keyword generation)
+DETECTION_CACHE_SIZE = 1024
+_detection_cache: "OrderedDict[tuple[bytes, int], Optional[str]]" = OrderedDict()
+_detection_cache_lock = threading.Lock()
+
 
 def detect_language_from_text(text: str) -> Optional[str]:
     """
     Simple language detection based on common words and patterns.
     Uses keyword lists from TranscriptionConfig.LANGUAGE_KEYWORDS.
     
+    Each language scores one point per distinct keyword found in the text;
+    ties go to the language listed first. With pyahocorasick installed all
+    keywords are found in a single pass over the text; otherwise each
+    keyword is searched for separately.
+    
+    Results are memoized for the last DETECTION_CACHE_SIZE distinct texts.
+    The cache is keyed by a 16-byte BLAKE2b digest of the text, so long texts
+    are not kept in memory, plus the keyword generation, so results computed
+    before TranscriptionConfig.set_language_keywords() are not reused.
+    
     Args:
         text: Text to analyze for language detection
         
     Returns:
         ISO-639-1 code like 'en', 'pt', 'es', etc., or None if uncertain.
     """
+    key = (
+        hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(),
+        TranscriptionConfig._keywords_generation,
+    )
+    with _detection_cache_lock:
+        if key in _detection_cache:
+            _detection_cache.move_to_end(key)
+            logger.debug("Language detection result served from cache")
+            return _detection_cache[key]
+    
+    lang = _detect_language_uncached(text)
+    
+    with _detection_cache_lock:
+        _detection_cache[key] = lang
+        if len(_detection_cache) > DETECTION_CACHE_SIZE:
+            _detection_cache.popitem(last=False)
+    return lang
+
+
+def _detect_language_uncached(text: str) -> Optional[str]:
+    """Score the text against the keyword table (see detect_language_from_text)."""
     logger.debug(f"Analyzing text for language detection (length: {len(text)} chars)")
     logger.debug(f"Text sample: {text[:100]}...")
     
     text_lower = text.lower()
     
     # Score each language based on keyword matches
+    automaton = TranscriptionConfig._get_language_automaton()
+    if automaton is not None:
+        matched = {value for _, value in automaton.iter(text_lower)}
+        hits = Counter(lang_code for _, lang_codes in matched for lang_code in lang_codes)
+    else:
+        hits = None
+    
     scores = {}
     for lang_code in TranscriptionConfig.get_supported_languages():
-        keywords = TranscriptionConfig.get_language_keywords(lang_code)
-        score = sum(1 for word in keywords if word in text_lower)
+        if hits is not None:
+            score = hits[lang_code]
+        else:
+            keywords = TranscriptionConfig.get_language_keywords(lang_code)
+            score = sum(1 for word in keywords if word in text_lower)
         scores[lang_code] = score
         if score > 0:
             logger.debug(f"Language '{lang_code}' scored {score} keyword matches")
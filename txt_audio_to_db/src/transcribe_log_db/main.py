@@ -26,11 +26,15 @@ Version: 1.0.0
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from common.logging_utils.logging_config import get_logger
+from common.utils.phase_stats import PhaseStats
 from .utils.db_utils import get_db_manager, get_transcription_ingestion
 from .utils import (
     get_default_audio_root,
@@ -45,6 +49,14 @@ from .utils.text_finder import (
     pick_newest as pick_newest_text,
 )
 from .utils.text_ingestion import get_text_ingestion
+from .utils.checkpoint import ProcessCheckpoint, COMPLETED, TRANSCRIBED, FAILED
+
+# Audio files transcribed at once in batch mode (each mostly waits on the OpenAI API);
+# also sizes the pipeline orchestrator's transcription pool
+DEFAULT_TRANSCRIBE_WORKERS = min(8, 3 * (os.cpu_count() or 1))
+
+# Finished transcriptions written to the database per transaction in batch mode
+INGEST_BATCH_SIZE = 50
 
 # Optional import of transcriber; we only use when --audio is provided
 try:
@@ -90,13 +102,131 @@ def ingest_from_file(ingestion_handler, file_path: Path,
     return result
 
 
-def _process_text_documents(args, logger) -> dict:
+def transcribe_audio_file(audio_path: Path) -> dict:
+    """
+    Transcribe one audio file and save the transcript JSON next to it.
+    
+    The transcript JSON is written as transcript.json in the audio file's
+    directory (or transcript-<timestamp>.json if that already exists); a
+    failure to write it is logged but does not fail the transcription.
+    
+    Args:
+        audio_path (Path): Path to the audio file
+        
+    Returns:
+        dict: Transcription result, ready for ingestion
+        
+    Raises:
+        ImportError: If the transcribe_audio package is not available
+    """
+    return _transcribe_and_save(audio_path)[0]
+
+
+def _transcribe_and_save(audio_path: Path) -> Tuple[dict, Optional[Path]]:
+    """
+    Core of transcribe_audio_file, also returning where the transcript was saved.
+    
+    Args:
+        audio_path (Path): Path to the audio file
+        
+    Returns:
+        Tuple[dict, Optional[Path]]: Transcription result and transcript JSON
+                                     path (None if it could not be written)
+    """
+    if transcribe_audio is None:
+        raise ImportError("transcribe_audio package is not available. Install or ensure it's on PYTHONPATH.")
+    
+    logger = get_logger("main")
+    logger.info(f"Transcribing: {audio_path}")
+    tr_result = transcribe_audio(str(audio_path))
+    
+    # Save transcript JSON next to audio
+    try:
+        out_dir = Path(audio_path).parent
+        out_file = out_dir / "transcript.json"
+        if out_file.exists():
+            ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+            out_file = out_dir / f"transcript-{ts}.json"
+        with open(out_file, 'w', encoding='utf-8') as f:
+            json.dump(tr_result, f, ensure_ascii=False, indent=2)
+        logger.info(f"Saved transcript: {out_file}")
+    except Exception as e:
+        logger.warning(f"Failed to save transcript JSON: {e}")
+        out_file = None
+    
+    return tr_result, out_file
+
+
+def _resume_or_transcribe(audio_path: Path, transcript: Optional[str]) -> Tuple[dict, Optional[Path]]:
+    """
+    Load a transcript saved by an earlier run, or transcribe the file.
+    
+    Args:
+        audio_path (Path): Path to the audio file
+        transcript (Optional[str]): Transcript JSON recorded in the checkpoint
+        
+    Returns:
+        Tuple[dict, Optional[Path]]: Transcription result and transcript JSON path
+    """
+    if transcript:
+        try:
+            with open(transcript, 'r', encoding='utf-8') as f:
+                tr_result = json.load(f)
+            get_logger("main").info(f"Resuming from saved transcript: {transcript}")
+            return tr_result, Path(transcript)
+        except (OSError, ValueError) as e:
+            get_logger("main").warning(f"Cannot reuse transcript {transcript}, transcribing again: {e}")
+    return _transcribe_and_save(audio_path)
+
+
+def process_audio_file(ingestion_handler, audio_path: Path,
+                       title: Optional[str] = None,
+                       mood: Optional[str] = None,
+                       tags: Optional[list] = None) -> dict:
+    """
+    Transcribe one audio file, save the transcript next to it and ingest it.
+    
+    Args:
+        ingestion_handler: Transcription ingestion handler
+        audio_path (Path): Path to the audio file
+        title (Optional[str]): Diary entry title
+        mood (Optional[str]): Diary entry mood
+        tags (Optional[list]): Diary entry tags
+        
+    Returns:
+        dict: Result of the ingestion process
+        
+    Raises:
+        ImportError: If the transcribe_audio package is not available
+    """
+    tr_result = transcribe_audio_file(audio_path)
+    
+    return ingestion_handler.ingest_transcription(
+        tr_result,
+        title=title,
+        mood=mood,
+        tags=tags
+    )
+
+
+def _process_text_documents(logger,
+                            text_dir: Optional[Path] = None,
+                            batch: bool = False,
+                            reprocess: bool = False,
+                            mood: Optional[str] = None,
+                            tags: Optional[list] = None,
+                            stats: Optional[PhaseStats] = None) -> dict:
     """
     Process text documents (txt, docx, pdf) and return the last result.
     
     Args:
-        args: Command line arguments
         logger: Logger instance
+        text_dir (Optional[Path]): Override default text root
+        batch (bool): Process all unprocessed documents instead of just the newest
+        reprocess (bool): Ignore the DB check and reprocess documents
+        mood (Optional[str]): Diary entry mood
+        tags (Optional[list]): Diary entry tags
+        stats (Optional[PhaseStats]): If given, every attempted document is recorded in it
         
     Returns:
         dict: Result of the last processed text document
@@ -104,20 +234,20 @@ def _process_text_documents(args, logger) -> dict:
     text_ingestion_handler = get_text_ingestion()
     
     # Discover text files
-    text_root = args.audio_dir or get_default_text_root()
+    text_root = text_dir or get_default_text_root()
     logger.info(f"Discovering text documents under: {text_root}")
     text_candidates = find_text_candidates(text_root, one_level=True)
     logger.debug(f"Found {len(text_candidates)} candidate text files")
     
     if text_candidates:
         to_process_text = text_candidates
-        if not args.reprocess:
+        if not reprocess:
             with get_db_manager().get_connection() as conn:
                 to_process_text = filter_unprocessed_text(conn, text_candidates)
             logger.info(f"Unprocessed text files: {len(to_process_text)}")
         
         if to_process_text:
-            if not args.batch:
+            if not batch:
                 newest_text = pick_newest_text(to_process_text)
                 to_process_text = [newest_text] if newest_text else []
                 logger.info(f"Selected newest text document: {newest_text}")
@@ -129,13 +259,17 @@ def _process_text_documents(args, logger) -> dict:
                     logger.info(f"Processing text document: {text_path}")
                     text_result = text_ingestion_handler.ingest_text_document(
                         text_path,
-                        mood=args.mood,
-                        tags=args.tags
+                        mood=mood,
+                        tags=tags
                     )
                     text_results.append(text_result)
                     logger.info(f"Text document processed successfully: {text_result}")
+                    if stats is not None:
+                        stats.record(str(text_path), ok=True)
                 except Exception as e:
                     logger.error(f"Failed to process text document {text_path}: {e}")
+                    if stats is not None:
+                        stats.record(str(text_path), ok=False)
                     # Continue processing other files
                     continue
             
@@ -154,6 +288,153 @@ def _process_text_documents(args, logger) -> dict:
         return {"diary_id": None, "source_file_id": None, "run_id": None, "usage_id": None}
 
 
+def process_files(audio_dir: Optional[Path] = None,
+                  batch: bool = True,
+                  reprocess: bool = False,
+                  title: Optional[str] = None,
+                  mood: Optional[str] = None,
+                  tags: Optional[list] = None,
+                  max_workers: int = DEFAULT_TRANSCRIBE_WORKERS,
+                  executor: Optional[Executor] = None,
+                  ingest_batch_size: int = INGEST_BATCH_SIZE,
+                  checkpoint_path: Optional[Path] = None,
+                  force: bool = False) -> PhaseStats:
+    """
+    Transcribe and ingest unprocessed audio, then ingest text documents.
+    
+    This is the programmatic form of running main() without --input,
+    --audio or --text-only: it takes the options as arguments instead of
+    parsing sys.argv and reports per-file outcomes instead of exiting, so
+    other modules (such as the pipeline orchestrator) can call it directly.
+    
+    Audio files are independent, so up to max_workers of them are
+    transcribed at once, or they are submitted to executor when one is
+    given (a long-lived pool the caller owns, such as the orchestrator's). Finished transcriptions are ingested in batches
+    of up to ingest_batch_size, each over one connection and one commit,
+    while the remaining files are still being transcribed. A failed file
+    does not stop the others; its path is listed in the returned stats.
+    
+    With checkpoint_path, per-file progress is recorded there (see
+    ProcessCheckpoint): files already COMPLETED are skipped and files
+    with a saved transcript (TRANSCRIBED, or FAILED at ingestion) are
+    ingested from it, so a crashed or failed run resumes without paying
+    for transcription again.
+    
+    Args:
+        audio_dir (Optional[Path]): Override default audio/text root
+        batch (bool): Process all unprocessed files instead of just the newest. Default: True
+        reprocess (bool): Ignore the DB check and reprocess files. Default: False
+        title (Optional[str]): Diary entry title
+        mood (Optional[str]): Diary entry mood
+        tags (Optional[list]): Diary entry tags
+        max_workers (int): Audio files processed concurrently. Default: DEFAULT_TRANSCRIBE_WORKERS
+        executor (Optional[Executor]): Pool to transcribe on instead of a pool of
+                                       max_workers threads made for this call
+        ingest_batch_size (int): Transcriptions ingested per transaction. Default: INGEST_BATCH_SIZE
+        checkpoint_path (Optional[Path]): SQLite checkpoint file; None disables checkpointing
+        force (bool): Ignore states recorded in the checkpoint. Default: False
+        
+    Returns:
+        PhaseStats: Audio files and text documents ingested and attempted,
+                    with the paths of the files that failed
+        
+    Raises:
+        ImportError: If the transcribe_audio package is not available
+    """
+    logger = get_logger("main")
+    
+    if transcribe_audio is None:
+        raise ImportError("transcribe_audio package is not available. Install or ensure it's on PYTHONPATH.")
+    
+    ingestion_handler = get_transcription_ingestion()
+    
+    root = audio_dir or get_default_audio_root()
+    logger.info(f"Discovering audio under: {root}")
+    candidates = find_audio_candidates(root, one_level=True)
+    logger.debug(f"Found {len(candidates)} candidate audio files")
+    to_process = candidates
+    if not reprocess:
+        with get_db_manager().get_connection() as conn:
+            to_process = filter_unprocessed(conn, candidates)
+        logger.info(f"Unprocessed audio files: {len(to_process)}")
+    
+    stats = PhaseStats()
+    if not to_process:
+        logger.info("No unprocessed audio files found, continuing to text processing...")
+    else:
+        if not batch:
+            newest = pick_newest(to_process)
+            to_process = [newest] if newest else []
+            logger.info(f"Selected newest audio: {newest}")
+        
+        checkpoint = ProcessCheckpoint(checkpoint_path) if checkpoint_path else None
+        states = checkpoint.load() if checkpoint and not force else {}
+        if states:
+            remaining = [p for p in to_process if states.get(str(p), (None, None))[0] != COMPLETED]
+            if len(remaining) < len(to_process):
+                logger.info(f"Skipping {len(to_process) - len(remaining)} audio files completed in an earlier run")
+            to_process = remaining
+        
+        # Transcribe one or many, several at a time, ingesting in batches
+        pending: list = []
+        pending_paths: list = []  # (audio_path, out_file) per pending transcription
+        
+        def _ingest_pending() -> None:
+            ingested = ingestion_handler.ingest_transcriptions(pending, title=title, mood=mood, tags=tags)
+            for (audio_path, out_file), result in zip(pending_paths, ingested):
+                stats.record(str(audio_path), ok=result is not None)
+                if checkpoint:
+                    # Keep the transcript path so a retry does not transcribe again
+                    checkpoint.record(audio_path, COMPLETED if result is not None else FAILED,
+                                      transcript=out_file)
+            pending.clear()
+            pending_paths.clear()
+        
+        own_pool = None
+        if executor is None:
+            workers = max(1, min(max_workers, len(to_process)))
+            executor = own_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcribe")
+        futures = {}
+        try:
+            for audio_path in to_process:
+                _, transcript = states.get(str(audio_path), (None, None))
+                futures[executor.submit(_resume_or_transcribe, audio_path, transcript)] = audio_path
+            for future in as_completed(futures):
+                audio_path = futures[future]
+                try:
+                    tr_result, out_file = future.result()
+                except Exception as e:
+                    stats.record(str(audio_path), ok=False)
+                    if checkpoint:
+                        checkpoint.record(audio_path, FAILED)
+                    logger.error(f"Failed to process audio file {audio_path}: {e}")
+                    continue
+                if checkpoint:
+                    checkpoint.record(audio_path, TRANSCRIBED, transcript=out_file)
+                pending.append(tr_result)
+                pending_paths.append((audio_path, out_file))
+                if len(pending) >= ingest_batch_size:
+                    _ingest_pending()
+            _ingest_pending()
+        finally:
+            # Files not started yet are not transcribed if this run was aborted
+            for future in futures:
+                future.cancel()
+            if own_pool:
+                own_pool.shutdown()
+            if checkpoint:
+                checkpoint.close()
+        logger.info(f"Processed {stats.success}/{stats.total} audio files")
+    
+    # Process text documents after audio processing
+    logger.info("Starting text document processing...")
+    _process_text_documents(
+        logger, text_dir=audio_dir, batch=batch, reprocess=reprocess, mood=mood, tags=tags, stats=stats
+    )
+    
+    return stats
+
+
 def main():
     """Main application entry point."""
     parser = argparse.ArgumentParser(
@@ -242,14 +523,22 @@ Examples:
         ingestion_handler = get_transcription_ingestion()
         logger.info("Transcription ingestion handler initialized")
         
-        # Initialize result variable
+        # Initialize result variables
         result = None
+        stats = None
         
         # Process based on mode
         if args.text_only:
             # Text-only mode: skip audio processing
             logger.info("Text-only mode: skipping audio processing")
-            result = _process_text_documents(args, logger)
+            result = _process_text_documents(
+                logger,
+                text_dir=args.audio_dir,
+                batch=args.batch,
+                reprocess=args.reprocess,
+                mood=args.mood,
+                tags=args.tags
+            )
         elif args.audio:
             if transcribe_audio is None:
                 raise ImportError("transcribe_audio package is not available. Install or ensure it's on PYTHONPATH.")
@@ -263,55 +552,6 @@ Examples:
                 mood=args.mood,
                 tags=args.tags
             )
-        elif not args.input:
-            # No explicit JSON input and no explicit --audio; discover from default dir
-            if transcribe_audio is None:
-                raise ImportError("transcribe_audio package is not available. Install or ensure it's on PYTHONPATH.")
-            root = args.audio_dir or get_default_audio_root()
-            logger.info(f"Discovering audio under: {root}")
-            candidates = find_audio_candidates(root, one_level=True)
-            logger.debug(f"Found {len(candidates)} candidate audio files")
-            to_process = candidates
-            if not args.reprocess:
-                with get_db_manager().get_connection() as conn:
-                    to_process = filter_unprocessed(conn, candidates)
-                logger.info(f"Unprocessed audio files: {len(to_process)}")
-            if not to_process:
-                logger.info("No unprocessed audio files found, continuing to text processing...")
-                result = None
-            else:
-                if not args.batch:
-                    newest = pick_newest(to_process)
-                    to_process = [newest] if newest else []
-                    logger.info(f"Selected newest audio: {newest}")
-
-                # Process one or many
-                last_result = None
-                for audio_path in to_process:
-                    logger.info(f"Transcribing: {audio_path}")
-                    tr_result = transcribe_audio(str(audio_path))
-                    # Save transcript JSON next to audio
-                    try:
-                        out_dir = Path(audio_path).parent
-                        out_file = out_dir / "transcript.json"
-                        if out_file.exists():
-                            from datetime import datetime
-                            ts = datetime.now().strftime("%Y%m%d-%H%M%S")
-                            out_file = out_dir / f"transcript-{ts}.json"
-                        with open(out_file, 'w', encoding='utf-8') as f:
-                            import json as _json
-                            _json.dump(tr_result, f, ensure_ascii=False, indent=2)
-                        logger.info(f"Saved transcript: {out_file}")
-                    except Exception as e:
-                        logger.warning(f"Failed to save transcript JSON: {e}")
-
-                    last_result = ingestion_handler.ingest_transcription(
-                        tr_result,
-                        title=args.title,
-                        mood=args.mood,
-                        tags=args.tags
-                    )
-                result = last_result
         elif args.input:
             # Ingest from specified file
             result = ingest_from_file(
@@ -322,20 +562,25 @@ Examples:
                 tags=args.tags
             )
         else:
-            # No input specified and no files found
-            logger.info("No input specified and no files found to process")
-            result = None
-        
-        # Process text documents (in normal mode, after audio processing)
-        if not args.text_only and not args.audio and not args.input:
-            # Normal mode: process text after audio
-            logger.info("Starting text document processing...")
-            _process_text_documents(args, logger)
+            # No explicit JSON input and no explicit --audio; discover from
+            # default dir, then process text documents
+            stats = process_files(
+                audio_dir=args.audio_dir,
+                batch=args.batch,
+                reprocess=args.reprocess,
+                title=args.title,
+                mood=args.mood,
+                tags=args.tags
+            )
+            if not stats.ok:
+                raise RuntimeError(f"{len(stats.failed)} of {stats.total} files failed to process")
         
         # Display results
         logger.info("Processing completed successfully!")
         print("\n=== Processing Results ===")
-        if result:
+        if stats is not None and stats.total:
+            print(f"Files processed: {stats.success}/{stats.total}")
+        elif result:
             print(f"Diary ID: {result['diary_id']}")
             print(f"Source File ID: {result['source_file_id']}")
             print(f"Transcription Run ID: {result['run_id']}")
@@ -0,0 +1,122 @@
+"""
+Processing checkpoint utilities.
+
+Persist the per-file progress of the process phase in a small SQLite file,
+so a run that crashes halfway through a batch resumes instead of starting
+over. Each audio file moves through these states:
+
+- TRANSCRIBED: transcription finished and its JSON was saved (path kept)
+- COMPLETED: transcription ingested into the database
+- FAILED: transcription or ingestion failed (transcript path kept, if any)
+
+On restart, COMPLETED files are skipped and files with a saved transcript
+(TRANSCRIBED, or FAILED at ingestion) are ingested from it instead of being
+sent to the API again.
+
+TRANSCRIBED states are committed immediately (WAL journal, synchronous=NORMAL),
+so a hard crash (SIGKILL, OOM, power loss) never loses a paid-for
+transcription. COMPLETED and FAILED states are committed in batches to keep
+per-file overhead low; a crash loses at most the last uncommitted batch of
+those, and the affected files are re-ingested from their saved transcripts.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from common.logging_utils.logging_config import get_logger
+
+
+# COMPLETED / FAILED state changes written per commit (TRANSCRIBED commits at once)
+CHECKPOINT_COMMIT_EVERY = 50
+
+COMPLETED = "COMPLETED"
+TRANSCRIBED = "TRANSCRIBED"
+FAILED = "FAILED"
+
+
+class ProcessCheckpoint:
+    """
+    SQLite-backed per-file status log for one pipeline phase.
+
+    Not thread-safe: use it from the thread that created it.
+
+    Example:
+        >>> checkpoint = ProcessCheckpoint(download_dir / ".pipeline_checkpoint.sqlite")
+        >>> states = checkpoint.load()
+        >>> checkpoint.record(audio_path, TRANSCRIBED, transcript=out_file)
+        >>> checkpoint.close()
+    """
+
+    def __init__(self, db_path: Path, phase: str = "process",
+                 commit_every: int = CHECKPOINT_COMMIT_EVERY):
+        """
+        Open (or create) the checkpoint database.
+
+        Args:
+            db_path (Path): SQLite file to use
+            phase (str): Phase name stored with every row. Default: "process"
+            commit_every (int): State changes per commit. Default: CHECKPOINT_COMMIT_EVERY
+        """
+        self.logger = get_logger("main")
+        self.phase = phase
+        self.commit_every = max(1, commit_every)
+        self._pending = 0
+
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS status("
+            "path TEXT PRIMARY KEY, phase TEXT, state TEXT, ts REAL, transcript TEXT)"
+        )
+        self._conn.commit()
+
+    def load(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Read the recorded state of every file of this phase in one query.
+
+        Returns:
+            Dict[str, Tuple[str, Optional[str]]]: path -> (state, transcript path)
+        """
+        rows = self._conn.execute(
+            "SELECT path, state, transcript FROM status WHERE phase = ?", (self.phase,)
+        )
+        return {path: (state, transcript) for path, state, transcript in rows}
+
+    def record(self, path: Path | str, state: str, transcript: Optional[Path | str] = None) -> None:
+        """
+        Record the state of a file.
+        
+        TRANSCRIBED is committed at once; other states once a batch is full.
+
+        Args:
+            path (Path | str): Audio file path
+            state (str): COMPLETED, TRANSCRIBED or FAILED
+            transcript (Optional[Path | str]): Saved transcript JSON, if any
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO status(path, phase, state, ts, transcript) VALUES (?, ?, ?, ?, ?)",
+            (str(path), self.phase, state, time.time(), str(transcript) if transcript else None)
+        )
+        self._pending += 1
+        if state == TRANSCRIBED or self._pending >= self.commit_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit recorded state changes."""
+        if self._pending:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit outstanding state changes and close the database."""
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save processing checkpoint: {e}")
+        finally:
+            self._conn.close()
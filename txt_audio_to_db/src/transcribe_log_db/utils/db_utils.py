@@ -408,33 +408,109 @@ class TranscriptionIngestion:
         
         # Ingest within a transaction
         with self.db_manager.transaction() as conn:
-            # Upsert source file
-            source_file_id = None
-            if parsed_data['source_file']:
-                source_file_id = self.upsert_source_file(conn, parsed_data['source_file'])
+            result = self._insert_parsed(conn, parsed_data, title, mood, tags)
             
-            # If no title provided, extract from source file
-            if not title and parsed_data.get('source_file'):
-                title = Path(parsed_data['source_file']).stem[:255]
-            
-            # Insert diary entry
-            diary_id = self.insert_diary_entry(conn, parsed_data['text'], title, mood, tags)
-            
-            # Insert transcription run
-            run_id = self.insert_transcription_run(conn, diary_id, source_file_id, parsed_data)
+            self.logger.info(f"Transcription ingestion completed successfully: {result}")
+            return result
+    
+    def ingest_transcriptions(self, responses: List[Union[str, Dict]],
+                              title: Optional[str] = None,
+                              mood: Optional[str] = None,
+                              tags: Optional[List[str]] = None) -> List[Optional[Dict[str, int]]]:
+        """
+        Ingest several transcription responses over one connection and one commit.
+        
+        Compared with calling ingest_transcription() per response, this opens
+        a single connection and commits once for the whole batch. Each
+        response is inserted under its own savepoint, so an invalid or
+        failing response is rolled back and logged without affecting the
+        rest of the batch.
+        
+        Args:
+            responses (List[Union[str, Dict]]): Transcription response data
+            title (Optional[str]): Diary entry title for every response. If not
+                                   provided, each is extracted from its source_file filename
+            mood (Optional[str]): Diary entry mood
+            tags (Optional[List[str]]): Diary entry tags
             
-            # Insert usage information
-            usage_id = self.insert_transcription_usage(conn, run_id, parsed_data)
+        Returns:
+            List[Optional[Dict[str, int]]]: IDs of created records per response,
+                                            in input order; None where ingestion failed
             
-            result = {
-                'diary_id': diary_id,
-                'source_file_id': source_file_id,
-                'run_id': run_id,
-                'usage_id': usage_id
-            }
+        Raises:
+            psycopg2.Error: If the connection or the final commit fails
+        """
+        results: List[Optional[Dict[str, int]]] = [None] * len(responses)
+        if not responses:
+            return results
+        
+        self.logger.info(f"Starting batch ingestion of {len(responses)} transcriptions")
+        
+        with self.db_manager.transaction() as conn:
+            for index, response_data in enumerate(responses):
+                try:
+                    parsed_data = self.parse_transcription_response(response_data)
+                except (ValueError, json.JSONDecodeError) as e:
+                    self.logger.error(f"Skipping invalid transcription response {index + 1}/{len(responses)}: {e}")
+                    continue
+                
+                with conn.cursor() as cursor:
+                    cursor.execute("SAVEPOINT ingest_item")
+                try:
+                    results[index] = self._insert_parsed(conn, parsed_data, title, mood, tags)
+                except psycopg2.Error as e:
+                    with conn.cursor() as cursor:
+                        cursor.execute("ROLLBACK TO SAVEPOINT ingest_item")
+                    self.logger.error(f"Failed to ingest transcription of {parsed_data['source_file']}: {e}")
+                    continue
+                with conn.cursor() as cursor:
+                    cursor.execute("RELEASE SAVEPOINT ingest_item")
+        
+        ingested = sum(1 for result in results if result is not None)
+        self.logger.info(f"Batch ingestion completed: {ingested}/{len(responses)} transcriptions")
+        return results
+    
+    def _insert_parsed(self, conn, parsed_data: Dict[str, Any],
+                       title: Optional[str] = None,
+                       mood: Optional[str] = None,
+                       tags: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Insert the records for one parsed transcription on an open connection.
+        
+        Args:
+            conn: Database connection (inside a transaction)
+            parsed_data (Dict[str, Any]): Output of parse_transcription_response()
+            title (Optional[str]): Diary entry title. If not provided, will extract from source_file filename
+            mood (Optional[str]): Diary entry mood
+            tags (Optional[List[str]]): Diary entry tags
             
-            self.logger.info(f"Transcription ingestion completed successfully: {result}")
-            return result
+        Returns:
+            Dict[str, int]: Dictionary with IDs of created records
+        """
+        # Upsert source file
+        source_file_id = None
+        if parsed_data['source_file']:
+            source_file_id = self.upsert_source_file(conn, parsed_data['source_file'])
+        
+        # If no title provided, extract from source file
+        if not title and parsed_data.get('source_file'):
+            title = Path(parsed_data['source_file']).stem[:255]
+        
+        # Insert diary entry
+        diary_id = self.insert_diary_entry(conn, parsed_data['text'], title, mood, tags)
+        
+        # Insert transcription run
+        run_id = self.insert_transcription_run(conn, diary_id, source_file_id, parsed_data)
+        
+        # Insert usage information
+        usage_id = self.insert_transcription_usage(conn, run_id, parsed_data)
+        
+        return {
+            'diary_id': diary_id,
+            'source_file_id': source_file_id,
+            'run_id': run_id,
+            'usage_id': usage_id
+        }
 
 
 # Convenience functions for common operations
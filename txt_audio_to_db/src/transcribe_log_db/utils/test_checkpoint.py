@@ -0,0 +1,83 @@
+"""
+Unit tests for the processing checkpoint.
+
+These tests verify that recorded states and transcript paths are read
+back, that TRANSCRIBED is committed at once while other states wait for
+a full batch, and that a file with a saved transcript is resumed from it
+instead of being transcribed again.
+"""
+
+import json
+import sqlite3
+
+from .checkpoint import ProcessCheckpoint, COMPLETED, TRANSCRIBED, FAILED
+from .. import main
+
+
+def _committed(db_path):
+    # A second connection only sees committed rows
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return {path: state for path, state in conn.execute("SELECT path, state FROM status")}
+    finally:
+        conn.close()
+
+
+def test_checkpoint_load_returns_recorded_states(tmp_path):
+    db_path = tmp_path / "checkpoint.sqlite"
+    checkpoint = ProcessCheckpoint(db_path)
+    checkpoint.record(tmp_path / "a.m4a", COMPLETED)
+    checkpoint.record(tmp_path / "b.m4a", FAILED, transcript=tmp_path / "b" / "transcript.json")
+    checkpoint.record(tmp_path / "c.m4a", FAILED)
+    checkpoint.close()
+
+    states = ProcessCheckpoint(db_path).load()
+    assert states == {
+        str(tmp_path / "a.m4a"): (COMPLETED, None),
+        str(tmp_path / "b.m4a"): (FAILED, str(tmp_path / "b" / "transcript.json")),
+        str(tmp_path / "c.m4a"): (FAILED, None),
+    }
+    assert ProcessCheckpoint(db_path, phase="other").load() == {}
+
+
+def test_checkpoint_commits_transcribed_immediately(tmp_path):
+    db_path = tmp_path / "checkpoint.sqlite"
+    checkpoint = ProcessCheckpoint(db_path, commit_every=10)
+
+    checkpoint.record("done.m4a", COMPLETED)
+    assert _committed(db_path) == {}
+
+    # TRANSCRIBED flushes the batch, including earlier pending states
+    checkpoint.record("paid.m4a", TRANSCRIBED, transcript="paid/transcript.json")
+    assert _committed(db_path) == {"done.m4a": COMPLETED, "paid.m4a": TRANSCRIBED}
+
+    checkpoint.record("paid.m4a", COMPLETED)
+    assert _committed(db_path)["paid.m4a"] == TRANSCRIBED
+    checkpoint.close()
+    assert _committed(db_path)["paid.m4a"] == COMPLETED
+
+
+def test_resume_uses_saved_transcript(tmp_path, monkeypatch):
+    transcript = tmp_path / "transcript.json"
+    transcript.write_text(json.dumps({"text": "hello"}), encoding="utf-8")
+
+    def _no_transcription(audio_path):
+        raise AssertionError(f"transcribed {audio_path} again")
+
+    monkeypatch.setattr(main, "_transcribe_and_save", _no_transcription)
+    tr_result, out_file = main._resume_or_transcribe(tmp_path / "a.m4a", str(transcript))
+    assert tr_result == {"text": "hello"}
+    assert out_file == transcript
+
+
+def test_resume_transcribes_when_saved_transcript_is_missing(tmp_path, monkeypatch):
+    calls = []
+
+    def _transcribe(audio_path):
+        calls.append(audio_path)
+        return {"text": "new"}, None
+
+    monkeypatch.setattr(main, "_transcribe_and_save", _transcribe)
+    tr_result, _ = main._resume_or_transcribe(tmp_path / "a.m4a", str(tmp_path / "gone.json"))
+    assert tr_result == {"text": "new"}
+    assert calls == [tmp_path / "a.m4a"]
@@ -0,0 +1,35 @@
+"""
+Unit tests for sanitize_filename length limiting.
+
+These tests verify that over-long names are cut to 255 characters, keeping
+a short extension, and that a long text after the last dot is not treated
+as an extension (which used to produce names longer than the input).
+"""
+
+from . import sanitize_filename
+
+
+def test_sanitize_filename_short_name_unchanged():
+    assert sanitize_filename("My:File<Name>.mp3") == "My_File_Name_.mp3"
+    assert sanitize_filename("   .hidden_file   ") == "hidden_file"
+    assert sanitize_filename("") == "unnamed_file"
+
+
+def test_sanitize_filename_truncation_keeps_extension():
+    name = "a" * 300 + ".m4a"
+    sanitized = sanitize_filename(name)
+    assert len(sanitized) == 255
+    assert sanitized == "a" * 251 + ".m4a"
+
+
+def test_sanitize_filename_long_suffix_is_not_an_extension():
+    # Regression: the text after the dot is longer than 255 characters
+    name = "Notes. " + "word " * 80
+    sanitized = sanitize_filename(name)
+    assert len(sanitized) == 255
+    assert sanitized == name.strip(" .")[:255]
+
+
+def test_sanitize_filename_never_exceeds_limit():
+    for name in ("x" * 1000, "a.b" * 200, "." + "y" * 400 + ".txt", "z" * 100 + "." + "q" * 200):
+        assert len(sanitize_filename(name)) <= 255